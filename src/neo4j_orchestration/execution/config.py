@@ -4,6 +4,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+# Accepted URI schemes (a tuple so validation is a single startswith call)
+_VALID_URI_PREFIXES = ("bolt://", "neo4j://", "bolt+s://", "neo4j+s://")
+
+
 @dataclass
 class Neo4jConfig:
     """Configuration for Neo4j database connection."""
@@ -26,8 +30,7 @@ class Neo4jConfig:
         if not self.password:
             raise ValueError("Password is required")
         
-        valid_prefixes = ["bolt://", "neo4j://", "bolt+s://", "neo4j+s://"]
-        if not any(self.uri.startswith(prefix) for prefix in valid_prefixes):
+        if not self.uri.startswith(_VALID_URI_PREFIXES):
             raise ValueError(
                 f"Invalid URI format: {self.uri}. "
                 "Must start with bolt://, neo4j://, bolt+s://, or neo4j+s://"
@@ -1,9 +1,11 @@
 """Query executor for Neo4j database operations."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import warnings
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
 
-from neo4j import GraphDatabase, Driver
+from neo4j import AsyncDriver, AsyncGraphDatabase, GraphDatabase, Driver
 from neo4j.exceptions import ServiceUnavailable, SessionExpired
 
 from .config import Neo4jConfig
@@ -35,6 +37,7 @@ class QueryExecutor:
         """Initialize query executor."""
         self.config = config
         self._driver: Optional[Driver] = None
+        self._async_driver: Optional[AsyncDriver] = None
         self._connect()
     
     def _connect(self) -> None:
@@ -83,33 +86,79 @@ class QueryExecutor:
         try:
             with self._driver.session(database=database) as session:
                 result = session.run(query, parameters)
+                records = [self._convert_record(record) for record in result]
+                return self._build_result(query, parameters, records, result.consume())
                 
-                records = []
-                for record in result:
-                    record_dict = {}
-                    for key in record.keys():
-                        value = record[key]
-                        record_dict[key] = self._convert_value(value)
-                    records.append(record_dict)
-                
-                summary = result.consume()
-                metadata = ExecutionMetadata.from_summary(query, parameters, summary)
-                summary_text = self._create_summary(records, metadata)
-                
-                logger.info(f"Query executed: {len(records)} records returned")
-                
-                return QueryResult(
-                    records=records,
-                    metadata=metadata,
-                    summary=summary_text,
+        except Exception as e:
+            raise self._execution_error(e) from e
+    
+    async def aexecute(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> QueryResult:
+        """Execute a Cypher query (read operation) on the async driver.
+        
+        The async driver is created on first use with the same settings as
+        the sync one; release it with aclose().
+        """
+        parameters = parameters or {}
+        database = database or self.config.database
+        
+        try:
+            async with self._get_async_driver().session(database=database) as session:
+                result = await session.run(query, parameters)
+                records = [self._convert_record(record) async for record in result]
+                return self._build_result(
+                    query, parameters, records, await result.consume()
                 )
                 
-        except (ServiceUnavailable, SessionExpired) as e:
-            logger.error(f"Connection error during query execution: {e}")
-            raise ConnectionError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            raise QueryError(f"Query execution failed: {e}") from e
+            raise self._execution_error(e) from e
+    
+    def _convert_record(self, record: Any) -> Dict[str, Any]:
+        """Convert a Neo4j record to a plain dict of native values."""
+        return {key: self._convert_value(record[key]) for key in record.keys()}
+    
+    def _build_result(
+        self,
+        query: str,
+        parameters: Dict[str, Any],
+        records: List[Dict[str, Any]],
+        summary: Any,
+    ) -> QueryResult:
+        """Wrap converted records and the result summary in a QueryResult."""
+        metadata = ExecutionMetadata.from_summary(query, parameters, summary)
+        summary_text = self._create_summary(records, metadata)
+        
+        logger.info(f"Query executed: {len(records)} records returned")
+        
+        return QueryResult(
+            records=records,
+            metadata=metadata,
+            summary=summary_text,
+        )
+    
+    def _execution_error(self, error: Exception) -> ExecutionError:
+        """Log a failed read query and map it to an ExecutionError."""
+        if isinstance(error, (ServiceUnavailable, SessionExpired)):
+            logger.error(f"Connection error during query execution: {error}")
+            return ConnectionError(f"Connection error: {error}")
+        logger.error(f"Query execution failed: {error}")
+        return QueryError(f"Query execution failed: {error}")
+    
+    def _get_async_driver(self) -> AsyncDriver:
+        """Return the async driver, creating it on first use."""
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                self.config.uri,
+                auth=(self.config.username, self.config.password),
+                max_connection_lifetime=self.config.max_connection_lifetime,
+                max_connection_pool_size=self.config.max_connection_pool_size,
+                connection_timeout=self.config.connection_timeout,
+            )
+        return self._async_driver
     
     def execute_write(
         self,
@@ -210,12 +259,31 @@ class QueryExecutor:
             return f"Found {count} results"
     
     def close(self) -> None:
-        """Close database connection and cleanup resources."""
+        """Close database connection and cleanup resources.
+        
+        Only the sync driver can be closed here. If ``aexecute`` has opened
+        the async driver, use ``await aclose()`` (or ``async with``)
+        instead; closing it needs the event loop that created it.
+        """
+        if self._async_driver:
+            warnings.warn(
+                "QueryExecutor.close() cannot release the async driver; "
+                "use 'await executor.aclose()' after aexecute()",
+                ResourceWarning,
+                stacklevel=2
+            )
         if self._driver:
             self._driver.close()
             self._driver = None
             logger.info("Database connection closed")
     
+    async def aclose(self) -> None:
+        """Close the async driver (if created) and the sync connection."""
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+        self.close()
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -223,3 +291,16 @@ class QueryExecutor:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+    
+    async def __aenter__(self) -> "QueryExecutor":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Async context manager exit; releases both drivers."""
+        await self.aclose()
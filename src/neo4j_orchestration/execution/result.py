@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from neo4j_orchestration.utils.slots import add_slots
 
+
+@add_slots
 @dataclass
 class ExecutionMetadata:
     """Metadata about query execution."""
@@ -39,6 +42,7 @@ class ExecutionMetadata:
         )
 
 
+@add_slots
 @dataclass
 class QueryResult:
     """Result of a query execution."""
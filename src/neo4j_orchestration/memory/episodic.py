@@ -23,8 +23,9 @@ Example:
     >>> recent = await memory.get_recent_sessions(days=7)
 """
 
+import heapq
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
 from neo4j import AsyncDriver
@@ -561,6 +562,11 @@ class Event:
         self.timestamp = timestamp or datetime.now()
 
 
+def _event_timestamp(event: Event) -> datetime:
+    """Sort key for SimpleEpisodicMemory.retrieve_recent."""
+    return event.timestamp
+
+
 class SimpleEpisodicMemory:
     """Simple in-memory episodic storage for query history.
     
@@ -580,6 +586,14 @@ class SimpleEpisodicMemory:
         """
         self.memory_store[event.event_id] = event
     
+    def store_many(self, events: Iterable[Event]) -> None:
+        """Store several events in one update.
+        
+        Args:
+            events: Events to store
+        """
+        self.memory_store.update((event.event_id, event) for event in events)
+    
     def retrieve_recent(
         self,
         event_type: Optional[str] = None,
@@ -594,16 +608,15 @@ class SimpleEpisodicMemory:
         Returns:
             List of events, most recent first
         """
-        events = list(self.memory_store.values())
+        events: Iterable[Event] = self.memory_store.values()
         
         # Filter by type if specified
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
-        
-        # Sort by timestamp, most recent first
-        events.sort(key=lambda e: e.timestamp, reverse=True)
+            events = (e for e in events if e.event_type == event_type)
         
-        return events[:limit]
+        # Top `limit` by timestamp, most recent first; same order (ties
+        # included) as a full reverse sort, without sorting every event
+        return heapq.nlargest(limit, events, key=_event_timestamp)
 
 
 # ============================================================================
@@ -3,8 +3,12 @@ Query Pattern Memory Implementation.
 Stores learned query patterns and user preferences in Neo4j.
 Enables pattern matching, preference learning, and query suggestions.
 """
+import asyncio
+import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
 from neo4j import AsyncDriver
 
 from ..core.types import MemoryEntry, MemoryType
@@ -13,6 +17,56 @@ from ..core.exceptions import MemoryError, ValidationError
 from .base import BaseMemory
 
 
+# Seconds a get_common_filters result is served from the in-process cache
+DEFAULT_FILTERS_CACHE_TTL = 5.0
+
+# Extra labels must be plain identifiers; they are interpolated into Cypher
+_SCOPE_LABEL_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Indexes backing the MERGE on pattern_signature, get_common_filters'
+# query_type lookup and pattern_id reads
+_INDEX_STATEMENTS = (
+    "CREATE INDEX query_pattern_signature IF NOT EXISTS "
+    "FOR (p:QueryPattern) ON (p.pattern_signature)",
+    "CREATE INDEX query_pattern_type IF NOT EXISTS "
+    "FOR (p:QueryPattern) ON (p.query_type, p.frequency)",
+    "CREATE INDEX query_pattern_id IF NOT EXISTS "
+    "FOR (p:QueryPattern) ON (p.pattern_id)",
+)
+
+# MERGE/upsert shared by single and batched pattern recording. Expects
+# pattern_sig, query_type, legacy_type, entities, filters, success and delta
+# (number of observations) to be bound by a preceding WITH (from parameters
+# or from an UNWIND row). Like every pattern query it is a format string:
+# {label} is the node label(s) and literal braces are doubled.
+_PATTERN_MERGE = """
+        MERGE (p:{label} {{pattern_signature: pattern_sig}})
+        ON CREATE SET
+            p.pattern_id = randomUUID(),
+            p.query_type = query_type,
+            p.legacy_type = legacy_type,
+            p.entities = entities,
+            p.common_filters = filters,
+            p.frequency = delta,
+            p.success_count = CASE WHEN success THEN delta ELSE 0 END,
+            p.total_count = delta,
+            p.success_rate = CASE WHEN success THEN 1.0 ELSE 0.0 END,
+            p.created_at = datetime(),
+            p.last_used = datetime()
+        ON MATCH SET
+            p.frequency = p.frequency + delta,
+            p.success_count = p.success_count + CASE WHEN success THEN delta ELSE 0 END,
+            p.total_count = p.total_count + delta,
+            p.success_rate = toFloat(p.success_count) / toFloat(p.total_count),
+            p.last_used = datetime(),
+            p.common_filters = CASE
+                WHEN p.frequency < 3 THEN filters
+                ELSE p.common_filters
+            END
+        RETURN p.pattern_id as pattern_id
+"""
+
+
 class QueryPatternMemory(BaseMemory):
     """
     Neo4j-backed memory for learned query patterns.
@@ -41,15 +95,184 @@ class QueryPatternMemory(BaseMemory):
         
         (:QueryPattern)-[:SIMILAR_TO {similarity: float}]->(:QueryPattern)
     
+    Works with both ``neo4j.AsyncDriver`` and the synchronous ``Driver``;
+    async drivers are awaited, sync ones are called directly.
+    
     Attributes:
-        driver: Neo4j async driver instance
+        driver: Neo4j driver instance (async or sync)
         memory_type: Always MemoryType.SEMANTIC
     """
     
-    def __init__(self, driver: AsyncDriver):
-        """Initialize query pattern memory."""
+    def __init__(
+        self,
+        driver: AsyncDriver,
+        filters_cache_ttl: float = DEFAULT_FILTERS_CACHE_TTL,
+        scope_label: Optional[str] = None
+    ):
+        """
+        Initialize query pattern memory.
+        
+        Args:
+            driver: Neo4j driver instance
+            filters_cache_ttl: Seconds to cache get_common_filters results
+                (0 disables caching)
+            scope_label: Optional extra node label (e.g. ``Test_<uuid>``).
+                Patterns are written as ``:QueryPattern:<scope_label>`` and
+                every read, clear() and delete() is restricted to it, so
+                separate scopes never share or see each other's patterns.
+                
+        Raises:
+            ValidationError: If scope_label is not a plain identifier
+        """
         super().__init__(memory_type=MemoryType.SEMANTIC)
+        if scope_label is not None and not _SCOPE_LABEL_RE.match(scope_label):
+            raise ValidationError(
+                f"Invalid scope label: {scope_label!r}",
+                field="scope_label",
+                value=scope_label
+            )
+        self.scope_label = scope_label
+        self._label = f"QueryPattern:{scope_label}" if scope_label else "QueryPattern"
+        # Pattern query template -> query with {label} substituted
+        self._scoped_queries: Dict[str, str] = {}
         self.driver = driver
+        self._is_async = isinstance(driver, AsyncDriver)
+        self._session: Any = None
+        # Created on first use and bound to the loop that uses the session
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.filters_cache_ttl = filters_cache_ttl
+        
+        # (generic query type, min_frequency) -> (expires_at, filters)
+        self._filters_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+    
+    def _session_lock(self) -> asyncio.Lock:
+        """Return the lock guarding the shared session.
+        
+        The session (and an async driver's connections) belong to the event
+        loop that opened it, so the memory is owned by one loop at a time.
+        Another loop may take over only once the session has been closed.
+        
+        Raises:
+            MemoryError: If a session opened on another event loop is open
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._lock
+        if lock is None or self._loop is not loop:
+            if self._session is not None or (lock is not None and lock.locked()):
+                raise MemoryError(
+                    "QueryPatternMemory session is owned by another event loop; "
+                    "call aclose() on that loop first"
+                )
+            lock = self._lock = asyncio.Lock()
+            self._loop = loop
+        return lock
+    
+    async def _get_session(self) -> Any:
+        """Return the memory's Neo4j session, opening it on first use.
+        
+        One session is reused for every call instead of acquiring and
+        releasing a pooled connection per operation. Sessions are not safe
+        for concurrent use, so callers must hold the session lock from run
+        until the result is consumed. Call close()/aclose() (or use the
+        memory as an async context manager) to release it.
+        """
+        if self._session is None:
+            session = self.driver.session()
+            if self._is_async:
+                session = await session.__aenter__()
+            self._session = session
+        return self._session
+    
+    def _scoped(self, query: str) -> str:
+        """Fill the {label} placeholder of a pattern query."""
+        scoped = self._scoped_queries.get(query)
+        if scoped is None:
+            scoped = self._scoped_queries[query] = query.format(label=self._label)
+        return scoped
+    
+    async def _run(self, query: str, params: Dict[str, Any]) -> Any:
+        """Run a query on the shared session; caller holds the session lock."""
+        session = await self._get_session()
+        result = session.run(query, **params)
+        if self._is_async:
+            result = await result
+        return result
+    
+    async def _single(self, query: str, **params: Any) -> Optional[Any]:
+        """Run a scoped query and return its single record, or None."""
+        async with self._session_lock():
+            result = await self._run(self._scoped(query), params)
+            record = result.single()
+            if self._is_async:
+                record = await record
+            return record
+    
+    async def _records(self, query: str, **params: Any) -> List[Any]:
+        """Run a scoped query and collect every record."""
+        async with self._session_lock():
+            result = await self._run(self._scoped(query), params)
+            if self._is_async:
+                return [record async for record in result]
+            return list(result)
+    
+    async def _execute(self, query: str, scoped: bool = True, **params: Any) -> None:
+        """Run a query for its side effects and consume the result."""
+        async with self._session_lock():
+            result = await self._run(self._scoped(query) if scoped else query, params)
+            if self._is_async:
+                await result.consume()
+            else:
+                result.consume()
+    
+    def close(self) -> None:
+        """Close the shared session of a sync driver, if one was opened.
+        
+        Sessions of an async driver must be released with aclose().
+        
+        Raises:
+            MemoryError: If an async session is open
+        """
+        if self._session is None:
+            return
+        if self._is_async:
+            raise MemoryError("Async session is open; use aclose() instead")
+        session, self._session = self._session, None
+        session.close()
+    
+    async def aclose(self) -> None:
+        """Close the shared session, if one was opened (sync or async driver)."""
+        if self._session is None:
+            return
+        if not self._is_async:
+            self.close()
+            return
+        async with self._session_lock():
+            session, self._session = self._session, None
+            if session is not None:
+                await session.__aexit__(None, None, None)
+    
+    async def __aenter__(self) -> "QueryPatternMemory":
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        await self.aclose()
+    
+    async def create_indexes(self) -> None:
+        """
+        Create the QueryPattern indexes if they do not exist yet.
+        
+        Without them every MERGE and get_common_filters lookup is a full
+        label scan over all stored patterns.
+        """
+        for statement in _INDEX_STATEMENTS:
+            # Indexes are per base label and cover every scope
+            await self._execute(statement, scoped=False)
     
     async def record_pattern(
         self,
@@ -76,7 +299,124 @@ class QueryPatternMemory(BaseMemory):
         Raises:
             MemoryError: If recording fails
         """
-        filters = filters or {}
+        return await self.bump_pattern(query_type, entities, filters, success)
+    
+    async def bump_pattern(
+        self,
+        query_type: QueryType,
+        entities: List[EntityType],
+        filters: Optional[Dict[str, Any]] = None,
+        success: bool = True,
+        delta: int = 1
+    ) -> str:
+        """
+        Record ``delta`` identical observations of a pattern in one write.
+        
+        Equivalent to calling record_pattern ``delta`` times, but the
+        counters are incremented server-side by a single MERGE.
+        
+        Args:
+            query_type: Type of query (can be legacy or generic)
+            entities: Entity types involved
+            filters: Filter conditions used
+            success: Whether the queries were successful
+            delta: Number of observations to add (must be positive)
+            
+        Returns:
+            Pattern ID (existing or newly created)
+            
+        Raises:
+            ValidationError: If delta is not positive
+            MemoryError: If recording fails
+        """
+        if delta < 1:
+            raise ValidationError(
+                f"delta must be positive, got {delta}",
+                field="delta",
+                value=delta
+            )
+        
+        row = self._pattern_row(query_type, entities, filters, success, delta)
+        self._invalidate_filters(row["query_type"])
+        
+        query = """
+        WITH $pattern_sig AS pattern_sig, $query_type AS query_type,
+             $legacy_type AS legacy_type, $entities AS entities,
+             $filters AS filters, $success AS success, $delta AS delta
+        """ + _PATTERN_MERGE
+        
+        try:
+            record = await self._single(query, **row)
+        except Exception as e:
+            raise MemoryError(f"Failed to record pattern: {e}")
+        if record is None:
+            raise MemoryError("Failed to record pattern: no pattern_id returned")
+        pattern_id: str = record["pattern_id"]
+        return pattern_id
+    
+    async def record_patterns_batch(
+        self,
+        patterns: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Record several query patterns in a single round-trip.
+        
+        Each entry takes the same keys as record_pattern's arguments
+        (query_type, entities, optional filters and success). All rows are
+        sent as one UNWIND statement, so N recordings cost one query
+        instead of N.
+        
+        Args:
+            patterns: Pattern dicts in the order they were observed
+            
+        Returns:
+            Pattern IDs, one per input row
+            
+        Raises:
+            MemoryError: If recording fails
+        """
+        if not patterns:
+            return []
+        
+        rows = [
+            self._pattern_row(
+                p["query_type"],
+                p["entities"],
+                p.get("filters"),
+                p.get("success", True)
+            )
+            for p in patterns
+        ]
+        for generic_value in {row["query_type"] for row in rows}:
+            self._invalidate_filters(generic_value)
+        
+        query = """
+        UNWIND $patterns AS row
+        WITH row.pattern_sig AS pattern_sig, row.query_type AS query_type,
+             row.legacy_type AS legacy_type, row.entities AS entities,
+             row.filters AS filters, row.success AS success, row.delta AS delta
+        """ + _PATTERN_MERGE
+        
+        try:
+            records = await self._records(query, patterns=rows)
+            return [record["pattern_id"] for record in records]
+        except Exception as e:
+            raise MemoryError(f"Failed to record pattern batch: {e}")
+    
+    def _invalidate_filters(self, generic_value: str) -> None:
+        """Drop cached common filters for one generic query type."""
+        for key in [k for k in self._filters_cache if k[0] == generic_value]:
+            del self._filters_cache[key]
+    
+    @staticmethod
+    def _pattern_row(
+        query_type: QueryType,
+        entities: List[EntityType],
+        filters: Optional[Dict[str, Any]],
+        success: bool,
+        delta: int = 1
+    ) -> Dict[str, Any]:
+        """Build the query parameters for one pattern recording."""
         entity_names = [e.value for e in entities]
         
         # Convert to generic type for pattern learning
@@ -86,80 +426,45 @@ class QueryPatternMemory(BaseMemory):
         # Generate pattern signature using GENERIC type for cross-entity learning
         pattern_sig = f"{generic_type.value}::{','.join(sorted(entity_names))}"
         
-        query = """
-        MERGE (p:QueryPattern {pattern_signature: $pattern_sig})
-        ON CREATE SET
-            p.pattern_id = randomUUID(),
-            p.query_type = $query_type,
-            p.legacy_type = $legacy_type,
-            p.entities = $entities,
-            p.common_filters = $filters,
-            p.frequency = 1,
-            p.success_count = CASE WHEN $success THEN 1 ELSE 0 END,
-            p.total_count = 1,
-            p.success_rate = CASE WHEN $success THEN 1.0 ELSE 0.0 END,
-            p.created_at = datetime(),
-            p.last_used = datetime()
-        ON MATCH SET
-            p.frequency = p.frequency + 1,
-            p.success_count = p.success_count + CASE WHEN $success THEN 1 ELSE 0 END,
-            p.total_count = p.total_count + 1,
-            p.success_rate = toFloat(p.success_count) / toFloat(p.total_count),
-            p.last_used = datetime(),
-            p.common_filters = CASE
-                WHEN p.frequency < 3 THEN $filters
-                ELSE p.common_filters
-            END
-        RETURN p.pattern_id as pattern_id
-        """
-        
-        with self.driver.session() as session:
-            try:
-                result = session.run(
-                    query,
-                    pattern_sig=pattern_sig,
-                    query_type=generic_type.value,
-                    legacy_type=legacy_type,
-                    entities=entity_names,
-                    filters=filters,
-                    success=success
-                )
-                record = await result.single()
-                return record["pattern_id"]
-            except Exception as e:
-                raise MemoryError(f"Failed to record pattern: {e}")
+        return {
+            "pattern_sig": pattern_sig,
+            "query_type": generic_type.value,
+            "legacy_type": legacy_type,
+            "entities": entity_names,
+            "filters": filters or {},
+            "success": success,
+            "delta": delta,
+        }
     
     async def get_pattern(self, pattern_id: str) -> Optional[MemoryEntry]:
         """Get a specific pattern by ID."""
         query = """
-        MATCH (p:QueryPattern {pattern_id: $pattern_id})
+        MATCH (p:{label} {{pattern_id: $pattern_id}})
         RETURN p
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, pattern_id=pattern_id)
-            record = await result.single()
-            
-            if not record:
-                return None
-            
-            node = record["p"]
-            return MemoryEntry(
-                key=pattern_id,
-                value={
-                    "query_type": node["query_type"],
-                    "entities": node["entities"],
-                    "common_filters": node["common_filters"],
-                    "frequency": node["frequency"],
-                    "success_rate": node["success_rate"],
-                    "last_used": node["last_used"]
-                },
-                memory_type=MemoryType.SEMANTIC,
-                metadata={
-                    "pattern_id": pattern_id,
-                    "created_at": node["created_at"]
-                }
-            )
+        record = await self._single(query, pattern_id=pattern_id)
+        
+        if not record:
+            return None
+        
+        node = record["p"]
+        return MemoryEntry(
+            key=pattern_id,
+            value={
+                "query_type": node["query_type"],
+                "entities": node["entities"],
+                "common_filters": node["common_filters"],
+                "frequency": node["frequency"],
+                "success_rate": node["success_rate"],
+                "last_used": node["last_used"]
+            },
+            memory_type=MemoryType.SEMANTIC,
+            metadata={
+                "pattern_id": pattern_id,
+                "created_at": node["created_at"]
+            }
+        )
     
     async def get(self, key: str) -> Optional[MemoryEntry]:
         """Get pattern by ID (alias for get_pattern)."""
@@ -172,15 +477,13 @@ class QueryPatternMemory(BaseMemory):
     async def delete(self, key: str) -> bool:
         """Delete a pattern by ID."""
         query = """
-        MATCH (p:QueryPattern {pattern_id: $pattern_id})
+        MATCH (p:{label} {{pattern_id: $pattern_id}})
         DELETE p
         RETURN count(p) as deleted
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, pattern_id=key)
-            record = await result.single()
-            return record["deleted"] > 0 if record else False
+        record = await self._single(query, pattern_id=key)
+        return record["deleted"] > 0 if record else False
     
     async def exists(self, key: str) -> bool:
         """Check if pattern exists."""
@@ -189,17 +492,14 @@ class QueryPatternMemory(BaseMemory):
     
     async def clear(self) -> None:
         """Clear all query patterns."""
-        query = "MATCH (p:QueryPattern) DELETE p"
-        with self.driver.session() as session:
-            await session.run(query)
+        query = "MATCH (p:{label}) DELETE p"
+        await self._execute(query)
     
     async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
         """List all pattern IDs."""
-        query = "MATCH (p:QueryPattern) RETURN p.pattern_id as pattern_id"
+        query = "MATCH (p:{label}) RETURN p.pattern_id as pattern_id"
         
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [record["pattern_id"] async for record in result]
+        return [record["pattern_id"] for record in await self._records(query)]
 
     async def get_common_filters(
         self,
@@ -210,6 +510,9 @@ class QueryPatternMemory(BaseMemory):
         Get common filters for a query type.
         
         Looks up patterns by GENERIC type to enable cross-entity learning.
+        Results are cached for filters_cache_ttl seconds; recording a
+        pattern of the same generic type invalidates the cached entry.
+        Each call returns a fresh dict, so callers may mutate it.
         
         Args:
             query_type: Type of query (legacy or generic)
@@ -220,9 +523,14 @@ class QueryPatternMemory(BaseMemory):
         """
         # Convert to generic type for lookup
         generic_type = query_type.to_generic()
+        cache_key = (generic_type.value, min_frequency)
+        
+        cached = self._filters_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return dict(cached[1])
         
         query = """
-        MATCH (p:QueryPattern)
+        MATCH (p:{label})
         WHERE p.query_type = $query_type
         AND p.frequency >= $min_frequency
         RETURN p.common_filters as filters
@@ -231,14 +539,18 @@ class QueryPatternMemory(BaseMemory):
         """
         
         try:
-            # Use sync session since driver is sync
-            with self.driver.session() as session:
-                result = session.run(
-                    query,
-                    query_type=generic_type.value,
-                    min_frequency=min_frequency
-                )
-                record = result.single()
-                return record["filters"] if record else {}
+            record = await self._single(
+                query,
+                query_type=generic_type.value,
+                min_frequency=min_frequency
+            )
+            filters: Dict[str, Any] = record["filters"] if record else {}
         except Exception as e:
             raise MemoryError(f"Failed to get common filters: {e}") from e
+        
+        if self.filters_cache_ttl > 0:
+            self._filters_cache[cache_key] = (
+                time.monotonic() + self.filters_cache_ttl,
+                filters
+            )
+        return dict(filters)
@@ -13,6 +13,9 @@ class OrchestratorConfig(BaseModel):
         enable_context: Whether to use working memory for query context
         cache_ttl_seconds: TTL for cached results (default: 300 = 5 minutes)
         max_history_size: Maximum number of queries to keep in history
+        pattern_batch_size: Pattern-learning recordings buffered before they
+            are written to Neo4j in one UNWIND batch (default 1 writes each
+            immediately; larger values need close() to flush the remainder)
     """
     
     model_config = ConfigDict(frozen=True)
@@ -22,3 +25,4 @@ class OrchestratorConfig(BaseModel):
     enable_context: bool = Field(default=True, description="Maintain query context")
     cache_ttl_seconds: int = Field(default=300, ge=0, description="Cache TTL in seconds")
     max_history_size: Optional[int] = Field(default=100, ge=1, description="Max history entries")
+    pattern_batch_size: int = Field(default=1, ge=1, description="Pattern writes per batch")
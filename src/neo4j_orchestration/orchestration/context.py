@@ -8,7 +8,13 @@ Tracks conversation state across queries using Working Memory:
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from neo4j_orchestration.memory.working import WorkingMemory
-from neo4j_orchestration.planning.intent import QueryIntent, QueryType, EntityType
+from neo4j_orchestration.planning.intent import (
+    QueryIntent,
+    QueryType,
+    EntityType,
+    QUERY_TYPES_BY_NAME,
+    ENTITY_TYPES_BY_NAME,
+)
 from neo4j_orchestration.execution.result import QueryResult
 from neo4j_orchestration.utils.logging import get_logger
 logger = get_logger(__name__)
@@ -94,10 +100,11 @@ class ConversationContext:
             entity_strs = intent_data.get("entities", [])
             # Convert string back to EntityType
             for entity_str in entity_strs:
-                try:
-                    entities.append(EntityType[entity_str])
-                except KeyError:
+                entity = ENTITY_TYPES_BY_NAME.get(entity_str)
+                if entity is None:
                     logger.warning(f"Unknown entity type: {entity_str}")
+                else:
+                    entities.append(entity)
         return entities
     async def get_last_query_type(self) -> Optional[QueryType]:
         """
@@ -112,10 +119,10 @@ class ConversationContext:
         intent_data = last_entry.get("intent", {})
         query_type_str = intent_data.get("query_type")
         if query_type_str:
-            try:
-                return QueryType[query_type_str]
-            except KeyError:
+            query_type = QUERY_TYPES_BY_NAME.get(query_type_str)
+            if query_type is None:
                 logger.warning(f"Unknown query type: {query_type_str}")
+            return query_type
         return None
     async def get_last_query(self) -> Optional[str]:
         """
@@ -7,15 +7,86 @@ Enhances QueryIntentClassifier with conversation context for:
 - Entity reference tracking
 """
 import asyncio
+import functools
 import re
-from typing import Optional, List
-from neo4j_orchestration.planning.classifier import QueryIntentClassifier
+import threading
+import weakref
+from typing import Optional, List, Tuple
+from neo4j_orchestration.planning.classifier import (
+    QueryIntentClassifier,
+    get_default_classifier,
+)
 from neo4j_orchestration.planning.intent import QueryIntent, QueryType, EntityType
 from neo4j_orchestration.orchestration.context import ConversationContext
 from neo4j_orchestration.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Follow-up indicators, searched anywhere in the lowercased query
+_FOLLOWUP_PATTERNS = [
+    r"\b(which|what|how many)\b",
+    r"\b(show|find|get|list)\s+(me\s+)?(the\s+)?ones?\b",
+    r"\b(only|just|filter|narrow)\b",
+    r"\b(also|additionally|and)\b"
+]
+
+# Simple follow-ups start with filtering words
+_SIMPLE_FOLLOWUP_PATTERNS = [
+    r"^(only|just|filter|show)\b",
+    r"^(which|what)\s+(ones?|about)\b",
+    r"^(in|with|for|by)\b"
+]
+
+# Compiled once at import; each alternation costs a single scan per query
+_FOLLOWUP_RE = re.compile("|".join(f"(?:{p})" for p in _FOLLOWUP_PATTERNS))
+_SIMPLE_FOLLOWUP_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _SIMPLE_FOLLOWUP_PATTERNS)
+)
+
+# Per-thread event loop reused for sync context lookups
+_thread_state = threading.local()
+
+
+class _LoopHolder:
+    """Owns a thread's sync-lookup loop; closes it when the thread exits.
+    
+    The holder lives only in ``_thread_state``, so it is released (and the
+    finalizer closes the loop) when its thread ends, or at interpreter exit.
+    """
+    
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._finalizer = weakref.finalize(self, self.loop.close)
+    
+    def close(self) -> None:
+        """Close the loop now."""
+        self._finalizer()
+
+
+def _get_sync_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Return this thread's cached event loop for blocking context reads.
+    
+    Returns:
+        Reusable event loop, or None when called from inside a running loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        holder = getattr(_thread_state, "holder", None)
+        if holder is None or holder.loop.is_closed():
+            holder = _thread_state.holder = _LoopHolder()
+        return holder.loop
+    return None
+
+
+def _close_sync_loop() -> None:
+    """Close the calling thread's cached loop, if it has one."""
+    holder = getattr(_thread_state, "holder", None)
+    if holder is not None:
+        del _thread_state.holder
+        holder.close()
+
 
 class ContextAwareClassifier:
     """
@@ -53,21 +124,25 @@ class ContextAwareClassifier:
     }
     
     # Follow-up indicators
-    FOLLOWUP_PATTERNS = [
-        r"\b(which|what|how many)\b",
-        r"\b(show|find|get|list)\s+(me\s+)?(the\s+)?ones?\b",
-        r"\b(only|just|filter|narrow)\b",
-        r"\b(also|additionally|and)\b"
-    ]
+    FOLLOWUP_PATTERNS = _FOLLOWUP_PATTERNS
     
-    def __init__(self, base_classifier: QueryIntentClassifier):
+    # Memoized (query, context fingerprint) -> intent entries
+    CACHE_SIZE = 512
+    
+    def __init__(self, base_classifier: Optional[QueryIntentClassifier] = None):
         """
         Initialize context-aware classifier.
         
         Args:
-            base_classifier: Base QueryIntentClassifier instance
+            base_classifier: Base QueryIntentClassifier instance (default:
+                the shared instance from get_default_classifier())
         """
+        if base_classifier is None:
+            base_classifier = get_default_classifier()
         self.base_classifier = base_classifier
+        self._classify_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._classify_uncached
+        )
         logger.info("ContextAwareClassifier initialized")
     
     def classify_with_context(
@@ -78,6 +153,10 @@ class ContextAwareClassifier:
         """
         Classify query with conversation context.
         
+        Results are memoized on the query string plus the context values
+        that influence it (recent entities and last query type); each call
+        returns its own QueryIntent so callers may mutate it.
+        
         Args:
             query: Natural language query string
             context: Optional conversation context
@@ -85,21 +164,47 @@ class ContextAwareClassifier:
         Returns:
             Enhanced QueryIntent with context-resolved entities
         """
-        # Get base classification
-        intent = self.base_classifier.classify(query)
-        
         # If no context, return base intent
         if not context:
             logger.debug("No context provided, using base intent")
-            return intent
+            return self._classify_cached(query, (), None)._copy()
         
-        # Check if this is a follow-up query
-        is_followup = self._is_followup_query(query)
+        # Only follow-up queries consult the context
+        if not self._is_followup_query(query):
+            return self._classify_cached(query, (), None)._copy()
         
-        if is_followup:
-            logger.debug(f"Detected follow-up query: '{query[:50]}...'")
-            # Enhance intent with context
-            intent = self._enhance_with_context(intent, query, context)
+        logger.debug(f"Detected follow-up query: '{query[:50]}...'")
+        last_entities, last_query_type = self._load_context(context)
+        
+        return self._classify_cached(
+            query, tuple(last_entities), last_query_type
+        )._copy()
+    
+    def cache_info(self) -> functools._CacheInfo:
+        """Return hit/miss statistics for the classification cache."""
+        return self._classify_cached.cache_info()
+    
+    def close(self) -> None:
+        """Clear the classification cache and close this thread's lookup loop.
+        
+        Loops cached by other threads are closed when those threads exit.
+        """
+        self._classify_cached.cache_clear()
+        _close_sync_loop()
+    
+    def _classify_uncached(
+        self,
+        query: str,
+        last_entities: Tuple[EntityType, ...],
+        last_query_type: Optional[QueryType]
+    ) -> QueryIntent:
+        """Classify query and apply already-loaded context (uncached)."""
+        intent = self.base_classifier.classify(query)
+        
+        if last_entities or last_query_type:
+            intent = self._apply_context(
+                intent, query, list(last_entities), last_query_type
+            )
         
         return intent
     
@@ -121,11 +226,7 @@ class ContextAwareClassifier:
             return True
         
         # Check for follow-up patterns
-        for pattern in self.FOLLOWUP_PATTERNS:
-            if re.search(pattern, query_lower):
-                return True
-        
-        return False
+        return _FOLLOWUP_RE.search(query_lower) is not None
     
     def _enhance_with_context(
         self,
@@ -144,18 +245,52 @@ class ContextAwareClassifier:
         Returns:
             Enhanced QueryIntent
         """
+        last_entities, last_query_type = self._load_context(context)
+        return self._apply_context(intent, query, last_entities, last_query_type)
+    
+    def _load_context(
+        self,
+        context: ConversationContext
+    ) -> Tuple[List[EntityType], Optional[QueryType]]:
+        """
+        Read recent entities and the last query type from a sync caller.
+        
+        Args:
+            context: Conversation context
+            
+        Returns:
+            Tuple of (recent entities, last query type); empty when called
+            from inside a running event loop
+        """
         # Run async context lookup in sync context
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If already in async context, create new task
-            last_entities = []
-            last_query_type = None
+        loop = _get_sync_loop()
+        if loop is None:
+            # Already inside a running loop; cannot block on it
             logger.warning("Running in async context, skipping context enhancement")
-        else:
-            # Safe to run in sync context
-            last_entities = loop.run_until_complete(context.get_last_entities(n=2))
-            last_query_type = loop.run_until_complete(context.get_last_query_type())
+            return [], None
         
+        # Safe to run in sync context; one trampoline for both reads
+        return loop.run_until_complete(self._read_context(context))
+    
+    def _apply_context(
+        self,
+        intent: QueryIntent,
+        query: str,
+        last_entities: List[EntityType],
+        last_query_type: Optional[QueryType]
+    ) -> QueryIntent:
+        """
+        Fill in entities and query type from previously loaded context.
+        
+        Args:
+            intent: Base intent from classifier
+            query: Original query string
+            last_entities: Entities from recent queries, most recent first
+            last_query_type: Query type of the previous query
+            
+        Returns:
+            Enhanced QueryIntent
+        """
         # If intent has no entities but context has recent entities, inherit them
         if not intent.entities and last_entities:
             logger.info(f"Inheriting entities from context: {[e.name for e in last_entities]}")
@@ -172,6 +307,23 @@ class ContextAwareClassifier:
         
         return intent
     
+    @staticmethod
+    async def _read_context(
+        context: ConversationContext
+    ) -> Tuple[List[EntityType], Optional[QueryType]]:
+        """
+        Fetch recent entities and the last query type from context.
+        
+        Args:
+            context: Conversation context
+            
+        Returns:
+            Tuple of (entities from the last two queries, last query type)
+        """
+        last_entities = await context.get_last_entities(n=2)
+        last_query_type = await context.get_last_query_type()
+        return last_entities, last_query_type
+    
     def _is_simple_followup(self, query: str) -> bool:
         """
         Check if query is a simple follow-up (filter/refinement).
@@ -182,16 +334,7 @@ class ContextAwareClassifier:
         Returns:
             True if query appears to be a simple filter/refinement
         """
-        query_lower = query.lower()
-        
-        # Simple follow-ups start with filtering words
-        simple_patterns = [
-            r"^(only|just|filter|show)\b",
-            r"^(which|what)\s+(ones?|about)\b",
-            r"^(in|with|for|by)\b"
-        ]
-        
-        return any(re.match(pattern, query_lower) for pattern in simple_patterns)
+        return _SIMPLE_FOLLOWUP_RE.match(query.lower()) is not None
 
 
 def classify_with_context(
@@ -1,15 +1,28 @@
 """Query history tracking using episodic memory."""
 
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from neo4j_orchestration.memory.episodic import Event, SimpleEpisodicMemory
+from neo4j_orchestration.utils.slots import add_slots
 
 
-class QueryRecord(BaseModel):
+_QUERY_EVENT = "query_executed"
+
+
+@add_slots
+@dataclass(frozen=True)
+class QueryRecord:
     """Record of a single query execution.
     
+    Immutable and slotted: one is created per executed query and kept in
+    the history deque, so it carries no per-instance ``__dict__``.
+    
     Attributes:
         query_id: Unique identifier for this query
         natural_language: Original NL query from user
@@ -23,16 +36,24 @@ class QueryRecord(BaseModel):
         error_message: Error message if query failed
     """
     
-    query_id: str = Field(description="Unique query identifier")
-    natural_language: str = Field(description="Original NL query")
-    intent: Dict[str, Any] = Field(description="Query intent as dict")
-    cypher_query: str = Field(description="Generated Cypher")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Query parameters")
-    result_count: int = Field(default=0, ge=0, description="Number of results")
-    execution_time_ms: float = Field(default=0.0, ge=0, description="Execution time")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Execution timestamp")
-    success: bool = Field(default=True, description="Query success status")
-    error_message: Optional[str] = Field(default=None, description="Error if failed")
+    query_id: str
+    natural_language: str
+    intent: Dict[str, Any]
+    cypher_query: str
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    result_count: int = 0
+    execution_time_ms: float = 0.0
+    timestamp: datetime = field(default_factory=datetime.now)
+    success: bool = True
+    error_message: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        """Validate query record."""
+        if self.result_count < 0:
+            raise ValueError("result_count must be >= 0")
+        
+        if self.execution_time_ms < 0:
+            raise ValueError("execution_time_ms must be >= 0")
     
     @classmethod
     def from_event(cls, event: Event) -> "QueryRecord":
@@ -55,7 +76,7 @@ class QueryRecord(BaseModel):
         """Convert QueryRecord to Event for storage in episodic memory."""
         return Event(
             event_id=self.query_id,
-            event_type="query_executed",
+            event_type=_QUERY_EVENT,
             content={
                 "natural_language": self.natural_language,
                 "intent": self.intent,
@@ -75,17 +96,62 @@ class QueryHistory:
     
     Stores and retrieves query execution records for pattern analysis
     and "show me again" functionality.
+    
+    Recent records are indexed in a bounded deque (oldest evicted first),
+    so reads never re-sort the episodic store; evicted records are also
+    dropped from the episodic memory. A per-entity index serves
+    search_by_entity_type, and a successful-only deque serves
+    get_successful_queries, without scanning unrelated records. The
+    indexes are filled from the episodic memory's existing query events
+    at construction, so a history reopened over a populated store sees
+    its records.
+    
+    Writes to the episodic memory are buffered and applied in batches of
+    FLUSH_THRESHOLD records (and on get_history or an explicit flush()),
+    so readers of the episodic memory itself may lag by up to that many
+    queries. History reads on this class are never stale.
+    
+    Each flush also trims the episodic memory to the max_size most recent
+    query events. If the store holds query events this history did not
+    write (another history sharing it, or a previous one with a larger
+    max_size), the indexes are rebuilt from the store at that point, so
+    histories sharing a store converge on every flush.
     """
     
+    # Pending records written to episodic memory in one batch
+    FLUSH_THRESHOLD = 8
+    
     def __init__(self, episodic_memory: SimpleEpisodicMemory, max_size: Optional[int] = 100):
         """Initialize query history.
         
         Args:
             episodic_memory: Simple episodic memory instance for storage
-            max_size: Maximum number of queries to retain
+            max_size: Maximum number of queries to retain (None/0 for unbounded)
         """
         self.episodic_memory = episodic_memory
         self.max_size = max_size
+        self._recent: Deque[QueryRecord] = deque(maxlen=max_size or None)
+        self._by_entity: Dict[str, Deque[QueryRecord]] = {}
+        self._successful: Deque[QueryRecord] = deque()
+        self._pending: Deque[QueryRecord] = deque()
+        self._load()
+    
+    def _load(self) -> None:
+        """Index query events already held by the episodic memory."""
+        limit = self.max_size or len(self.episodic_memory.memory_store)
+        events = self.episodic_memory.retrieve_recent(
+            event_type=_QUERY_EVENT,
+            limit=limit
+        )
+        
+        # retrieve_recent is most recent first; index oldest first
+        for event in reversed(events):
+            record = QueryRecord.from_event(event)
+            self._recent.append(record)
+            for key in self._entity_keys(record):
+                self._by_entity.setdefault(key, deque()).append(record)
+            if record.success:
+                self._successful.append(record)
     
     def add_query(self, record: QueryRecord) -> None:
         """Add a query record to history.
@@ -93,12 +159,59 @@ class QueryHistory:
         Args:
             record: Query record to store
         """
-        event = record.to_event()
-        self.episodic_memory.store(event)
+        recent = self._recent
+        if recent.maxlen is not None and len(recent) == recent.maxlen:
+            # The append below evicts the oldest record; drop its event too
+            evicted = recent[0]
+            self._unindex(evicted)
+            if self._successful and self._successful[0] is evicted:
+                self._successful.popleft()
+            if self._pending and self._pending[0] is evicted:
+                self._pending.popleft()
+            else:
+                self.episodic_memory.memory_store.pop(evicted.query_id, None)
+        
+        recent.append(record)
+        for key in self._entity_keys(record):
+            self._by_entity.setdefault(key, deque()).append(record)
+        if record.success:
+            self._successful.append(record)
+        
+        self._pending.append(record)
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered records to episodic memory in one batch."""
+        if not self._pending:
+            return
+        
+        self.episodic_memory.store_many(record.to_event() for record in self._pending)
+        self._pending.clear()
+        self._sync_store()
+    
+    def _sync_store(self) -> None:
+        """Prune surplus query events and resync with a shared store.
+        
+        Fast path: once flushed, a store written only by this history
+        holds exactly the records in ``_recent``.
+        """
+        store = self.episodic_memory.memory_store
+        if len(store) == len(self._recent):
+            return
+        
+        events = [e for e in store.values() if e.event_type == _QUERY_EVENT]
+        if self.max_size and len(events) > self.max_size:
+            surplus = len(events) - self.max_size
+            for event in heapq.nsmallest(surplus, events, key=attrgetter("timestamp")):
+                del store[event.event_id]
         
-        # Prune old records if max_size exceeded
-        if self.max_size:
-            self._prune_history()
+        stored = {e.event_id for e in events if e.event_id in store}
+        if stored != {record.query_id for record in self._recent}:
+            self._recent.clear()
+            self._by_entity.clear()
+            self._successful.clear()
+            self._load()
     
     def get_last_query(self) -> Optional[QueryRecord]:
         """Get the most recent query.
@@ -106,15 +219,7 @@ class QueryHistory:
         Returns:
             Most recent QueryRecord or None if no history
         """
-        events = self.episodic_memory.retrieve_recent(
-            event_type="query_executed",
-            limit=1
-        )
-        
-        if not events:
-            return None
-        
-        return QueryRecord.from_event(events[0])
+        return self._recent[-1] if self._recent else None
     
     def get_history(self, limit: int = 10) -> List[QueryRecord]:
         """Get recent query history.
@@ -125,12 +230,8 @@ class QueryHistory:
         Returns:
             List of QueryRecords, most recent first
         """
-        events = self.episodic_memory.retrieve_recent(
-            event_type="query_executed",
-            limit=limit
-        )
-        
-        return [QueryRecord.from_event(event) for event in events]
+        self.flush()
+        return list(islice(reversed(self._recent), limit))
     
     def get_successful_queries(self, limit: int = 10) -> List[QueryRecord]:
         """Get recent successful queries.
@@ -139,11 +240,9 @@ class QueryHistory:
             limit: Maximum number of records to return
             
         Returns:
-            List of successful QueryRecords
+            List of successful QueryRecords, most recent first
         """
-        all_history = self.get_history(limit=limit * 2)  # Get more to filter
-        successful = [r for r in all_history if r.success]
-        return successful[:limit]
+        return list(islice(reversed(self._successful), limit))
     
     def search_by_entity_type(self, entity_type: str, limit: int = 10) -> List[QueryRecord]:
         """Find queries related to a specific entity type.
@@ -155,26 +254,28 @@ class QueryHistory:
         Returns:
             List of matching QueryRecords
         """
-        all_history = self.get_history(limit=limit * 2)
-        matches = [
-            r for r in all_history
-            if r.intent.get("entity_type") == entity_type
-        ]
-        return matches[:limit]
-    
-    def _prune_history(self) -> None:
-        """Remove oldest records if history exceeds max_size."""
-        if not self.max_size:
-            return
-        
-        # Get all query events
-        all_events = self.episodic_memory.retrieve_recent(
-            event_type="query_executed",
-            limit=self.max_size + 100  # Get extra to prune
-        )
+        matches = self._by_entity.get(entity_type, ())
+        return list(islice(reversed(matches), limit))
+    
+    @staticmethod
+    def _entity_keys(record: QueryRecord) -> Set[str]:
+        """Entity names a record is indexed under.
         
-        # If we have more than max_size, remove oldest
-        if len(all_events) > self.max_size:
-            events_to_remove = all_events[self.max_size:]
-            for event in events_to_remove:
-                self.episodic_memory.memory_store.pop(event.event_id, None)
+        Covers both the ``entity_type`` string and the ``entities`` list
+        (EntityType members or strings) that intents may carry.
+        """
+        intent = record.intent
+        keys = {getattr(e, "value", e) for e in intent.get("entities") or ()}
+        entity_type = intent.get("entity_type")
+        if entity_type is not None:
+            keys.add(getattr(entity_type, "value", entity_type))
+        return keys
+    
+    def _unindex(self, record: QueryRecord) -> None:
+        """Remove an evicted (oldest) record from the entity index."""
+        for key in self._entity_keys(record):
+            bucket = self._by_entity.get(key)
+            if bucket and bucket[0] is record:
+                bucket.popleft()
+                if not bucket:
+                    del self._by_entity[key]
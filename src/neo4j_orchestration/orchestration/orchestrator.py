@@ -1,12 +1,22 @@
 """Query orchestrator integrating NL pipeline with memory systems."""
 
+import itertools
+import os
+import threading
 import time
 import asyncio
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future
+from types import TracebackType
+from typing import Any, Coroutine, Dict, List, Optional, Type, TypeVar, Union
 from uuid import uuid4
-from dataclasses import asdict
+from dataclasses import asdict, is_dataclass
 
-from neo4j_orchestration.planning import QueryIntentClassifier, CypherQueryGenerator
+from neo4j_orchestration.planning import (
+    QueryIntentClassifier,
+    CypherQueryGenerator,
+    get_default_classifier,
+    get_default_generator,
+)
 from neo4j_orchestration.execution import QueryExecutor, QueryResult
 from neo4j_orchestration.memory.episodic import SimpleEpisodicMemory
 from neo4j_orchestration.memory.working import WorkingMemory
@@ -19,6 +29,52 @@ from neo4j_orchestration.orchestration.pattern_classifier import PatternEnhanced
 from neo4j_orchestration.planning.intent import EntityType
 
 
+# Process-local query ids: "<pid>-<counter>" in hex, unique within a process.
+# Use core.types.create_query_id() where ids must be unique across processes.
+_QID_PREFIX = f"{os.getpid():x}-"
+_QID_COUNTER = itertools.count()
+
+
+_T = TypeVar("_T")
+
+
+def _next_query_id() -> str:
+    """Return the next compact, process-unique query id."""
+    return _QID_PREFIX + format(next(_QID_COUNTER), "x")
+
+
+class _BackgroundLoop:
+    """Process-wide event loop running in a daemon thread.
+    
+    The sync query() path submits pattern-learning coroutines here instead
+    of calling asyncio.run() per query: no loop is created per call, it
+    works when query() is invoked from inside a running loop, and async
+    Neo4j drivers stay on the one loop they were first used on.
+    """
+    
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls) -> asyncio.AbstractEventLoop:
+        """Return the background loop, starting its thread on first use."""
+        with cls._lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="orchestrator-loop",
+                    daemon=True
+                ).start()
+                cls._loop = loop
+            return cls._loop
+    
+    @classmethod
+    def submit(cls, coro: Coroutine[Any, Any, _T]) -> "Future[_T]":
+        """Schedule a coroutine on the background loop."""
+        return asyncio.run_coroutine_threadsafe(coro, cls.get())
+
+
 class QueryOrchestrator:
     """Orchestrates natural language queries with memory integration.
     
@@ -56,6 +112,8 @@ class QueryOrchestrator:
         enable_pattern_learning: bool = False,
         pattern_memory: Optional[QueryPatternMemory] = None,
         preference_tracker: Optional[UserPreferenceTracker] = None,
+        classifier: Optional[QueryIntentClassifier] = None,
+        generator: Optional[CypherQueryGenerator] = None,
     ):
         """Initialize query orchestrator.
         
@@ -68,6 +126,9 @@ class QueryOrchestrator:
             enable_pattern_learning: Enable pattern-based query enhancement
             pattern_memory: Optional query pattern memory (created if None and enabled)
             preference_tracker: Optional preference tracker (created if None and enabled)
+            classifier: Optional base intent classifier (shared default if None; wrapped
+                with pattern enhancement when pattern learning is enabled)
+            generator: Optional Cypher generator (shared default if None)
         """
         self.executor = executor
         self.config = config or OrchestratorConfig()
@@ -79,6 +140,9 @@ class QueryOrchestrator:
         self.semantic_memory = semantic_memory
         
         # Initialize pattern learning components
+        self.pattern_memory: Optional[QueryPatternMemory]
+        self.preference_tracker: Optional[UserPreferenceTracker]
+        self.classifier: Union[QueryIntentClassifier, PatternEnhancedClassifier]
         if enable_pattern_learning:
             # Initialize pattern memory (needs Neo4j driver)
             self.pattern_memory = pattern_memory or QueryPatternMemory(
@@ -89,11 +153,12 @@ class QueryOrchestrator:
             session_id = str(uuid4())
             self.preference_tracker = preference_tracker or UserPreferenceTracker(
                 pattern_memory=self.pattern_memory,
-                session_id=session_id
+                session_id=session_id,
+                batch_size=self.config.pattern_batch_size
             )
             
             # Wrap classifier with pattern enhancement
-            base_classifier = QueryIntentClassifier()
+            base_classifier = classifier or get_default_classifier()
             self.classifier = PatternEnhancedClassifier(
                 base_classifier=base_classifier,
                 preference_tracker=self.preference_tracker
@@ -101,10 +166,10 @@ class QueryOrchestrator:
         else:
             self.pattern_memory = None
             self.preference_tracker = None
-            self.classifier = QueryIntentClassifier()
+            self.classifier = classifier or get_default_classifier()
         
         # Initialize Cypher generator
-        self.generator = CypherQueryGenerator()
+        self.generator = generator or get_default_generator()
         
         # Initialize query history
         self.history = QueryHistory(
@@ -134,8 +199,8 @@ class QueryOrchestrator:
         Raises:
             Exception: If query execution fails
         """
-        query_id = str(uuid4())
-        start_time = time.time()
+        query_id = _next_query_id()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Step 1: Check cache (future enhancement)
@@ -145,13 +210,11 @@ class QueryOrchestrator:
             #         return cached
             
             # Step 2: Classify intent (with optional pattern enhancement)
-            if self.enable_pattern_learning:
+            if isinstance(self.classifier, PatternEnhancedClassifier):
                 # Pattern-enhanced classifier uses async classify
-                import inspect
-                if inspect.iscoroutinefunction(self.classifier.classify):
-                    intent = asyncio.run(self.classifier.classify(natural_language))
-                else:
-                    intent = self.classifier.classify(natural_language)
+                intent = _BackgroundLoop.submit(
+                    self.classifier.classify(natural_language)
+                ).result()
             else:
                 # Base classifier uses sync classify
                 intent = self.classifier.classify(natural_language)
@@ -163,39 +226,18 @@ class QueryOrchestrator:
             result = self.executor.execute(cypher_query, parameters)
             
             # Calculate execution time
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            # Step 5: Record preference pattern (if enabled)
+            # Step 5: Record preference pattern (if enabled); waiting keeps
+            # the tracker's stats current when query() returns
             if self.enable_pattern_learning and self.preference_tracker:
-                asyncio.run(
-                    self.preference_tracker.record_query_preference(
-                        intent=intent,
-                        result=result,
-                        user_satisfied=True
-                    )
-                )
+                _BackgroundLoop.submit(self._record_preference(intent, result)).result()
             
             # Step 6: Store in history
-            if self.config.enable_history:
-                # Convert dataclass to dict using asdict
-                from dataclasses import is_dataclass
-                if is_dataclass(intent):
-                    intent_dict = asdict(intent)
-                else:
-                    # Fallback for non-dataclass (e.g., in tests with mocks)
-                    intent_dict = {}
-                
-                record = QueryRecord(
-                    query_id=query_id,
-                    natural_language=natural_language,
-                    intent=intent_dict,
-                    cypher_query=cypher_query,
-                    parameters=parameters,
-                    result_count=len(result.records),
-                    execution_time_ms=execution_time_ms,
-                    success=True,
-                )
-                self.history.add_query(record)
+            self._record_success(
+                query_id, natural_language, intent, cypher_query, parameters,
+                result, execution_time_ms
+            )
             
             # Step 7: Cache results (future enhancement)
             # if self.config.enable_caching:
@@ -204,25 +246,123 @@ class QueryOrchestrator:
             return result
             
         except Exception as e:
-            # Log failure to history
-            execution_time_ms = (time.time() - start_time) * 1000
+            self._record_failure(query_id, natural_language, e, start_ns)
+            raise
+    
+    async def aquery(self, natural_language: str) -> QueryResult:
+        """Execute a natural language query from async code.
+        
+        Same pipeline as query(), but the Neo4j call goes through
+        ``executor.aexecute`` so concurrent queries overlap their I/O
+        instead of blocking the event loop. Pattern learning still runs on
+        the shared background loop, so the tracker is only touched from
+        one thread.
+        
+        Args:
+            natural_language: Natural language query from user
             
-            if self.config.enable_history:
-                record = QueryRecord(
-                    query_id=query_id,
-                    natural_language=natural_language,
-                    intent={},
-                    cypher_query="",
-                    parameters={},
-                    result_count=0,
-                    execution_time_ms=execution_time_ms,
-                    success=False,
-                    error_message=str(e),
+        Returns:
+            QueryResult with data and metadata
+            
+        Raises:
+            Exception: If query execution fails
+        """
+        query_id = _next_query_id()
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            if isinstance(self.classifier, PatternEnhancedClassifier):
+                intent = await asyncio.wrap_future(
+                    _BackgroundLoop.submit(self.classifier.classify(natural_language))
                 )
-                self.history.add_query(record)
+            else:
+                intent = self.classifier.classify(natural_language)
+            
+            cypher_query, parameters = self.generator.generate(intent)
+            
+            result = await self.executor.aexecute(cypher_query, parameters)
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
+            if self.enable_pattern_learning and self.preference_tracker:
+                await asyncio.wrap_future(
+                    _BackgroundLoop.submit(self._record_preference(intent, result))
+                )
+            
+            self._record_success(
+                query_id, natural_language, intent, cypher_query, parameters,
+                result, execution_time_ms
+            )
+            return result
+            
+        except Exception as e:
+            self._record_failure(query_id, natural_language, e, start_ns)
             raise
     
+    def _record_success(
+        self,
+        query_id: str,
+        natural_language: str,
+        intent: Any,
+        cypher_query: str,
+        parameters: Dict[str, Any],
+        result: QueryResult,
+        execution_time_ms: float
+    ) -> None:
+        """Store a successful query in history (if enabled)."""
+        if self.config.enable_history:
+            # Convert dataclass to dict using asdict
+            if is_dataclass(intent) and not isinstance(intent, type):
+                intent_dict = asdict(intent)
+            else:
+                # Fallback for non-dataclass (e.g., in tests with mocks)
+                intent_dict = {}
+            
+            record = QueryRecord(
+                query_id=query_id,
+                natural_language=natural_language,
+                intent=intent_dict,
+                cypher_query=cypher_query,
+                parameters=parameters,
+                result_count=len(result.records),
+                execution_time_ms=execution_time_ms,
+                success=True,
+            )
+            self.history.add_query(record)
+    
+    async def _record_preference(self, intent: Any, result: QueryResult) -> None:
+        """Record a successful query with the preference tracker."""
+        if self.preference_tracker is None:
+            return
+        await self.preference_tracker.record_query_preference(
+            intent=intent,
+            result=result,
+            user_satisfied=True
+        )
+    
+    def _record_failure(
+        self,
+        query_id: str,
+        natural_language: str,
+        error: Exception,
+        start_ns: int
+    ) -> None:
+        """Log a failed query to history."""
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        
+        if self.config.enable_history:
+            record = QueryRecord(
+                query_id=query_id,
+                natural_language=natural_language,
+                intent={},
+                cypher_query="",
+                parameters={},
+                result_count=0,
+                execution_time_ms=execution_time_ms,
+                success=False,
+                error_message=str(error),
+            )
+            self.history.add_query(record)
+    
     def get_history(self, limit: int = 10) -> List[QueryRecord]:
         """Get recent query history.
         
@@ -265,6 +405,54 @@ class QueryOrchestrator:
         """
         return self.history.search_by_entity_type(entity_type, limit=limit)
     
+    def close(self) -> None:
+        """Flush buffered query history and pattern-learning writes.
+        
+        Also releases the pattern memory's Neo4j session. The background
+        loop itself is shared by all orchestrators and is left running.
+        """
+        self.history.flush()
+        
+        if self.preference_tracker is not None:
+            _BackgroundLoop.submit(self.preference_tracker.flush()).result()
+        
+        if self.pattern_memory is not None:
+            _BackgroundLoop.submit(self.pattern_memory.aclose()).result()
+    
+    async def aclose(self) -> None:
+        """Async counterpart of close() that also releases the executor.
+        
+        Awaits ``executor.aclose()``, closing the async driver created by
+        aquery() along with the sync one. Call it from the event loop that
+        ran aquery().
+        """
+        self.history.flush()
+        
+        if self.preference_tracker is not None:
+            await asyncio.wrap_future(
+                _BackgroundLoop.submit(self.preference_tracker.flush())
+            )
+        
+        if self.pattern_memory is not None:
+            await asyncio.wrap_future(
+                _BackgroundLoop.submit(self.pattern_memory.aclose())
+            )
+        
+        await self.executor.aclose()
+    
+    def __enter__(self) -> "QueryOrchestrator":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+    
     def get_pattern_stats(self) -> Dict[str, Any]:
         """Get pattern learning statistics.
         
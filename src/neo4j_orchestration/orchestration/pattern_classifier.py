@@ -4,7 +4,7 @@ Pattern-enhanced query classification.
 from typing import Optional, Dict, Any
 
 from ..planning.classifier import QueryIntentClassifier
-from ..planning.intent import QueryIntent, FilterCondition, FilterOperator
+from ..planning.intent import QueryIntent, FilterOperator
 from .preferences import UserPreferenceTracker
 
 
@@ -77,15 +77,12 @@ class PatternEnhancedClassifier:
         for suggestion in suggestions:
             if suggestion["type"] == "add_filter":
                 # Add suggested filter to intent
-                new_filter = FilterCondition(
+                intent.add_filter(
                     field=suggestion["key"],
                     operator=FilterOperator.EQUALS,
                     value=suggestion["value"]
                 )
                 
-                # Add to filters list
-                intent.filters.append(new_filter)
-                
                 # Add metadata about enhancement
                 intent.metadata["pattern_enhancements"] = intent.metadata.get(
                     "pattern_enhancements", []
@@ -21,7 +21,8 @@ class UserPreferenceTracker:
     def __init__(
         self,
         pattern_memory: QueryPatternMemory,
-        session_id: str
+        session_id: str,
+        batch_size: int = 1
     ):
         """
         Initialize preference tracker.
@@ -29,9 +30,15 @@ class UserPreferenceTracker:
         Args:
             pattern_memory: QueryPatternMemory instance for pattern storage
             session_id: Unique session identifier
+            batch_size: Number of recordings to buffer before writing them
+                in one batch (1 writes each recording immediately)
         """
         self.pattern_memory = pattern_memory
         self.session_id = session_id
+        self.batch_size = batch_size
+        
+        # Pattern recordings not yet written to pattern memory
+        self._pending: List[Dict[str, Any]] = []
         
         # Track entity usage frequency
         self._entity_usage: Counter = Counter()
@@ -58,17 +65,38 @@ class UserPreferenceTracker:
             self._entity_usage[entity] += 1
         
         # Track filter patterns
-        if intent.filters:
-            filter_dict = {f.field: f.value for f in intent.filters}
-            self._filter_usage[intent.query_type].append(filter_dict)
+        filters = {f.field: f.value for f in intent.filters}
+        if filters:
+            self._filter_usage[intent.query_type].append(dict(filters))
         
-        # Record pattern in memory
-        await self.pattern_memory.record_pattern(
-            query_type=intent.query_type,
-            entities=intent.entities,
-            filters={f.field: f.value for f in intent.filters},
-            success=user_satisfied
-        )
+        # Record pattern in memory, directly or via the batch buffer
+        if self.batch_size <= 1:
+            await self.pattern_memory.record_pattern(
+                query_type=intent.query_type,
+                entities=intent.entities,
+                filters=filters,
+                success=user_satisfied
+            )
+            return
+        
+        self._pending.append({
+            "query_type": intent.query_type,
+            "entities": intent.entities,
+            "filters": filters,
+            "success": user_satisfied,
+        })
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """
+        Write buffered pattern recordings to pattern memory in one batch.
+        """
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, []
+        await self.pattern_memory.record_patterns_batch(pending)
     
     async def get_preferred_filters(
         self,
@@ -78,6 +106,11 @@ class UserPreferenceTracker:
         """
         Get commonly used filters for a query type.
         
+        Reads do not flush the batch buffer (the classifier reads on every
+        query, which would reduce batches to single writes), so with
+        batching enabled the result lags by at most batch_size - 1
+        recordings.
+        
         Args:
             query_type: Type of query
             min_frequency: Minimum usage frequency
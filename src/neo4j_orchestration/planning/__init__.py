@@ -14,9 +14,9 @@ from .intent import (
     QueryIntent,
 )
 
-from .classifier import QueryIntentClassifier
+from .classifier import QueryIntentClassifier, get_default_classifier
 
-from .generator import CypherQueryGenerator, generate_cypher
+from .generator import CypherQueryGenerator, generate_cypher, get_default_generator
 
 __all__ = [
     # Intent types
@@ -29,7 +29,9 @@ __all__ = [
     "QueryIntent",
     # Classifier
     "QueryIntentClassifier",
+    "get_default_classifier",
     # Generator
     "CypherQueryGenerator",
     "generate_cypher",
+    "get_default_generator",
 ]
@@ -5,6 +5,7 @@ Analyzes natural language queries and classifies their intent
 for routing to appropriate query execution strategies.
 """
 
+import functools
 import re
 from typing import Dict, List, Optional, Tuple, Set
 
@@ -19,6 +20,19 @@ from .intent import (
 )
 
 
+# Fixed regexes used by sorting/limit extraction, compiled once at import
+_SORT_KEYWORD_RE = re.compile(r'\b(sort(ed)?|order(ed)?)\s+(by|on)\b', re.IGNORECASE)
+_SORT_FIELD_RE = re.compile(
+    r'\b(?:sort(?:ed)?|order(?:ed)?)\s+(?:by|on)\s+(\w+)',
+    re.IGNORECASE
+)
+_SORT_DESC_RE = re.compile(r'\b(descending|desc|highest|most)\b', re.IGNORECASE)
+_LIMIT_RE = re.compile(r'\b(?:top|first|limit)\s+(\d+)\b', re.IGNORECASE)
+
+# Compiled pattern tables per classifier class (see _compile_patterns)
+_COMPILED_PATTERNS: Dict[type, Tuple] = {}
+
+
 class QueryIntentClassifier:
     """
     Classifies natural language queries into structured query intents.
@@ -36,25 +50,94 @@ class QueryIntentClassifier:
         QueryType.VENDOR_RISK
     """
     
+    # Maximum number of distinct normalized queries kept by classify()
+    CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the classifier with pattern definitions."""
-        self._query_patterns = self._build_query_patterns()
-        self._entity_keywords = self._build_entity_keywords()
-        self._filter_patterns = self._build_filter_patterns()
-        self._aggregation_keywords = self._build_aggregation_keywords()
+        compiled = _COMPILED_PATTERNS.get(type(self))
+        if compiled is None:
+            compiled = self._compile_patterns()
+            _COMPILED_PATTERNS[type(self)] = compiled
+        (
+            self._query_patterns,
+            self._entity_patterns,
+            self._filter_patterns,
+            self._aggregation_patterns,
+        ) = compiled
+        
+        # Classification is a pure function of the normalized text
+        self._classify_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._classify_normalized
+        )
+    
+    def _compile_patterns(self) -> Tuple:
+        """
+        Compile the pattern definitions into ``re.Pattern`` tables.
+        
+        Runs once per classifier class; later instances reuse the tables.
+        Each entity's keywords are folded into a single alternation so
+        entity extraction is one search per entity type.
+        
+        Returns:
+            Tuple of (query_patterns, entity_patterns, filter_patterns,
+            aggregation_patterns)
+        """
+        # Highest confidence first (stable, so ties keep definition order);
+        # the first match is then the best one
+        query_patterns = sorted(
+            (
+                (query_type, re.compile(pattern, re.IGNORECASE), confidence)
+                for query_type, patterns in self._build_query_patterns().items()
+                for pattern, confidence in patterns
+            ),
+            key=lambda entry: -entry[2]
+        )
+        
+        entity_patterns = [
+            (
+                entity_type,
+                re.compile(r'\b(?:' + '|'.join(keywords) + r')\b', re.IGNORECASE)
+            )
+            for entity_type, keywords in self._build_entity_keywords().items()
+        ]
+        
+        filter_patterns = []
+        for pattern_info in self._build_filter_patterns():
+            compiled_info = dict(pattern_info)
+            compiled_info["patterns"] = [
+                (re.compile(pattern, re.IGNORECASE), value)
+                for pattern, value in pattern_info["patterns"]
+            ]
+            filter_patterns.append(compiled_info)
+        
+        aggregation_patterns = [
+            (agg_type, keyword, re.compile(r'\b' + keyword + r'\b', re.IGNORECASE))
+            for agg_type, keywords in self._build_aggregation_keywords().items()
+            for keyword in keywords
+        ]
+        
+        return query_patterns, entity_patterns, filter_patterns, aggregation_patterns
     
     def classify(self, query: str) -> QueryIntent:
         """
         Classify a natural language query into structured intent.
         
+        Results are memoized on the lower-cased, stripped query text; each
+        call still returns its own QueryIntent so callers may mutate it.
+        
         Args:
             query: Natural language query string
             
         Returns:
             QueryIntent object with classified components
         """
-        query_lower = query.lower().strip()
+        cached: QueryIntent = self._classify_cached(query.lower().strip())
         
+        return cached._copy(metadata={"original_query": query})
+    
+    def _classify_normalized(self, query_lower: str) -> QueryIntent:
+        """Classify an already lower-cased, stripped query (uncached)."""
         # Step 1: Determine query type
         query_type, confidence = self._classify_query_type(query_lower)
         
@@ -74,8 +157,8 @@ class QueryIntentClassifier:
         # Step 6: Check for relationship inclusion
         include_relationships = self._check_relationships(query_lower)
         
-        # Create query intent
-        intent = QueryIntent(
+        # Create query intent (all components are already enum-typed)
+        return QueryIntent._fast(
             query_type=query_type,
             entities=entities,
             filters=filters,
@@ -84,11 +167,8 @@ class QueryIntentClassifier:
             sort_order=sort_order,
             limit=limit,
             include_relationships=include_relationships,
-            confidence=confidence,
-            metadata={"original_query": query}
+            confidence=confidence
         )
-        
-        return intent
     
     def _classify_query_type(self, query: str) -> Tuple[QueryType, float]:
         """
@@ -97,31 +177,23 @@ class QueryIntentClassifier:
         Returns:
             Tuple of (QueryType, confidence_score)
         """
-        best_match = QueryType.UNKNOWN
-        best_confidence = 0.5
-        
-        for query_type, patterns in self._query_patterns.items():
-            for pattern, confidence in patterns:
-                if re.search(pattern, query, re.IGNORECASE):
-                    if confidence > best_confidence:
-                        best_match = query_type
-                        best_confidence = confidence
+        # Patterns are sorted by descending confidence, so stop at the
+        # first hit; anything at or below the 0.5 floor can never win
+        for query_type, pattern, confidence in self._query_patterns:
+            if confidence <= 0.5:
+                break
+            if pattern.search(query):
+                return query_type, confidence
         
-        return best_match, best_confidence
+        return QueryType.UNKNOWN, 0.5
     
     def _extract_entities(self, query: str) -> List[EntityType]:
         """Extract entity types mentioned in the query."""
-        entities = []
-        seen = set()
-        
-        for entity_type, keywords in self._entity_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + keyword + r'\b', query, re.IGNORECASE):
-                    if entity_type not in seen:
-                        entities.append(entity_type)
-                        seen.add(entity_type)
-        
-        return entities
+        return [
+            entity_type
+            for entity_type, pattern in self._entity_patterns
+            if pattern.search(query)
+        ]
     
     def _extract_filters(
         self,
@@ -139,8 +211,7 @@ class QueryIntentClassifier:
             entity_type = pattern_info.get("entity_type")
             
             for pattern, value in patterns:
-                match = re.search(pattern, query, re.IGNORECASE)
-                if match:
+                if pattern.search(query):
                     # Convert value based on type
                     if value_type == "boolean":
                         filter_value = value
@@ -149,7 +220,7 @@ class QueryIntentClassifier:
                     else:
                         filter_value = value
                     
-                    filters.append(FilterCondition(
+                    filters.append(FilterCondition._fast(
                         field=field,
                         operator=operator,
                         value=filter_value,
@@ -162,20 +233,19 @@ class QueryIntentClassifier:
         """Extract aggregation operations from the query."""
         aggregations = []
         
-        for agg_type, keywords in self._aggregation_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + keyword + r'\b', query, re.IGNORECASE):
-                    # Determine field based on context
-                    field = None
-                    if agg_type != AggregationType.COUNT:
-                        # Try to extract field name
-                        field = self._extract_aggregation_field(query, keyword)
-                    
-                    aggregations.append(Aggregation(
-                        type=agg_type,
-                        field=field,
-                        alias=f"{agg_type.value}_result"
-                    ))
+        for agg_type, keyword, pattern in self._aggregation_patterns:
+            if pattern.search(query):
+                # Determine field based on context
+                field = None
+                if agg_type != AggregationType.COUNT:
+                    # Try to extract field name
+                    field = self._extract_aggregation_field(query, keyword)
+                
+                aggregations.append(Aggregation(
+                    type=agg_type,
+                    field=field,
+                    alias=f"{agg_type.value}_result"
+                ))
         
         return aggregations if aggregations else None
     
@@ -196,18 +266,14 @@ class QueryIntentClassifier:
         sort_order = "ASC"
         
         # Check for sorting keywords
-        if re.search(r'\b(sort(ed)?|order(ed)?)\s+(by|on)\b', query, re.IGNORECASE):
+        if _SORT_KEYWORD_RE.search(query):
             # Extract sort field
-            sort_match = re.search(
-                r'\b(?:sort(?:ed)?|order(?:ed)?)\s+(?:by|on)\s+(\w+)',
-                query,
-                re.IGNORECASE
-            )
+            sort_match = _SORT_FIELD_RE.search(query)
             if sort_match:
                 sort_by = sort_match.group(1)
         
         # Check for order direction
-        if re.search(r'\b(descending|desc|highest|most)\b', query, re.IGNORECASE):
+        if _SORT_DESC_RE.search(query):
             sort_order = "DESC"
         
         return sort_by, sort_order
@@ -215,11 +281,7 @@ class QueryIntentClassifier:
     def _extract_limit(self, query: str) -> Optional[int]:
         """Extract result limit from the query."""
         # Look for "top N", "first N", "limit N"
-        limit_match = re.search(
-            r'\b(?:top|first|limit)\s+(\d+)\b',
-            query,
-            re.IGNORECASE
-        )
+        limit_match = _LIMIT_RE.search(query)
         
         if limit_match:
             return int(limit_match.group(1))
@@ -428,3 +490,18 @@ class QueryIntentClassifier:
             AggregationType.MIN: ["minimum", "min", "lowest", "least"],
             AggregationType.GROUP_BY: ["group by", "grouped by", "by category"],
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_classifier() -> QueryIntentClassifier:
+    """
+    Return the process-wide shared QueryIntentClassifier.
+    
+    Safe to share: classify() returns a fresh QueryIntent on every call,
+    so callers never see each other's mutations, and they all benefit
+    from the same result cache.
+    
+    Returns:
+        Shared QueryIntentClassifier instance
+    """
+    return QueryIntentClassifier()
@@ -5,6 +5,8 @@ Converts QueryIntent objects into executable Cypher queries using
 template-based generation with parameter binding.
 """
 
+import functools
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 from .intent import (
     QueryIntent,
@@ -17,18 +19,57 @@ from .intent import (
 )
 
 
+# Cypher predicate templates keyed by filter operator
+_FILTER_TEMPLATES: Dict[FilterOperator, str] = {
+    FilterOperator.EQUALS: "{field} = ${param}",
+    FilterOperator.NOT_EQUALS: "{field} <> ${param}",
+    FilterOperator.GREATER_THAN: "{field} > ${param}",
+    FilterOperator.LESS_THAN: "{field} < ${param}",
+    FilterOperator.GREATER_EQUAL: "{field} >= ${param}",
+    FilterOperator.LESS_EQUAL: "{field} <= ${param}",
+    FilterOperator.CONTAINS: "{field} CONTAINS ${param}",
+    FilterOperator.STARTS_WITH: "{field} STARTS WITH ${param}",
+    FilterOperator.ENDS_WITH: "{field} ENDS WITH ${param}",
+    FilterOperator.IN: "{field} IN ${param}",
+    FilterOperator.NOT_IN: "NOT {field} IN ${param}",
+}
+
+# Relative evaluation cost per operator; cheaper predicates are emitted
+# first so equality/range checks prune rows before string matching
+_OP_COST: Dict[FilterOperator, int] = {
+    FilterOperator.EQUALS: 0,
+    FilterOperator.NOT_EQUALS: 1,
+    FilterOperator.GREATER_THAN: 1,
+    FilterOperator.LESS_THAN: 1,
+    FilterOperator.GREATER_EQUAL: 1,
+    FilterOperator.LESS_EQUAL: 1,
+    FilterOperator.IN: 2,
+    FilterOperator.NOT_IN: 2,
+    FilterOperator.STARTS_WITH: 3,
+    FilterOperator.ENDS_WITH: 3,
+    FilterOperator.CONTAINS: 4,
+}
+
+# Maximum number of query shapes memoized per generator
+_QUERY_CACHE_SIZE = 512
+
 class CypherQueryGenerator:
     """
     Generates Cypher queries from QueryIntent objects.
     
     Uses template-based generation with parameter binding for
-    safety and performance.
+    safety and performance. Instances may be shared across threads
+    (see get_default_generator); the render cache is updated under a lock.
     """
     
     def __init__(self):
         """Initialize the Cypher query generator."""
         self.templates = self._build_query_templates()
         self.entity_labels = self._build_entity_label_map()
+        
+        # Query shape -> (cypher, ((param_name, filter_index), ...))
+        self._query_cache: Dict[Tuple, Tuple[str, Tuple[Tuple[str, int], ...]]] = {}
+        self._cache_lock = threading.Lock()
     
     def generate(self, intent: QueryIntent) -> Tuple[str, Dict[str, Any]]:
         """
@@ -51,9 +92,46 @@ class CypherQueryGenerator:
         if not template:
             raise ValueError(f"No template found for {intent.query_type.value}")
         
-        # Build query components
-        match_clause = self._build_match_clause(intent)
-        where_clause = self._build_where_clause(intent)
+        # Intents of the same shape render the same Cypher; only the
+        # filter values differ, so a cache hit just rebinds parameters
+        shape = self._shape_key(intent)
+        cached = self._query_cache.get(shape)
+        if cached is None:
+            cached = self._render(intent)
+            with self._cache_lock:
+                if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+                    del self._query_cache[next(iter(self._query_cache))]
+                self._query_cache[shape] = cached
+        
+        query, bindings = cached
+        filters = intent.filters
+        return query, {name: filters[index].value for name, index in bindings}
+    
+    @staticmethod
+    def _shape_key(intent: QueryIntent) -> Tuple:
+        """Hashable key of everything except filter values that affects the Cypher."""
+        return (
+            intent.get_primary_entity(),
+            tuple((f.field, f.operator) for f in intent.filters),
+            tuple((a.type, a.field, a.alias) for a in intent.aggregations or ()),
+            tuple(intent.projection) if intent.projection else None,
+            intent.sort_by,
+            intent.sort_order,
+            intent.limit,
+            intent.include_relationships,
+        )
+    
+    def _render(self, intent: QueryIntent) -> Tuple[str, Tuple[Tuple[str, int], ...]]:
+        """
+        Render the Cypher text for an intent's shape.
+        
+        Returns:
+            Tuple of (cypher_query, bindings) where bindings pairs each
+            parameter name with the index of the filter supplying its value
+        """
+        # Build query components (filters and parameters in one pass)
+        inline_properties, where_clause, bindings = self._build_filters(intent)
+        match_clause = self._build_match_clause(intent, inline_properties)
         return_clause = self._build_return_clause(intent)
         
         # Build optional clauses
@@ -70,12 +148,28 @@ class CypherQueryGenerator:
         if limit_clause:
             query_parts.append(limit_clause)
         
-        query = "\n".join(query_parts)
+        return "\n".join(query_parts), bindings
+    
+    def generate_many(
+        self,
+        intents: List[QueryIntent]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Generate Cypher queries for a batch of intents.
         
-        # Extract parameters
-        parameters = self._extract_parameters(intent)
+        Each result carries its own parameter dict, as from generate().
         
-        return query, parameters
+        Args:
+            intents: Classified query intents
+            
+        Returns:
+            List of (cypher_query, parameters) in input order
+            
+        Raises:
+            ValueError: If any query type is not supported
+        """
+        generate = self.generate
+        return [generate(intent) for intent in intents]
     
     def _build_query_templates(self) -> Dict[QueryType, str]:
         """
@@ -127,8 +221,16 @@ class CypherQueryGenerator:
             EntityType.TECHNOLOGY: "Technology",
         }
     
-    def _build_match_clause(self, intent: QueryIntent) -> str:
-        """Build MATCH clause based on query type and entities."""
+    def _build_match_clause(self, intent: QueryIntent, inline_properties: str = "") -> str:
+        """
+        Build MATCH clause based on query type and entities.
+        
+        Args:
+            intent: The query intent
+            inline_properties: Equality predicates rendered as a property
+                map body (e.g. ``"status: $status"``), pushed into the node
+                pattern so Neo4j can use a label+property index seek
+        """
         primary_entity = intent.get_primary_entity()
         if not primary_entity:
             raise ValueError("Query intent must have at least one entity")
@@ -137,7 +239,10 @@ class CypherQueryGenerator:
         var = label[0].lower()  # Use first letter as variable
         
         # Build basic MATCH
-        match = f"MATCH ({var}:{label})"
+        if inline_properties:
+            match = f"MATCH ({var}:{label} {{{inline_properties}}})"
+        else:
+            match = f"MATCH ({var}:{label})"
         
         # Add relationships if needed
         if intent.include_relationships:
@@ -151,56 +256,81 @@ class CypherQueryGenerator:
         # For now, return basic match
         return match
     
-    def _build_where_clause(self, intent: QueryIntent) -> str:
-        """Build WHERE clause from filters."""
+    def _build_filters(
+        self,
+        intent: QueryIntent
+    ) -> Tuple[str, str, Tuple[Tuple[str, int], ...]]:
+        """
+        Build filter predicates and parameter bindings in one pass.
+        
+        The first equality filter on each field is inlined into the MATCH
+        node pattern; everything else goes to the WHERE clause. Repeated
+        fields get suffixed parameter names (``field``, ``field_2``, ...)
+        so range filters such as ``created_at > X AND created_at < Y``
+        keep both values.
+        
+        WHERE conditions are ordered by operator cost (range, list
+        membership, then string matching); ties keep insertion order.
+        
+        Returns:
+            Tuple of (inline_properties, where_clause, bindings), where
+            bindings maps each parameter name to its index in intent.filters
+        """
         if not intent.has_filters():
-            return ""
+            return "", "", ()
         
+        inline = []
         conditions = []
+        bindings: List[Tuple[str, int]] = []
+        used: set = set()
+        occurrences: Dict[str, int] = {}
         primary_entity = intent.get_primary_entity()
+        if not primary_entity:
+            raise ValueError("Query intent must have at least one entity")
         var = self.entity_labels[primary_entity][0].lower()
         
-        for filter_cond in intent.filters:
-            condition = self._build_filter_condition(var, filter_cond)
-            conditions.append(condition)
+        filters = intent.filters
+        ordered = sorted(
+            range(len(filters)),
+            key=lambda i: _OP_COST.get(filters[i].operator, 5)
+        )
+        for index in ordered:
+            filter_cond = filters[index]
+            field = filter_cond.field
+            count = occurrences.get(field, 0) + 1
+            param_name = field if count == 1 else f"{field}_{count}"
+            while param_name in used:
+                count += 1
+                param_name = f"{field}_{count}"
+            occurrences[field] = count
+            used.add(param_name)
+            
+            bindings.append((param_name, index))
+            if filter_cond.operator == FilterOperator.EQUALS and param_name == field:
+                inline.append(f"{field}: ${param_name}")
+            else:
+                conditions.append(
+                    self._build_filter_condition(var, filter_cond, param_name)
+                )
         
-        if conditions:
-            return "WHERE " + " AND ".join(conditions)
-        return ""
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return ", ".join(inline), where_clause, tuple(bindings)
     
     def _build_filter_condition(
         self, 
         var: str, 
-        filter_cond: FilterCondition
+        filter_cond: FilterCondition,
+        param_name: Optional[str] = None
     ) -> str:
         """Build a single filter condition."""
-        field = f"{var}.{filter_cond.field}"
-        param_name = f"{filter_cond.field}"
-        
-        if filter_cond.operator == FilterOperator.EQUALS:
-            return f"{field} = ${param_name}"
-        elif filter_cond.operator == FilterOperator.NOT_EQUALS:
-            return f"{field} <> ${param_name}"
-        elif filter_cond.operator == FilterOperator.GREATER_THAN:
-            return f"{field} > ${param_name}"
-        elif filter_cond.operator == FilterOperator.LESS_THAN:
-            return f"{field} < ${param_name}"
-        elif filter_cond.operator == FilterOperator.GREATER_EQUAL:
-            return f"{field} >= ${param_name}"
-        elif filter_cond.operator == FilterOperator.LESS_EQUAL:
-            return f"{field} <= ${param_name}"
-        elif filter_cond.operator == FilterOperator.CONTAINS:
-            return f"{field} CONTAINS ${param_name}"
-        elif filter_cond.operator == FilterOperator.STARTS_WITH:
-            return f"{field} STARTS WITH ${param_name}"
-        elif filter_cond.operator == FilterOperator.ENDS_WITH:
-            return f"{field} ENDS WITH ${param_name}"
-        elif filter_cond.operator == FilterOperator.IN:
-            return f"{field} IN ${param_name}"
-        elif filter_cond.operator == FilterOperator.NOT_IN:
-            return f"NOT {field} IN ${param_name}"
-        else:
+        template = _FILTER_TEMPLATES.get(filter_cond.operator)
+        if template is None:
             raise ValueError(f"Unsupported operator: {filter_cond.operator}")
+        
+        return template.format(
+            field=f"{var}.{filter_cond.field}",
+            param=param_name or filter_cond.field
+        )
     
     def _build_return_clause(self, intent: QueryIntent) -> str:
         """Build RETURN clause based on aggregations and query type."""
@@ -210,6 +340,10 @@ class CypherQueryGenerator:
         if intent.has_aggregations():
             return self._build_aggregation_return(var, intent)
         
+        # Project only the requested properties instead of whole nodes
+        if intent.projection:
+            return "RETURN " + ", ".join(f"{var}.{p}" for p in intent.projection)
+        
         # Default return for different query types
         return f"RETURN {var}"
     
@@ -254,15 +388,20 @@ class CypherQueryGenerator:
             return ""
         
         return f"LIMIT {intent.limit}"
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_generator() -> CypherQueryGenerator:
+    """
+    Return the process-wide shared CypherQueryGenerator.
     
-    def _extract_parameters(self, intent: QueryIntent) -> Dict[str, Any]:
-        """Extract query parameters from intent."""
-        parameters = {}
-        
-        for filter_cond in intent.filters:
-            parameters[filter_cond.field] = filter_cond.value
-        
-        return parameters
+    Safe to share: generate() returns a fresh parameter dict on every
+    call, and the render cache is only updated under the instance lock.
+    
+    Returns:
+        Shared CypherQueryGenerator instance
+    """
+    return CypherQueryGenerator()
 
 
 def generate_cypher(intent: QueryIntent) -> Tuple[str, Dict[str, Any]]:
@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Any
 
+from neo4j_orchestration.utils.slots import add_slots
+
 
 class QueryType(Enum):
     """Generic query operation types for knowledge graph queries."""
@@ -94,9 +96,27 @@ class FilterOperator(Enum):
     NOT_IN = "NOT IN"
 
 
-@dataclass
+# Precomputed enum values for serialization hot paths (a dict lookup is
+# cheaper than the Enum ``.value`` descriptor)
+_QUERY_TYPE_VALUES = {m: m.value for m in QueryType}
+_ENTITY_TYPE_VALUES = {m: m.value for m in EntityType}
+
+# Name -> member tables for deserializing stored intents; a dict lookup
+# skips ``EnumMeta.__getitem__`` and returns None instead of raising
+QUERY_TYPES_BY_NAME: Dict[str, QueryType] = {m.name: m for m in QueryType}
+ENTITY_TYPES_BY_NAME: Dict[str, EntityType] = {m.name: m for m in EntityType}
+_AGGREGATION_TYPE_VALUES = {m: m.value for m in AggregationType}
+_FILTER_OP_VALUES = {m: m.value for m in FilterOperator}
+
+
+@add_slots
+@dataclass(frozen=True)
 class FilterCondition:
-    """Represents a single filter condition."""
+    """Represents a single filter condition.
+    
+    Immutable so conditions can be shared between cached intents and
+    used as dict/set keys (when ``value`` itself is hashable).
+    """
     
     field: str
     operator: FilterOperator
@@ -109,9 +129,33 @@ class FilterCondition:
             raise ValueError("Filter field cannot be empty")
         
         if isinstance(self.operator, str):
-            self.operator = FilterOperator(self.operator)
+            # Direct value-map hit; Enum.__call__ only for the error path
+            object.__setattr__(
+                self,
+                "operator",
+                FilterOperator._value2member_map_.get(self.operator)
+                or FilterOperator(self.operator)
+            )
+    
+    @classmethod
+    def _fast(
+        cls,
+        field: str,
+        operator: FilterOperator,
+        value: Any,
+        entity_type: Optional[EntityType] = None
+    ) -> "FilterCondition":
+        """Build a filter from already-validated enum members, skipping __post_init__."""
+        obj = cls.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "field", field)
+        setattr_(obj, "operator", operator)
+        setattr_(obj, "value", value)
+        setattr_(obj, "entity_type", entity_type)
+        return obj
 
 
+@add_slots
 @dataclass
 class Aggregation:
     """Represents an aggregation operation."""
@@ -124,12 +168,32 @@ class Aggregation:
     def __post_init__(self):
         """Validate aggregation."""
         if isinstance(self.type, str):
-            self.type = AggregationType(self.type)
+            self.type = (
+                AggregationType._value2member_map_.get(self.type)
+                or AggregationType(self.type)
+            )
         
         if self.type != AggregationType.COUNT and not self.field:
             raise ValueError(f"Aggregation type {self.type} requires a field")
+    
+    @classmethod
+    def _fast(
+        cls,
+        type: AggregationType,
+        field: Optional[str] = None,
+        alias: Optional[str] = None,
+        group_by: Optional[List[str]] = None
+    ) -> "Aggregation":
+        """Build an aggregation from already-validated values, skipping __post_init__."""
+        obj = cls.__new__(cls)
+        obj.type = type
+        obj.field = field
+        obj.alias = alias
+        obj.group_by = group_by
+        return obj
 
 
+@add_slots
 @dataclass
 class QueryIntent:
     """
@@ -149,15 +213,20 @@ class QueryIntent:
     include_relationships: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 1.0
+    projection: Optional[List[str]] = None
     
     def __post_init__(self):
         """Validate query intent."""
         if isinstance(self.query_type, str):
-            self.query_type = QueryType(self.query_type)
+            self.query_type = (
+                QueryType._value2member_map_.get(self.query_type)
+                or QueryType(self.query_type)
+            )
         
         # Convert entity strings to EntityType enums
+        entity_values = EntityType._value2member_map_
         self.entities = [
-            EntityType(e) if isinstance(e, str) else e
+            (entity_values.get(e) or EntityType(e)) if isinstance(e, str) else e
             for e in self.entities
         ]
         
@@ -169,6 +238,63 @@ class QueryIntent:
         if self.sort_order not in ["ASC", "DESC"]:
             raise ValueError("Sort order must be 'ASC' or 'DESC'")
     
+    @classmethod
+    def _fast(
+        cls,
+        query_type: QueryType,
+        entities: List[EntityType],
+        filters: List[FilterCondition],
+        aggregations: Optional[List[Aggregation]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "ASC",
+        limit: Optional[int] = None,
+        include_relationships: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+        confidence: float = 1.0,
+        projection: Optional[List[str]] = None
+    ) -> "QueryIntent":
+        """
+        Build an intent from already-validated values, skipping __post_init__.
+        
+        For internal callers (e.g. the classifier) that only pass enum
+        members and in-range values.
+        """
+        obj = cls.__new__(cls)
+        obj.query_type = query_type
+        obj.entities = entities
+        obj.filters = filters
+        obj.aggregations = aggregations
+        obj.sort_by = sort_by
+        obj.sort_order = sort_order
+        obj.limit = limit
+        obj.include_relationships = include_relationships
+        obj.metadata = metadata if metadata is not None else {}
+        obj.confidence = confidence
+        obj.projection = projection
+        return obj
+    
+    def _copy(self, metadata: Optional[Dict[str, Any]] = None) -> "QueryIntent":
+        """
+        Return a copy whose lists and metadata can be mutated independently.
+        
+        Used by memoizing classifiers to hand out cached intents safely.
+        """
+        return QueryIntent._fast(
+            query_type=self.query_type,
+            entities=list(self.entities),
+            filters=list(self.filters),
+            aggregations=(
+                list(self.aggregations) if self.aggregations is not None else None
+            ),
+            sort_by=self.sort_by,
+            sort_order=self.sort_order,
+            limit=self.limit,
+            include_relationships=self.include_relationships,
+            metadata=dict(self.metadata) if metadata is None else metadata,
+            confidence=self.confidence,
+            projection=list(self.projection) if self.projection is not None else None
+        )
+    
     def add_filter(
         self,
         field: str,
@@ -209,22 +335,27 @@ class QueryIntent:
         return self.aggregations is not None and len(self.aggregations) > 0
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert query intent to dictionary."""
+        """
+        Convert query intent to dictionary.
+        
+        Not cached: callers assign fields and mutate lists and metadata
+        in place, so each call reflects the intent's current state.
+        """
         return {
-            "query_type": self.query_type.value,
-            "entities": [e.value for e in self.entities],
+            "query_type": _QUERY_TYPE_VALUES[self.query_type],
+            "entities": [_ENTITY_TYPE_VALUES[e] for e in self.entities],
             "filters": [
                 {
                     "field": f.field,
-                    "operator": f.operator.value,
+                    "operator": _FILTER_OP_VALUES[f.operator],
                     "value": f.value,
-                    "entity_type": f.entity_type.value if f.entity_type else None
+                    "entity_type": _ENTITY_TYPE_VALUES[f.entity_type] if f.entity_type else None
                 }
                 for f in self.filters
             ],
             "aggregations": [
                 {
-                    "type": a.type.value,
+                    "type": _AGGREGATION_TYPE_VALUES[a.type],
                     "field": a.field,
                     "alias": a.alias,
                     "group_by": a.group_by
@@ -236,5 +367,6 @@ class QueryIntent:
             "limit": self.limit,
             "include_relationships": self.include_relationships,
             "metadata": self.metadata,
-            "confidence": self.confidence
+            "confidence": self.confidence,
+            "projection": self.projection
         }
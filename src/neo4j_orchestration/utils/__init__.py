@@ -15,6 +15,7 @@ from neo4j_orchestration.utils.cypher import (
     get_template,
     TEMPLATES,
 )
+from neo4j_orchestration.utils.slots import add_slots
 
 __all__ = [
     # Logging
@@ -30,4 +31,6 @@ __all__ = [
     "sanitize_node_label",
     "get_template",
     "TEMPLATES",
+    # Dataclasses
+    "add_slots",
 ]
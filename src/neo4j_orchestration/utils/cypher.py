@@ -2,7 +2,15 @@
 Cypher query utilities and templates.
 """
 
-from typing import Any, Dict, List, Optional
+import re
+import string
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Anything str.isalnum() rejects: \W is the Unicode complement of
+# alnum-or-underscore, so underscore is added back explicitly
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
 
 
 def build_match_clause(
@@ -56,7 +64,7 @@ def sanitize_node_label(label: str) -> str:
     Returns:
         Sanitized label
     """
-    return ''.join(c for c in label if c.isalnum())
+    return _NON_ALNUM_RE.sub('', label)
 
 
 # Query templates
@@ -81,6 +89,65 @@ TEMPLATES = {
     """,
 }
 
+# Strip once at load so formatting never has to
+TEMPLATES = {name: template.strip() for name, template in TEMPLATES.items()}
+
+
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Pre-parse a format string into (literal, field_name) segments.
+    
+    Returns None for templates using conversions, format specs or
+    attribute/index lookups, which are left to str.format.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+_COMPILED_TEMPLATES = {name: _compile_template(t) for name, t in TEMPLATES.items()}
+
+# Node labels of the knowledge graph. Mirrors planning.EntityType values;
+# kept as a literal because utils sits below planning and must not import
+# it (tests/unit/utils/test_cypher.py checks the two stay in sync)
+_ENTITY_LABELS = (
+    "Vendor", "Control", "Regulation", "Risk",
+    "Issue", "Assessment", "BusinessUnit", "Technology",
+)
+
+# Fully formatted output for every template whose only variable is {label}
+_PREBUILT: Dict[Tuple[str, str], str] = {
+    (name, label): TEMPLATES[name].format(label=label)
+    for name, segments in _COMPILED_TEMPLATES.items()
+    if segments is not None
+    and {f for _, f in segments if f is not None} == {"label"}
+    for label in _ENTITY_LABELS
+}
+
+
+@lru_cache(maxsize=256)
+def _format_template(template_name: str, kwargs_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Format a template; cached per (template_name, kwargs) pair."""
+    return _render(template_name, dict(kwargs_items))
+
+
+def _render(template_name: str, kwargs: Dict[str, Any]) -> str:
+    """Substitute kwargs into a template using its pre-parsed segments."""
+    segments = _COMPILED_TEMPLATES.get(template_name)
+    if segments is None:
+        return TEMPLATES[template_name].format(**kwargs)
+    
+    parts = []
+    for literal, field_name in segments:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(str(kwargs[field_name]))
+    return "".join(parts)
+
 
 def get_template(template_name: str, **kwargs) -> str:
     """Get and format query template
@@ -92,11 +159,19 @@ def get_template(template_name: str, **kwargs) -> str:
     Returns:
         Formatted Cypher query
     """
-    template = TEMPLATES.get(template_name)
-    if not template:
+    if template_name not in TEMPLATES:
         raise ValueError(f"Unknown template: {template_name}")
     
-    return template.format(**kwargs).strip()
+    if len(kwargs) == 1 and isinstance(kwargs.get("label"), str):
+        prebuilt = _PREBUILT.get((template_name, kwargs["label"]))
+        if prebuilt is not None:
+            return prebuilt
+    
+    try:
+        return _format_template(template_name, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # Unhashable template variables cannot be cached
+        return _render(template_name, kwargs)
 
 
 __all__ = [
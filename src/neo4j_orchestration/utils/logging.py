@@ -2,8 +2,10 @@
 Logging utilities for consistent logging across framework.
 """
 
+import functools
 import logging
 import sys
+from time import perf_counter_ns
 from typing import Optional
 
 
@@ -19,6 +21,7 @@ DETAILED_FORMAT = (
 )
 
 
+@functools.cache
 def get_logger(
     name: str,
     level: str = "INFO",
@@ -32,7 +35,7 @@ def get_logger(
         detailed: Whether to include file/line numbers
     
     Returns:
-        Configured logger instance
+        Configured logger instance (cached per argument combination)
     """
     logger = logging.getLogger(name)
     
@@ -53,12 +56,13 @@ def get_logger(
 def log_execution_time(logger: logging.Logger):
     """Decorator to log function execution time"""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-            start = time.time()
+            start = perf_counter_ns()
             result = func(*args, **kwargs)
-            duration = time.time() - start
-            logger.info(f"{func.__name__} completed in {duration:.3f}s")
+            if logger.isEnabledFor(logging.INFO):
+                duration = (perf_counter_ns() - start) / 1e9
+                logger.info("%s completed in %.3fs", func.__name__, duration)
             return result
         return wrapper
     return decorator
@@ -0,0 +1,73 @@
+"""
+Slotted dataclass support for Python 3.9.
+
+``@dataclass(slots=True)`` needs Python 3.10, and a hand-written
+``__slots__`` conflicts with field defaults stored as class attributes.
+``add_slots`` rebuilds a dataclass with ``__slots__`` the same way 3.10's
+dataclass decorator does.
+"""
+
+from dataclasses import fields
+from typing import Any, Dict, Type, TypeVar, cast
+
+_T = TypeVar("_T")
+
+
+def _frozen_getstate(self: Any) -> Dict[str, Any]:
+    """Pickle/copy state of a frozen slotted dataclass."""
+    return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _frozen_setstate(self: Any, state: Dict[str, Any]) -> None:
+    """Restore state, bypassing the frozen ``__setattr__``."""
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def add_slots(cls: Type[_T]) -> Type[_T]:
+    """Return a copy of dataclass ``cls`` with ``__slots__`` for its fields.
+
+    Apply above ``@dataclass``:
+
+        >>> @add_slots
+        ... @dataclass(frozen=True)
+        ... class Point:
+        ...     x: int
+        ...     y: int = 0
+
+    Methods must not use zero-argument ``super()``, whose ``__class__``
+    cell would still point at the original class.
+
+    Args:
+        cls: Dataclass to rebuild
+
+    Returns:
+        New class with the same fields, methods and defaults but no
+        per-instance ``__dict__``
+
+    Raises:
+        TypeError: If ``cls`` already defines ``__slots__``
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+    dc: Any = cls
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(dc))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__; class attributes would
+        # shadow the slot descriptors
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    if dc.__dataclass_params__.frozen:
+        # Default slot pickling/copying restores state via setattr, which
+        # a frozen dataclass rejects
+        cls_dict["__getstate__"] = _frozen_getstate
+        cls_dict["__setstate__"] = _frozen_setstate
+
+    slotted = type(dc)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return cast(Type[_T], slotted)
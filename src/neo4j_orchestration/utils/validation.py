@@ -21,7 +21,12 @@ def validate_required_fields(
     Raises:
         ValidationError: If any required field is missing
     """
-    missing = [f for f in required_fields if f not in data]
+    if len(required_fields) < 5:
+        missing = [f for f in required_fields if f not in data]
+    else:
+        # Set difference runs in C; re-walk only to keep the caller's order
+        missing_set = set(required_fields).difference(data)
+        missing = [f for f in required_fields if f in missing_set]
     
     if missing:
         raise ValidationError(
@@ -0,0 +1,7 @@
+"""Assertion helpers for execution integration tests."""
+
+
+def assert_run(session, query, parameters):
+    """Assert ``session.run`` was called exactly once with (query, parameters)."""
+    assert session.run.call_count == 1
+    assert session.run.call_args.args == (query, parameters)
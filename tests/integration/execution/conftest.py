@@ -0,0 +1,117 @@
+"""
+Shared fixtures for execution integration tests.
+
+The Neo4j driver is replaced by ``MockGraphDatabase`` once per test
+module in this directory, so individual tests no longer need ``@patch``
+decorators. The patch is undone when each module finishes.
+"""
+
+import functools
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+from neo4j_orchestration.execution import Neo4jConfig
+from neo4j_orchestration.planning import QueryIntentClassifier, get_default_generator
+
+
+class _SessionCM:
+    """Concrete context manager handing out a fixed session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def __enter__(self):
+        return self.session
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_shared_session = MagicMock()
+
+_shared_driver = MagicMock()
+_shared_driver.verify_connectivity.return_value = None
+_shared_driver.session.return_value = _SessionCM(_shared_session)
+
+
+class FakeResult:
+    """Stand-in for ``neo4j.Result`` over a fixed list of records."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def consume(self):
+        return SimpleNamespace(counters=None)
+
+
+class MockGraphDatabase:
+    """Stand-in for ``neo4j.GraphDatabase`` returning the shared driver."""
+
+    @staticmethod
+    def driver(*args, **kwargs):
+        return _shared_driver
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _install_graph_database_mock():
+    """Patch the executor's GraphDatabase for the current test module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "neo4j_orchestration.execution.executor.GraphDatabase",
+            MockGraphDatabase,
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Create test configuration (immutable, shared across the session)."""
+    return Neo4jConfig(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="test",
+    )
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """Stateless intent classifier shared across the session."""
+    return QueryIntentClassifier()
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """Process-wide shared Cypher generator (caches rendered query shapes)."""
+    return get_default_generator()
+
+
+@pytest.fixture(scope="session")
+def cached_classify(classifier):
+    """Memoized ``classifier.classify`` keyed on the natural-language text.
+    
+    Intents are shared between callers, so tests must treat them as
+    read-only.
+    """
+    @functools.lru_cache(maxsize=256)
+    def _cached_classify(text):
+        return classifier.classify(text)
+    
+    return _cached_classify
+
+
+@pytest.fixture(scope="session")
+def make_result():
+    """Factory building a ``FakeResult`` from a list of records."""
+    return FakeResult
+
+
+@pytest.fixture
+def mock_session():
+    """Provide the shared mock session, clearing recorded calls afterwards."""
+    yield _shared_session
+    _shared_session.reset_mock()
@@ -1,37 +1,71 @@
 """Integration tests for query orchestration."""
 
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 from neo4j_orchestration.orchestration import QueryOrchestrator, OrchestratorConfig
-from neo4j_orchestration.execution import QueryExecutor, QueryResult, ExecutionMetadata
+from neo4j_orchestration.execution import QueryResult, ExecutionMetadata
 from neo4j_orchestration.planning.intent import QueryIntent, QueryType, EntityType
 from neo4j_orchestration.memory.episodic import SimpleEpisodicMemory
 
 
+_DEFAULT_RESULT = QueryResult(
+    records=[
+        {"name": "Vendor A", "risk_level": "high"},
+        {"name": "Vendor B", "risk_level": "medium"},
+    ],
+    metadata=ExecutionMetadata(
+        query="MATCH (v:Vendor) RETURN v",
+        parameters={},
+        result_available_after=15,
+        result_consumed_after=25,
+    ),
+    summary="Query completed successfully",
+)
+
+
+_VENDOR_QUERY = ("MATCH (v:Vendor) RETURN v", {})
+_RISK_QUERY = ("MATCH (v:Vendor {risk_level: $risk}) RETURN v", {"risk": "high"})
+
+
+def _check_end_to_end(results, history):
+    assert len(results[0].records) == 2
+    assert results[0].records[0]["risk_level"] == "high"
+    assert history[0].natural_language == "Show high-risk vendors"
+    assert history[0].success is True
+
+
+def _check_history_order(results, history):
+    assert [r.natural_language for r in history] == ["Query 3", "Query 2", "Query 1"]
+
+
+def _check_metadata(results, history):
+    last = history[0]
+    assert last.query_id is not None
+    assert last.cypher_query == _RISK_QUERY[0]
+    assert last.parameters == {"risk": "high"}
+    assert last.result_count == 2
+    assert last.execution_time_ms > 0
+
+
+def _check_entities(results, history):
+    assert [r.natural_language for r in history] == ["Show controls", "Show vendors"]
+
+
 class TestOrchestratorIntegration:
     """Integration tests for full orchestration pipeline."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_executor(self):
-        """Create a mock executor with realistic responses."""
-        executor = Mock(spec=QueryExecutor)
-        
-        result = QueryResult(
-            records=[
-                {"name": "Vendor A", "risk_level": "high"},
-                {"name": "Vendor B", "risk_level": "medium"},
-            ],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=15,
-                result_consumed_after=25,
-            ),
-            summary="Query completed successfully",
+        """Create a stub executor with realistic responses.
+        
+        A plain namespace rather than a Mock: no test asserts on executor
+        calls, so there is no need to record them.
+        """
+        return SimpleNamespace(
+            execute=lambda *args, **kwargs: _DEFAULT_RESULT,
+            close=lambda: None,
         )
-        executor.execute.return_value = result
-        
-        return executor
     
     @pytest.fixture
     def mock_intent(self):
@@ -42,105 +76,80 @@ class TestOrchestratorIntegration:
             filters=[],
         )
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_end_to_end_query_flow(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
-        """Test complete query flow from NL to results."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        # Create orchestrator
-        orchestrator = QueryOrchestrator(mock_executor)
-        
-        # Execute query
-        result = orchestrator.query("Show high-risk vendors")
-        
-        # Verify results
-        assert result is not None
-        assert len(result.records) == 2
-        assert result.records[0]["risk_level"] == "high"
-        
-        # Verify history
-        history = orchestrator.get_history()
-        assert len(history) == 1
-        assert history[0].natural_language == "Show high-risk vendors"
-        assert history[0].success is True
+    @pytest.fixture
+    def fresh_memory(self):
+        """Create an empty episodic memory for a single test."""
+        return SimpleEpisodicMemory()
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_query_history_persistence(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
-        """Test that query history is maintained across multiple queries."""
-        # Setup mocks
+    @pytest.fixture(autouse=True)
+    def patched_planner(self, monkeypatch, mock_intent):
+        """Swap the orchestrator's classifier and generator for mocks."""
         mock_classifier = Mock()
         mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
         mock_generator = Mock()
         mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
-        
-        # Execute multiple queries
-        orchestrator.query("Query 1")
-        orchestrator.query("Query 2")
-        orchestrator.query("Query 3")
         
-        # Verify all are in history
-        history = orchestrator.get_history(limit=10)
-        assert len(history) == 3
-        
-        # Verify order (most recent first)
-        assert history[0].natural_language == "Query 3"
-        assert history[1].natural_language == "Query 2"
-        assert history[2].natural_language == "Query 1"
-    
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_query_metadata_completeness(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
-        """Test that query metadata is properly captured."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = (
-            "MATCH (v:Vendor {risk_level: $risk}) RETURN v",
-            {"risk": "high"}
+        monkeypatch.setattr(
+            'neo4j_orchestration.orchestration.orchestrator.get_default_classifier',
+            lambda: mock_classifier,
         )
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
-        orchestrator.query("Show critical vendors")
-        
-        last = orchestrator.get_last_query()
-        
-        # Verify metadata
-        assert last.query_id is not None
-        assert last.cypher_query == "MATCH (v:Vendor {risk_level: $risk}) RETURN v"
-        assert last.parameters == {"risk": "high"}
-        assert last.result_count == 2
-        assert last.execution_time_ms > 0
+        monkeypatch.setattr(
+            'neo4j_orchestration.orchestration.orchestrator.get_default_generator',
+            lambda: mock_generator,
+        )
+        yield mock_classifier, mock_generator
+    
+    @pytest.fixture
+    def wired_orchestrator(self, mock_executor, patched_planner):
+        """Create an orchestrator wired to the mocked planner and executor."""
+        return QueryOrchestrator(mock_executor)
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_failed_query_handling(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    @pytest.mark.parametrize(
+        "queries, intents, generated, expected_history_len, check",
+        [
+            pytest.param(
+                ["Show high-risk vendors"], None, _VENDOR_QUERY, 1,
+                _check_end_to_end, id="end_to_end",
+            ),
+            pytest.param(
+                ["Query 1", "Query 2", "Query 3"], None, _VENDOR_QUERY, 3,
+                _check_history_order, id="history_order",
+            ),
+            pytest.param(
+                ["Show critical vendors"], None, _RISK_QUERY, 1,
+                _check_metadata, id="metadata",
+            ),
+            pytest.param(
+                ["Show vendors", "Show controls"],
+                [
+                    QueryIntent(query_type=QueryType.LIST, entities=[EntityType.VENDOR]),
+                    QueryIntent(query_type=QueryType.FILTER, entities=[EntityType.CONTROL]),
+                ],
+                ("MATCH (n) RETURN n", {}), 2,
+                _check_entities, id="different_entities",
+            ),
+        ],
+    )
+    def test_query_flow(
+        self, wired_orchestrator, patched_planner,
+        queries, intents, generated, expected_history_len, check,
+    ):
+        """Test NL queries flow through to results and history."""
+        mock_classifier, mock_generator = patched_planner
+        mock_generator.generate.return_value = generated
+        if intents is not None:
+            mock_classifier.classify.side_effect = intents
+        
+        results = [wired_orchestrator.query(q) for q in queries]
+        
+        history = wired_orchestrator.get_history(limit=10)
+        assert len(history) == expected_history_len
+        check(results, history)
+    
+    def test_failed_query_handling(self, patched_planner, mock_executor):
         """Test that failed queries are properly recorded."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
+        _, mock_generator = patched_planner
         mock_generator.generate.side_effect = Exception("Cypher generation failed")
-        mock_gen_class.return_value = mock_generator
         
         orchestrator = QueryOrchestrator(mock_executor)
         
@@ -155,55 +164,16 @@ class TestOrchestratorIntegration:
         assert "Cypher generation failed" in last.error_message
         assert last.result_count == 0
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_episodic_memory_integration(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_episodic_memory_integration(self, mock_executor, fresh_memory):
         """Test integration with episodic memory."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
         # Use explicit episodic memory
-        memory = SimpleEpisodicMemory()
-        orchestrator = QueryOrchestrator(mock_executor, episodic_memory=memory)
+        orchestrator = QueryOrchestrator(mock_executor, episodic_memory=fresh_memory)
         
         # Execute query
         orchestrator.query("Test query")
+        orchestrator.history.flush()
         
         # Verify memory contains query event
-        events = memory.retrieve_recent(event_type="query_executed", limit=10)
+        events = fresh_memory.retrieve_recent(event_type="query_executed", limit=10)
         assert len(events) == 1
         assert events[0].content["natural_language"] == "Test query"
-    
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_multiple_queries_different_entities(self, mock_gen_class, mock_clf_class, mock_executor):
-        """Test handling different entity types in history."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (n) RETURN n", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
-        
-        # Query different entities
-        vendor_intent = QueryIntent(query_type=QueryType.LIST, entities=[EntityType.VENDOR])
-        control_intent = QueryIntent(query_type=QueryType.FILTER, entities=[EntityType.CONTROL])
-        
-        mock_classifier.classify.return_value = vendor_intent
-        orchestrator.query("Show vendors")
-        
-        mock_classifier.classify.return_value = control_intent
-        orchestrator.query("Show controls")
-        
-        # Verify both in history
-        history = orchestrator.get_history(limit=10)
-        assert len(history) == 2
@@ -25,83 +25,143 @@ REFACTORING SCHEDULED: Week 5, Session 1 (~4 hours)
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import os
+import uuid
 from unittest.mock import Mock, patch
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase
 
 from neo4j_orchestration.orchestration import QueryOrchestrator, OrchestratorConfig
 from neo4j_orchestration.orchestration.preferences import UserPreferenceTracker
 from neo4j_orchestration.memory.query_patterns import QueryPatternMemory
-from neo4j_orchestration.execution import QueryExecutor, QueryResult, ExecutionMetadata
+from neo4j_orchestration.execution import QueryResult, ExecutionMetadata
 from neo4j_orchestration.planning.intent import (
     QueryIntent, QueryType, EntityType, FilterCondition, FilterOperator
 )
 
 
+_DEFAULT_META = ExecutionMetadata(
+    query="MATCH (v:Vendor) RETURN v",
+    parameters={},
+    result_available_after=10,
+    result_consumed_after=20,
+)
+
+
+def _make_result(records, query=None, summary="Success"):
+    """Build a QueryResult, sharing _DEFAULT_META unless a query is given."""
+    if query is None:
+        metadata = _DEFAULT_META
+    else:
+        metadata = ExecutionMetadata(
+            query=query,
+            parameters={},
+            result_available_after=10,
+            result_consumed_after=20,
+        )
+    return QueryResult(records=records, metadata=metadata, summary=summary)
+
+
+def _neo4j_settings():
+    """Return (uri, auth) for the test Neo4j instance from the environment."""
+    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD", "password")
+    return uri, (user, password)
+
+
+class FakeExecutor:
+    """Plain executor stand-in returning a fixed result.
+    
+    Cheaper than ``Mock(spec=QueryExecutor)`` in loops that call
+    ``execute`` many times (no call recording).
+    """
+    
+    def __init__(self, result, driver):
+        self.driver = driver
+        self._result = result
+    
+    def execute(self, *args, **kwargs):
+        return self._result
+
+
 class TestPatternLearningIntegration:
     """Integration tests for pattern learning system."""
     
-    @pytest.fixture
-    def neo4j_driver(self):
-        """Create Neo4j driver for testing.
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def neo4j_driver(self):
+        """Create one async Neo4j driver shared by the module's tests.
         
         Note: This requires a running Neo4j instance.
         Set NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD environment variables.
         """
-        import os
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        user = os.getenv("NEO4J_USER", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD", "password")
+        uri, auth = _neo4j_settings()
+        driver = AsyncGraphDatabase.driver(uri, auth=auth)
         
-        driver = GraphDatabase.driver(uri, auth=(user, password))
+        # Index the pattern lookup keys so MERGE/reads seek instead of scan
+        async with QueryPatternMemory(driver=driver) as memory:
+            await memory.create_indexes()
         
         yield driver
         
-        # Cleanup: Delete test pattern data
-        with driver.session() as session:
-            session.run("MATCH (p:QueryPattern) DELETE p")
+        await driver.close()
+    
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def pattern_scope(self, neo4j_driver):
+        """Unique label isolating this test's QueryPattern nodes."""
+        scope = f"Test_{uuid.uuid4().hex}"
+        yield scope
+        
+        # Cleanup: label scan restricted to this test's patterns
+        async with neo4j_driver.session() as session:
+            await session.run(f"MATCH (p:{scope}) DETACH DELETE p")
+    
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def pattern_memory(self, neo4j_driver, pattern_scope):
+        """Create QueryPatternMemory instance, releasing its session after."""
+        async with QueryPatternMemory(
+            driver=neo4j_driver, scope_label=pattern_scope
+        ) as memory:
+            yield memory
+    
+    @pytest.fixture(scope="module")
+    def sync_neo4j_driver(self):
+        """Create a sync Neo4j driver for orchestrator tests.
         
+        The orchestrator runs pattern learning on its own background event
+        loop; an async driver bound to pytest's loop must not be used there.
+        """
+        uri, auth = _neo4j_settings()
+        driver = GraphDatabase.driver(uri, auth=auth)
+        yield driver
         driver.close()
     
-    @pytest.fixture
-    def pattern_memory(self, neo4j_driver):
-        """Create QueryPatternMemory instance."""
-        return QueryPatternMemory(driver=neo4j_driver)
-    
     @pytest.fixture
     def mock_executor(self):
         """Create a mock executor with realistic responses."""
-        executor = Mock(spec=QueryExecutor)
-        
-        # Mock the driver attribute for pattern memory
-        executor.driver = Mock()
-        
         # Create realistic query results
-        result = QueryResult(
-            records=[
+        result = _make_result(
+            [
                 {"name": "Critical Vendor A", "criticality": "Critical"},
                 {"name": "Critical Vendor B", "criticality": "Critical"},
             ],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
-                parameters={},
-                result_available_after=15,
-                result_consumed_after=25,
-            ),
+            query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
             summary="Query completed successfully",
         )
-        executor.execute.return_value = result
         
-        return executor
+        # Mock the driver attribute for pattern memory
+        return FakeExecutor(result, driver=Mock())
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_pattern_learning_convergence(self, pattern_memory):
         """Test that patterns converge after multiple similar queries."""
         # Create preference tracker
         tracker = UserPreferenceTracker(
             pattern_memory=pattern_memory,
-            session_id="test-session-1"
+            session_id="test-session-1",
+            batch_size=5
         )
         
         # Create intent with critical filter
@@ -118,20 +178,19 @@ class TestPatternLearningIntegration:
         )
         
         # Simulate successful query result
-        result = QueryResult(
-            records=[{"name": "Vendor A"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Success",
+        result = _make_result(
+            [{"name": "Vendor A"}],
+            query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
         )
         
         # Record the preference 3 times (establish pattern)
-        for _ in range(3):
-            await tracker.record_query_preference(critical_intent, result, True)
+        await asyncio.gather(*[
+            tracker.record_query_preference(critical_intent, result, True)
+            for _ in range(3)
+        ])
+        
+        # Write the buffered recordings (reads do not flush)
+        await tracker.flush()
         
         # Verify pattern was learned
         filters = await tracker.get_preferred_filters(QueryType.LIST, min_frequency=2)
@@ -143,12 +202,13 @@ class TestPatternLearningIntegration:
         assert EntityType.VENDOR in entities
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_multi_entity_pattern_isolation(self, pattern_memory):
         """Test that patterns for different entities don't interfere."""
         tracker = UserPreferenceTracker(
             pattern_memory=pattern_memory,
-            session_id="test-session-2"
+            session_id="test-session-2",
+            batch_size=5
         )
         
         # Record vendor patterns
@@ -164,19 +224,12 @@ class TestPatternLearningIntegration:
             ],
         )
         
-        vendor_result = QueryResult(
-            records=[{"name": "Vendor A"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Success",
-        )
+        vendor_result = _make_result([{"name": "Vendor A"}])
         
-        for _ in range(3):
-            await tracker.record_query_preference(vendor_intent, vendor_result, True)
+        await asyncio.gather(*[
+            tracker.record_query_preference(vendor_intent, vendor_result, True)
+            for _ in range(3)
+        ])
         
         # Record control patterns with different filter
         control_intent = QueryIntent(
@@ -191,19 +244,15 @@ class TestPatternLearningIntegration:
             ],
         )
         
-        control_result = QueryResult(
-            records=[{"name": "Control A"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (c:Control) RETURN c",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Success",
+        control_result = _make_result(
+            [{"name": "Control A"}],
+            query="MATCH (c:Control) RETURN c",
         )
         
-        for _ in range(3):
-            await tracker.record_query_preference(control_intent, control_result, True)
+        await asyncio.gather(*[
+            tracker.record_query_preference(control_intent, control_result, True)
+            for _ in range(3)
+        ])
         
         # Create new intent for vendor (without filters)
         new_vendor_intent = QueryIntent(
@@ -212,6 +261,8 @@ class TestPatternLearningIntegration:
             filters=[],
         )
         
+        await tracker.flush()
+        
         # Get suggestions - should only suggest vendor-specific filters
         suggestions = await tracker.suggest_enhancements(new_vendor_intent)
         
@@ -221,14 +272,17 @@ class TestPatternLearningIntegration:
         assert "status" not in suggested_fields  # Control filter shouldn't leak
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_cross_session_pattern_persistence(self, neo4j_driver):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cross_session_pattern_persistence(
+        self, neo4j_driver, pattern_scope
+    ):
         """Test that patterns persist across different sessions."""
         # Session 1: Record patterns
-        memory1 = QueryPatternMemory(driver=neo4j_driver)
+        memory1 = QueryPatternMemory(driver=neo4j_driver, scope_label=pattern_scope)
         tracker1 = UserPreferenceTracker(
             pattern_memory=memory1,
-            session_id="session-1"
+            session_id="session-1",
+            batch_size=5
         )
         
         # Record a pattern
@@ -244,26 +298,16 @@ class TestPatternLearningIntegration:
             ],
         )
         
-        result = QueryResult(
-            records=[{"name": "Vendor A"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Success",
-        )
+        result = _make_result([{"name": "Vendor A"}])
         
         # Record pattern multiple times to exceed min_occurrences
         for _ in range(3):
             await tracker1.record_query_preference(intent, result, True)
-        
-        # Wait a bit for Neo4j to process
-        await asyncio.sleep(0.1)
+        await tracker1.flush()
+        await memory1.aclose()
         
         # Session 2: Create new tracker and verify pattern is retrieved
-        memory2 = QueryPatternMemory(driver=neo4j_driver)
+        memory2 = QueryPatternMemory(driver=neo4j_driver, scope_label=pattern_scope)
         tracker2 = UserPreferenceTracker(
             pattern_memory=memory2,
             session_id="session-2"  # Different session
@@ -276,15 +320,17 @@ class TestPatternLearningIntegration:
             min_occurrences=2
         )
         
+        await memory2.aclose()
+        
         # Should retrieve the pattern from Neo4j
         assert "criticality" in filters
         assert filters["criticality"] == "Critical"
     
     @pytest.mark.integration
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
+    @patch('neo4j_orchestration.orchestration.orchestrator.get_default_classifier')
+    @patch('neo4j_orchestration.orchestration.orchestrator.get_default_generator')
     def test_orchestrator_pattern_learning_enabled(
-        self, mock_gen_class, mock_clf_class, mock_executor, neo4j_driver
+        self, mock_gen_class, mock_clf_class, mock_executor, sync_neo4j_driver
     ):
         """Test QueryOrchestrator with pattern learning enabled."""
         # Setup mocks
@@ -310,17 +356,17 @@ class TestPatternLearningIntegration:
         )
         mock_gen_class.return_value = mock_generator
         
-        # Update mock executor to use real driver
-        mock_executor.driver = neo4j_driver
+        # Update mock executor to use a real (sync) driver
+        mock_executor.driver = sync_neo4j_driver
         
-        # Create orchestrator with pattern learning
-        orchestrator = QueryOrchestrator(
+        # Create orchestrator with pattern learning; closing it releases
+        # the pattern memory's session
+        with QueryOrchestrator(
             mock_executor,
             enable_pattern_learning=True
-        )
-        
-        # Execute query
-        result = orchestrator.query("Show critical vendors")
+        ) as orchestrator:
+            # Execute query
+            result = orchestrator.query("Show critical vendors")
         
         # Verify result
         assert result is not None
@@ -356,12 +402,13 @@ class TestPatternLearningIntegration:
         assert entities == []
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_pattern_enhancement_suggestion_quality(self, pattern_memory):
         """Test that suggestions are high-quality and relevant."""
         tracker = UserPreferenceTracker(
             pattern_memory=pattern_memory,
-            session_id="test-session-quality"
+            session_id="test-session-quality",
+            batch_size=5
         )
         
         # Record diverse patterns
@@ -371,32 +418,14 @@ class TestPatternLearningIntegration:
             ("region", "US", 2),             # Weak pattern
         ]
         
+        # One server-side increment per pattern instead of `count` writes
         for field, value, count in patterns:
-            intent = QueryIntent(
-                query_type=QueryType.LIST,
-                entities=[EntityType.VENDOR],
-                filters=[
-                    FilterCondition(
-                        field=field,
-                        operator=FilterOperator.EQUALS,
-                        value=value
-                    )
-                ],
+            await pattern_memory.bump_pattern(
+                QueryType.LIST,
+                [EntityType.VENDOR],
+                filters={field: value},
+                delta=count
             )
-            
-            result = QueryResult(
-                records=[{"name": "Vendor A"}],
-                metadata=ExecutionMetadata(
-                    query="MATCH (v:Vendor) RETURN v",
-                    parameters={},
-                    result_available_after=10,
-                    result_consumed_after=20,
-                ),
-                summary="Success",
-            )
-            
-            for _ in range(count):
-                await tracker.record_query_preference(intent, result, True)
         
         # Get suggestions for a new query
         new_intent = QueryIntent(
@@ -418,7 +447,7 @@ class TestPatternLearningIntegration:
         assert "region" in suggested_fields or len(suggested_fields) <= 2
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_result_handling(self, pattern_memory):
         """Test that empty results are handled gracefully."""
         tracker = UserPreferenceTracker(
@@ -440,14 +469,9 @@ class TestPatternLearningIntegration:
         )
         
         # Create empty result
-        empty_result = QueryResult(
-            records=[],  # Empty!
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
-                parameters={},
-                result_available_after=5,
-                result_consumed_after=10,
-            ),
+        empty_result = _make_result(
+            [],  # Empty!
+            query="MATCH (v:Vendor) WHERE v.criticality = 'Critical' RETURN v",
             summary="No results found",
         )
         
@@ -468,29 +492,16 @@ class TestPatternLearningPerformance:
     
     @pytest.mark.integration
     @pytest.mark.performance
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
+    @patch('neo4j_orchestration.orchestration.orchestrator.get_default_classifier')
+    @patch('neo4j_orchestration.orchestration.orchestrator.get_default_generator')
     def test_pattern_learning_overhead(
         self, mock_gen_class, mock_clf_class
     ):
         """Measure overhead of pattern learning on query execution."""
         import time
         
-        # Create mock executor
-        executor = Mock(spec=QueryExecutor)
-        executor.driver = Mock()  # Mock driver for pattern learning
-        
-        result = QueryResult(
-            records=[{"name": "Vendor A"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Success",
-        )
-        executor.execute.return_value = result
+        result = _make_result([{"name": "Vendor A"}])
+        executor = FakeExecutor(result, driver=Mock())  # Mock driver for pattern learning
         
         # Setup mocks
         mock_classifier = Mock()
@@ -506,21 +517,23 @@ class TestPatternLearningPerformance:
         mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
         mock_gen_class.return_value = mock_generator
         
+        def timed_queries(orchestrator, iterations=10):
+            """Return seconds for ``iterations`` queries after one warm-up."""
+            # Warm-up keeps first-call costs (lazy imports, session
+            # acquisition) out of the measured region
+            orchestrator.query("Show vendors")
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                orchestrator.query("Show vendors")
+            return (time.perf_counter_ns() - start) / 1e9
+        
         # Test WITHOUT pattern learning
         orchestrator_no_pl = QueryOrchestrator(executor, enable_pattern_learning=False)
-        
-        start = time.time()
-        for _ in range(10):
-            orchestrator_no_pl.query("Show vendors")
-        baseline_time = time.time() - start
+        baseline_time = timed_queries(orchestrator_no_pl)
         
         # Test WITH pattern learning
         orchestrator_with_pl = QueryOrchestrator(executor, enable_pattern_learning=True)
-        
-        start = time.time()
-        for _ in range(10):
-            orchestrator_with_pl.query("Show vendors")
-        pl_time = time.time() - start
+        pl_time = timed_queries(orchestrator_with_pl)
         
         # Calculate overhead
         overhead = pl_time - baseline_time
@@ -4,6 +4,8 @@ Integration tests for Query Planning components
 Tests the complete flow: Natural Language -> QueryIntent -> Cypher Query
 """
 
+from collections.abc import Mapping
+
 import pytest
 from neo4j_orchestration.planning import (
     QueryIntentClassifier,
@@ -16,73 +18,62 @@ from neo4j_orchestration.planning import (
 class TestPlanningIntegration:
     """Integration tests for classifier + generator pipeline."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self):
-        """Create a QueryIntentClassifier instance."""
+        """Create a QueryIntentClassifier instance (stateless, shared)."""
         return QueryIntentClassifier()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create a CypherQueryGenerator instance."""
+        """Create a CypherQueryGenerator instance (stateless, shared)."""
         return CypherQueryGenerator()
     
-    def test_count_vendors_end_to_end(self, classifier, generator):
-        """Test: 'Count all vendors' -> Cypher query."""
-        # Step 1: Classify
-        intent = classifier.classify("Count all vendors")
-        
-        assert intent.query_type == QueryType.VENDOR_LIST
-        assert intent.has_aggregations()
-        
-        # Step 2: Generate
-        query, params = generator.generate(intent)
-        
-        assert "MATCH (v:Vendor)" in query
-        assert "count(v)" in query
-        assert params == {}
-    
-    def test_high_risk_vendors_end_to_end(self, classifier, generator):
-        """Test: 'Show vendors with critical risk' -> Cypher query."""
-        # Step 1: Classify
-        intent = classifier.classify("Show vendors with critical risk")
-        
-        assert intent.query_type == QueryType.VENDOR_RISK
-        assert intent.has_filters()
-        
-        # Step 2: Generate
-        query, params = generator.generate(intent)
-        
-        assert "MATCH (v:Vendor)" in query
-        assert "WHERE" in query
-        assert "riskLevel" in query
-        assert params.get("riskLevel") == "Critical"
-    
-    def test_active_vendors_end_to_end(self, classifier, generator):
-        """Test: 'List active vendors' -> Cypher query."""
+    @pytest.mark.parametrize(
+        "nl, expected_type, expected_substrs, expected_params",
+        [
+            pytest.param(
+                "Count all vendors", QueryType.VENDOR_LIST,
+                ["MATCH (v:Vendor)", "count(v)"], {},
+                id="count_vendors",
+            ),
+            pytest.param(
+                "Show vendors with critical risk", QueryType.VENDOR_RISK,
+                ["MATCH (v:Vendor {", "riskLevel: $riskLevel"], {"riskLevel": "Critical"},
+                id="high_risk_vendors",
+            ),
+            pytest.param(
+                "List active vendors", QueryType.VENDOR_LIST,
+                ["MATCH (v:Vendor {status: $status})"], {"status": "Active"},
+                id="active_vendors",
+            ),
+            pytest.param(
+                "Top 10 vendors by risk level", QueryType.VENDOR_RISK,
+                ["LIMIT 10"], None,
+                id="top_vendors",
+            ),
+        ],
+    )
+    def test_end_to_end(
+        self, classifier, generator, nl, expected_type, expected_substrs, expected_params
+    ):
+        """Test: natural language -> QueryIntent -> Cypher query."""
         # Step 1: Classify
-        intent = classifier.classify("List active vendors")
-        
-        assert intent.query_type == QueryType.VENDOR_LIST
-        assert intent.has_filters()
+        intent = classifier.classify(nl)
+        assert intent.query_type == expected_type
         
         # Step 2: Generate
         query, params = generator.generate(intent)
-        
-        assert "WHERE v.status = $status" in query
-        assert params == {"status": "Active"}
-    
-    def test_top_vendors_end_to_end(self, classifier, generator):
-        """Test: 'Top 10 vendors by risk level' -> Cypher query."""
-        # Step 1: Classify
-        intent = classifier.classify("Top 10 vendors by risk level")
-        
-        assert intent.query_type == QueryType.VENDOR_RISK
-        assert intent.limit == 10
-        
-        # Step 2: Generate
-        query, params = generator.generate(intent)
-        
-        assert "LIMIT 10" in query
+        for substr in expected_substrs:
+            assert substr in query
+        if expected_params is not None:
+            assert params == expected_params
+    
+    def test_end_to_end_intent_features(self, classifier):
+        """Test the classified intents carry the expected features."""
+        assert classifier.classify("Count all vendors").has_aggregations()
+        assert classifier.classify("Show vendors with critical risk").has_filters()
+        assert classifier.classify("List active vendors").has_filters()
+        assert classifier.classify("Top 10 vendors by risk level").limit == 10
     
     def test_complex_query_end_to_end(self, classifier, generator):
         """Test complex query with multiple features."""
@@ -96,8 +87,7 @@ class TestPlanningIntegration:
         # Step 2: Generate
         query, params = generator.generate(intent)
         
-        assert "MATCH (v:Vendor)" in query
-        assert "WHERE" in query
+        assert "MATCH (v:Vendor {" in query
         assert len(params) > 0
     
     def test_pipeline_produces_valid_cypher(self, classifier, generator):
@@ -110,35 +100,31 @@ class TestPlanningIntegration:
             "Vendors with critical risk",
         ]
         
-        for nl_query in test_queries:
-            # Classify
-            intent = classifier.classify(nl_query)
+        intents = [classifier.classify(q) for q in test_queries]
+        intents = [i for i in intents if i.query_type != QueryType.UNKNOWN]
+        
+        for query, params in generator.generate_many(intents):
+            # Basic validity checks
+            assert query.startswith("MATCH")
+            assert "RETURN" in query
+            assert isinstance(params, Mapping)
             
-            # Generate (only if not unknown)
-            if intent.query_type != QueryType.UNKNOWN:
-                query, params = generator.generate(intent)
-                
-                # Basic validity checks
-                assert query.startswith("MATCH")
-                assert "RETURN" in query
-                assert isinstance(params, dict)
-                
-                # Verify query structure
-                assert query.count("MATCH") >= 1
-                assert query.count("RETURN") == 1
+            # Verify query structure
+            assert query.count("MATCH") >= 1
+            assert query.count("RETURN") == 1
 
 
 class TestEdgeCases:
     """Test edge cases in the planning pipeline."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self):
-        """Create a QueryIntentClassifier instance."""
+        """Create a QueryIntentClassifier instance (stateless, shared)."""
         return QueryIntentClassifier()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create a CypherQueryGenerator instance."""
+        """Create a CypherQueryGenerator instance (stateless, shared)."""
         return CypherQueryGenerator()
     
     def test_low_confidence_classification(self, classifier, generator):
@@ -163,14 +149,14 @@ class TestEdgeCases:
 class TestRealWorldScenarios:
     """Test real-world query scenarios."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self):
-        """Create a QueryIntentClassifier instance."""
+        """Create a QueryIntentClassifier instance (stateless, shared)."""
         return QueryIntentClassifier()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create a CypherQueryGenerator instance."""
+        """Create a CypherQueryGenerator instance (stateless, shared)."""
         return CypherQueryGenerator()
     
     def test_vendor_risk_assessment_scenario(self, classifier, generator):
@@ -0,0 +1,81 @@
+"""
+Shared fixtures for execution unit tests.
+
+``GraphDatabase`` is patched once per test module with a ``MagicMock``
+whose driver and session are long-lived mocks; tests reset them between
+runs instead of re-entering a ``@patch`` context each time. The patch is
+undone when the module finishes, so tests collected later (e.g. the
+integration suite) see the real driver.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from neo4j_orchestration.execution import Neo4jConfig
+
+
+class _SessionCM:
+    """Concrete context manager handing out a fixed session."""
+    
+    def __init__(self, session):
+        self.session = session
+    
+    def __enter__(self):
+        return self.session
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Create test configuration (never mutated, shared across the session)."""
+    return Neo4jConfig(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="test_password",
+        database="neo4j",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_driver():
+    """Session-wide mock Neo4j driver."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="session")
+def mock_session():
+    """Session-wide mock Neo4j session."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def patched_graph_db():
+    """Patch the executor's GraphDatabase for the current test module."""
+    graph_db = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("neo4j_orchestration.execution.executor.GraphDatabase", graph_db)
+        yield graph_db
+
+
+@pytest.fixture
+def bind_sync_session(mock_driver, mock_session):
+    """Make ``with mock_driver.session(...)`` yield ``mock_session``."""
+    mock_driver.session.return_value = _SessionCM(mock_session)
+    return mock_session
+
+
+@pytest.fixture
+def wired_mocks(patched_graph_db, mock_driver, bind_sync_session):
+    """Connect GraphDatabase -> driver -> session, resetting them afterwards.
+    
+    Side effects are cleared too, so a test that makes the driver fail
+    does not leak into the next one. (Return values are re-wired here
+    rather than reset, which would also wipe MagicMock's magic methods.)
+    """
+    patched_graph_db.driver.return_value = mock_driver
+    mock_driver.verify_connectivity.return_value = None
+    yield patched_graph_db
+    for mock in (patched_graph_db, mock_driver, bind_sync_session):
+        mock.reset_mock(side_effect=True)
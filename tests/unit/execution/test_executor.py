@@ -4,190 +4,274 @@ Unit tests for QueryExecutor.
 Tests executor functionality with mocked Neo4j driver.
 """
 
+import re
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from neo4j.exceptions import ServiceUnavailable
 
-from neo4j_orchestration.execution import QueryExecutor, Neo4jConfig, QueryResult
+from neo4j_orchestration.execution import QueryExecutor, QueryResult
 from neo4j_orchestration.execution.executor import (
     ConnectionError,
     QueryError,
 )
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_RE_FAIL_CONNECT = re.compile("Failed to connect")
+_RE_CONNECTION_ERROR = re.compile("Connection error")
+_RE_QUERY_FAILED = re.compile("Query execution failed")
+
+
+class FakeRecord(dict):
+    """Plain-dict stand-in for ``neo4j.Record`` (``keys()`` and ``[]``)."""
+
+
+class FakeResult:
+    """Iterable stand-in for ``neo4j.Result`` with a fixed summary."""
+
+    def __init__(self, rows, summary):
+        self._rows = rows
+        self._summary = summary
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def consume(self):
+        return self._summary
+
+
+class FakeAsyncResult(FakeResult):
+    """Async-iterable stand-in for ``neo4j.AsyncResult``."""
+
+    async def __aiter__(self):
+        for row in self._rows:
+            yield row
+
+    async def consume(self):
+        return self._summary
+
+
+class FakeAsyncSession:
+    """Stand-in for ``neo4j.AsyncSession`` returning a fixed result."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, parameters):
+        self.calls.append((query, parameters))
+        if self.error is not None:
+            raise self.error
+        return self.result
 
-@pytest.fixture
-def config():
-    """Create test configuration."""
-    return Neo4jConfig(
-        uri="bolt://localhost:7687",
-        username="neo4j",
-        password="test_password",
-        database="neo4j",
-    )
 
+class FakeAsyncDriver:
+    """Stand-in for ``neo4j.AsyncDriver`` handing out one session."""
 
-@pytest.fixture
-def mock_driver():
-    """Create mock Neo4j driver."""
-    driver = MagicMock()
-    driver.verify_connectivity.return_value = None
-    return driver
+    def __init__(self, session):
+        self._session = session
+        self.closed = False
 
+    def session(self, database=None):
+        return self._session
 
-@pytest.fixture
-def mock_session():
-    """Create mock Neo4j session."""
-    session = MagicMock()
-    return session
+    async def close(self):
+        self.closed = True
+
+
+FAKE_SUMMARY = SimpleNamespace(
+    result_available_after=10,
+    result_consumed_after=15,
+    counters=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset(wired_mocks):
+    """Wire the shared GraphDatabase/driver/session mocks for each test."""
+    yield
 
 
 class TestQueryExecutorInit:
     """Test QueryExecutor initialization."""
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_successful_initialization(self, mock_graph_db, config, mock_driver):
+
+    def test_successful_initialization(self, patched_graph_db, config, mock_driver):
         """Test successful executor initialization."""
-        mock_graph_db.driver.return_value = mock_driver
-        
         executor = QueryExecutor(config)
-        
+
         assert executor.config == config
         assert executor._driver is not None
-        mock_graph_db.driver.assert_called_once()
+        patched_graph_db.driver.assert_called_once()
         mock_driver.verify_connectivity.assert_called_once()
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_initialization_connection_failure(self, mock_graph_db, config):
+
+    def test_initialization_connection_failure(self, patched_graph_db, config):
         """Test initialization fails when connection fails."""
-        mock_graph_db.driver.side_effect = ServiceUnavailable("Connection failed")
-        
-        with pytest.raises(ConnectionError, match="Failed to connect"):
+        patched_graph_db.driver.side_effect = ServiceUnavailable("Connection failed")
+
+        with pytest.raises(ConnectionError, match=_RE_FAIL_CONNECT):
             QueryExecutor(config)
 
 
 class TestQueryExecution:
     """Test query execution."""
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_execute_simple_query(self, mock_graph_db, config, mock_driver, mock_session):
+
+    def test_execute_simple_query(self, patched_graph_db, config, mock_driver, bind_sync_session):
         """Test executing a simple query."""
-        mock_graph_db.driver.return_value = mock_driver
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        
-        # Mock result
-        mock_record = MagicMock()
-        mock_record.keys.return_value = ['name', 'count']
-        mock_record.__getitem__.side_effect = lambda k: 'TestVendor' if k == 'name' else 5
-        
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = [mock_record]
-        mock_session.run.return_value = mock_result
-        
-        # Mock summary
-        mock_summary = MagicMock()
-        mock_summary.result_available_after = 10
-        mock_summary.result_consumed_after = 15
-        mock_summary.counters = None
-        mock_result.consume.return_value = mock_summary
-        
+        bind_sync_session.run.return_value = FakeResult(
+            [FakeRecord(name='TestVendor', count=5)], FAKE_SUMMARY
+        )
+
         executor = QueryExecutor(config)
         result = executor.execute("MATCH (v:Vendor) RETURN v.name AS name, count(v) AS count")
-        
+
         assert isinstance(result, QueryResult)
         assert len(result.records) == 1
         assert result.records[0]['name'] == 'TestVendor'
         assert result.records[0]['count'] == 5
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_execute_with_parameters(self, mock_graph_db, config, mock_driver, mock_session):
+
+    def test_execute_with_parameters(self, patched_graph_db, config, mock_driver, bind_sync_session):
         """Test executing query with parameters."""
-        mock_graph_db.driver.return_value = mock_driver
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = []
-        mock_summary = MagicMock()
-        mock_summary.counters = None
-        mock_result.consume.return_value = mock_summary
-        mock_session.run.return_value = mock_result
-        
+        bind_sync_session.run.return_value = FakeResult([], FAKE_SUMMARY)
+
         executor = QueryExecutor(config)
         query = "MATCH (v:Vendor) WHERE v.riskLevel = $riskLevel RETURN v"
         params = {"riskLevel": "Critical"}
-        
+
         result = executor.execute(query, params)
-        
-        mock_session.run.assert_called_once_with(query, params)
+
+        run = bind_sync_session.run
+        call = run.call_args
+        assert run.call_count == 1
+        assert call.args == (query, params)
         assert result.metadata.parameters == params
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_execute_no_results(self, mock_graph_db, config, mock_driver, mock_session):
+
+    def test_execute_no_results(self, patched_graph_db, config, mock_driver, bind_sync_session):
         """Test executing query with no results."""
-        mock_graph_db.driver.return_value = mock_driver
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = []
-        mock_summary = MagicMock()
-        mock_summary.counters = None
-        mock_result.consume.return_value = mock_summary
-        mock_session.run.return_value = mock_result
-        
+        bind_sync_session.run.return_value = FakeResult([], FAKE_SUMMARY)
+
         executor = QueryExecutor(config)
         result = executor.execute("MATCH (v:Vendor) WHERE v.name = 'NonExistent' RETURN v")
-        
+
         assert len(result.records) == 0
         assert result.summary == "No results found"
 
 
 class TestErrorHandling:
     """Test error handling."""
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_connection_error_during_execution(self, mock_graph_db, config, mock_driver, mock_session):
+
+    def test_connection_error_during_execution(self, patched_graph_db, config, mock_driver, bind_sync_session):
         """Test connection error during query execution."""
-        mock_graph_db.driver.return_value = mock_driver
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_session.run.side_effect = ServiceUnavailable("Connection lost")
-        
+        bind_sync_session.run.side_effect = ServiceUnavailable("Connection lost")
+
         executor = QueryExecutor(config)
-        
-        with pytest.raises(ConnectionError, match="Connection error"):
+
+        with pytest.raises(ConnectionError, match=_RE_CONNECTION_ERROR):
             executor.execute("MATCH (n) RETURN n")
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_query_error(self, mock_graph_db, config, mock_driver, mock_session):
+
+    def test_query_error(self, patched_graph_db, config, mock_driver, bind_sync_session):
         """Test query execution error."""
-        mock_graph_db.driver.return_value = mock_driver
-        mock_driver.session.return_value.__enter__.return_value = mock_session
-        mock_session.run.side_effect = Exception("Invalid query syntax")
-        
+        bind_sync_session.run.side_effect = Exception("Invalid query syntax")
+
         executor = QueryExecutor(config)
-        
-        with pytest.raises(QueryError, match="Query execution failed"):
+
+        with pytest.raises(QueryError, match=_RE_QUERY_FAILED):
             executor.execute("INVALID QUERY")
 
 
 class TestContextManager:
     """Test context manager functionality."""
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_context_manager(self, mock_graph_db, config, mock_driver):
+
+    def test_context_manager(self, patched_graph_db, config, mock_driver):
         """Test using executor as context manager."""
-        mock_graph_db.driver.return_value = mock_driver
-        
         with QueryExecutor(config) as executor:
             assert executor._driver is not None
-        
+
         mock_driver.close.assert_called_once()
-    
-    @patch('neo4j_orchestration.execution.executor.GraphDatabase')
-    def test_close_method(self, mock_graph_db, config, mock_driver):
+
+    def test_close_method(self, patched_graph_db, config, mock_driver):
         """Test close method."""
-        mock_graph_db.driver.return_value = mock_driver
-        
         executor = QueryExecutor(config)
         executor.close()
-        
+
         mock_driver.close.assert_called_once()
         assert executor._driver is None
+
+
+class TestAsyncExecution:
+    """Test async query execution."""
+
+    @pytest.fixture
+    def async_session(self, monkeypatch):
+        """Route AsyncGraphDatabase.driver to a fake driver and session."""
+        session = FakeAsyncSession(
+            FakeAsyncResult([FakeRecord(name='TestVendor')], FAKE_SUMMARY)
+        )
+        driver = FakeAsyncDriver(session)
+        monkeypatch.setattr(
+            "neo4j_orchestration.execution.executor.AsyncGraphDatabase",
+            SimpleNamespace(driver=lambda *args, **kwargs: driver),
+        )
+        return session
+
+    @pytest.mark.asyncio
+    async def test_aexecute(self, config, async_session):
+        """Test executing a query on the async driver."""
+        executor = QueryExecutor(config)
+        params = {"riskLevel": "Critical"}
+
+        result = await executor.aexecute("MATCH (v:Vendor) RETURN v.name AS name", params)
+
+        assert isinstance(result, QueryResult)
+        assert result.records == [{'name': 'TestVendor'}]
+        assert async_session.calls == [("MATCH (v:Vendor) RETURN v.name AS name", params)]
+
+    @pytest.mark.asyncio
+    async def test_aexecute_connection_error(self, config, async_session):
+        """Test connection errors are wrapped like the sync path."""
+        async_session.error = ServiceUnavailable("Connection lost")
+        executor = QueryExecutor(config)
+
+        with pytest.raises(ConnectionError, match=_RE_CONNECTION_ERROR):
+            await executor.aexecute("MATCH (n) RETURN n")
+
+    @pytest.mark.asyncio
+    async def test_aclose(self, config, mock_driver, async_session):
+        """Test aclose releases both the async and sync drivers."""
+        executor = QueryExecutor(config)
+        await executor.aexecute("MATCH (n) RETURN n")
+        async_driver = executor._async_driver
+
+        await executor.aclose()
+
+        assert async_driver.closed
+        assert executor._async_driver is None
+        mock_driver.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_warns_about_open_async_driver(self, config, mock_driver, async_session):
+        """Test sync close() warns instead of silently leaking the async driver."""
+        executor = QueryExecutor(config)
+        await executor.aexecute("MATCH (n) RETURN n")
+
+        with pytest.warns(ResourceWarning, match="aclose"):
+            executor.close()
+
+        await executor.aclose()
+        assert executor._async_driver is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self, config, async_session):
+        """Test async with releases the async driver on exit."""
+        async with QueryExecutor(config) as executor:
+            await executor.aexecute("MATCH (n) RETURN n")
+            async_driver = executor._async_driver
+
+        assert async_driver.closed
+        assert executor._async_driver is None
@@ -1,7 +1,8 @@
 """Unit tests for result types."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 from neo4j_orchestration.execution import QueryResult, ExecutionMetadata
 
 
@@ -20,24 +21,25 @@ class TestExecutionMetadata:
     
     def test_from_summary(self):
         """Test creating metadata from Neo4j summary."""
-        mock_summary = MagicMock()
-        mock_summary.result_available_after = 15
-        mock_summary.result_consumed_after = 30
-        
-        mock_counters = MagicMock()
-        mock_counters.nodes_created = 5
-        mock_counters.relationships_created = 3
-        mock_counters.properties_set = 10
-        mock_counters.nodes_deleted = 0
-        mock_counters.relationships_deleted = 0
-        mock_counters.labels_added = 2
-        mock_counters.labels_removed = 0
-        mock_summary.counters = mock_counters
+        counters = SimpleNamespace(
+            nodes_created=5,
+            relationships_created=3,
+            properties_set=10,
+            nodes_deleted=0,
+            relationships_deleted=0,
+            labels_added=2,
+            labels_removed=0,
+        )
+        summary = SimpleNamespace(
+            result_available_after=15,
+            result_consumed_after=30,
+            counters=counters,
+        )
         
         metadata = ExecutionMetadata.from_summary(
             "CREATE (n:Test)",
             {"name": "test"},
-            mock_summary
+            summary
         )
         
         assert metadata.query == "CREATE (n:Test)"
@@ -62,6 +64,14 @@ class TestQueryResult:
         assert len(result) == 2
         assert result.summary == "Found 2 results"
     
+    def test_result_has_no_instance_dict(self):
+        """Test results and metadata carry no per-instance __dict__."""
+        metadata = ExecutionMetadata(query="", parameters={})
+        result = QueryResult(records=[], metadata=metadata, summary="")
+        
+        assert not hasattr(metadata, "__dict__")
+        assert not hasattr(result, "__dict__")
+    
     def test_iteration(self):
         """Test iterating over results."""
         metadata = ExecutionMetadata(query="", parameters={})
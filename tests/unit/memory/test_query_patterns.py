@@ -1,21 +1,58 @@
 """
 Unit tests for QueryPatternMemory.
 """
+import asyncio
+
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from neo4j import AsyncDriver
 
 from neo4j_orchestration.memory.query_patterns import QueryPatternMemory
+from neo4j_orchestration.core.exceptions import MemoryError, ValidationError
 from neo4j_orchestration.core.types import MemoryType
 from neo4j_orchestration.planning.intent import QueryType, EntityType
 
 
+def _acoro(value):
+    """Return a plain coroutine function resolving to ``value``."""
+    async def _coro(*args, **kwargs):
+        return value
+    return _coro
+
+
+class _FakeSession:
+    """Async session stand-in whose ``run`` resolves to a fixed result."""
+    
+    def __init__(self, result):
+        self.run = AsyncMock(return_value=result)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeAsyncDriver(AsyncDriver):
+    """Minimal ``AsyncDriver`` exposing only ``session()``.
+    
+    Subclasses AsyncDriver so QueryPatternMemory takes its async code
+    path, without the attribute walk of ``AsyncMock(spec=AsyncDriver)``.
+    Configure results via ``_result`` (e.g. ``_result.single``).
+    """
+    
+    def __init__(self):
+        self._closed = True  # nothing to release; keeps __del__ quiet
+        self._result = AsyncMock()
+        self._session = _FakeSession(self._result)
+        self.session = Mock(return_value=self._session)
+
+
 @pytest.fixture
 def mock_driver():
-    """Create a mock Neo4j driver."""
-    driver = AsyncMock(spec=AsyncDriver)
-    return driver
+    """Create a fake async Neo4j driver."""
+    return FakeAsyncDriver()
 
 
 @pytest.fixture
@@ -24,29 +61,41 @@ def pattern_memory(mock_driver):
     return QueryPatternMemory(mock_driver)
 
 
-@pytest.mark.asyncio
-async def test_initialization(pattern_memory):
+@pytest.fixture
+def make_session(mock_driver):
+    """Factory: make the fake session's result ``single()`` return a value."""
+    def _make(single_return):
+        mock_driver._result.single = _acoro(single_return)
+        return mock_driver._session
+    return _make
+
+
+def _pattern_node(**overrides):
+    """Build a stored QueryPattern node as returned by Neo4j."""
+    node = {
+        "query_type": "vendor_list",
+        "entities": ["VENDOR"],
+        "common_filters": {"tier": "Critical"},
+        "frequency": 5,
+        "success_rate": 0.8,
+        "last_used": datetime.now(),
+        "created_at": datetime.now()
+    }
+    node.update(overrides)
+    return node
+
+
+def test_initialization(pattern_memory):
     """Test QueryPatternMemory initialization."""
     assert pattern_memory.memory_type == MemoryType.SEMANTIC
     assert pattern_memory.driver is not None
 
 
 @pytest.mark.asyncio
-async def test_record_pattern_new(mock_driver, pattern_memory):
+async def test_record_pattern_new(make_session, pattern_memory):
     """Test recording a new pattern."""
-    # Setup mock session and result
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_record = {"pattern_id": "test-pattern-id"}
-    
-    mock_result.single = AsyncMock(return_value=mock_record)
-    mock_session.run = AsyncMock(return_value=mock_result)
+    session = make_session({"pattern_id": "test-pattern-id"})
     
-    # Mock the context manager
-    mock_driver.session.return_value.__aenter__.return_value = mock_session
-    mock_driver.session.return_value.__aexit__.return_value = None
-    
-    # Record pattern
     pattern_id = await pattern_memory.record_pattern(
         query_type=QueryType.VENDOR_LIST,
         entities=[EntityType.VENDOR],
@@ -54,107 +103,231 @@ async def test_record_pattern_new(mock_driver, pattern_memory):
         success=True
     )
     
-    # Verify
     assert pattern_id == "test-pattern-id"
-    assert mock_session.run.called
+    assert session.run.called
 
 
-@pytest.mark.asyncio  
-async def test_get_pattern(mock_driver, pattern_memory):
-    """Test retrieving a pattern by ID."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    
-    mock_node = {
-        "query_type": "vendor_list",
-        "entities": ["VENDOR"],
-        "common_filters": {"tier": "Critical"},
-        "frequency": 5,
-        "success_rate": 0.8,
-        "last_used": datetime.now(),
-        "created_at": datetime.now()
-    }
-    mock_record = {"p": mock_node}
-    
-    mock_result.single = AsyncMock(return_value=mock_record)
-    mock_session.run = AsyncMock(return_value=mock_result)
-    
-    # Mock the context manager
-    mock_driver.session.return_value.__aenter__.return_value = mock_session
-    mock_driver.session.return_value.__aexit__.return_value = None
+@pytest.mark.asyncio
+@pytest.mark.parametrize("record,found", [
+    ({"p": _pattern_node()}, True),
+    (None, False),
+], ids=["found", "not_found"])
+async def test_get_pattern(make_session, pattern_memory, record, found):
+    """Test retrieving a pattern by ID, present or missing."""
+    make_session(record)
     
-    # Get pattern
     entry = await pattern_memory.get_pattern("test-id")
     
-    # Verify
-    assert entry is not None
+    if not found:
+        assert entry is None
+        return
     assert entry.key == "test-id"
     assert entry.value["query_type"] == "vendor_list"
     assert entry.value["frequency"] == 5
 
 
 @pytest.mark.asyncio
-async def test_get_pattern_not_found(mock_driver, pattern_memory):
-    """Test getting non-existent pattern."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value=None)
-    mock_session.run = AsyncMock(return_value=mock_result)
+async def test_delete_pattern(make_session, pattern_memory):
+    """Test deleting a pattern."""
+    make_session({"deleted": 1})
     
-    # Mock the context manager
-    mock_driver.session.return_value.__aenter__.return_value = mock_session
-    mock_driver.session.return_value.__aexit__.return_value = None
+    deleted = await pattern_memory.delete("test-pattern")
+    assert deleted is True
+
+
+@pytest.mark.asyncio
+async def test_exists(make_session, pattern_memory):
+    """Test checking if pattern exists."""
+    make_session({"p": _pattern_node(common_filters={}, frequency=1)})
     
-    entry = await pattern_memory.get_pattern("nonexistent")
-    assert entry is None
+    exists = await pattern_memory.exists("test-pattern")
+    assert exists is True
+
+
+def test_set_not_supported(pattern_memory):
+    """Test that set() is not supported."""
+    with pytest.raises(NotImplementedError):
+        asyncio.run(pattern_memory.set("key", "value"))
 
 
 @pytest.mark.asyncio
-async def test_delete_pattern(mock_driver, pattern_memory):
-    """Test deleting a pattern."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_record = {"deleted": 1}
+async def test_get_common_filters_cached():
+    """Test repeated common-filter reads are served from the cache."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.return_value.single.return_value = {"filters": {"tier": "Critical"}}
+    memory = QueryPatternMemory(driver)
     
-    mock_result.single = AsyncMock(return_value=mock_record)
-    mock_session.run = AsyncMock(return_value=mock_result)
+    first = await memory.get_common_filters(QueryType.LIST)
+    second = await memory.get_common_filters(QueryType.VENDOR_LIST)
     
-    # Mock the context manager
-    mock_driver.session.return_value.__aenter__.return_value = mock_session
-    mock_driver.session.return_value.__aexit__.return_value = None
+    assert first == second == {"tier": "Critical"}
+    assert session.run.call_count == 1
+
+
+
+@pytest.mark.asyncio
+async def test_get_common_filters_result_mutation_isolated():
+    """Test mutating a returned dict does not alter the cached entry."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.return_value.single.return_value = {"filters": {"tier": "Critical"}}
+    memory = QueryPatternMemory(driver)
     
-    deleted = await pattern_memory.delete("test-pattern")
-    assert deleted is True
+    first = await memory.get_common_filters(QueryType.LIST)
+    first["tier"] = "Low"
+    second = await memory.get_common_filters(QueryType.LIST)
+    second.clear()
+    
+    assert await memory.get_common_filters(QueryType.LIST) == {"tier": "Critical"}
+    assert session.run.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_exists(mock_driver, pattern_memory):
-    """Test checking if pattern exists."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_node = {
-        "query_type": "vendor_list",
-        "entities": ["VENDOR"],
-        "common_filters": {},
-        "frequency": 1,
-        "success_rate": 1.0,
-        "last_used": datetime.now(),
-        "created_at": datetime.now()
-    }
+async def test_get_common_filters_cache_disabled():
+    """Test a zero TTL always reads from Neo4j."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.return_value.single.return_value = None
+    memory = QueryPatternMemory(driver, filters_cache_ttl=0)
     
-    mock_result.single = AsyncMock(return_value={"p": mock_node})
-    mock_session.run = AsyncMock(return_value=mock_result)
+    await memory.get_common_filters(QueryType.LIST)
+    await memory.get_common_filters(QueryType.LIST)
     
-    # Mock the context manager
-    mock_driver.session.return_value.__aenter__.return_value = mock_session
-    mock_driver.session.return_value.__aexit__.return_value = None
+    assert session.run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_indexes():
+    """Test index creation runs one statement per index."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    memory = QueryPatternMemory(driver)
     
-    exists = await pattern_memory.exists("test-pattern")
-    assert exists is True
+    await memory.create_indexes()
+    
+    statements = [c.args[0] for c in session.run.call_args_list]
+    assert len(statements) == 3
+    assert all("IF NOT EXISTS" in stmt for stmt in statements)
+    assert any("pattern_signature" in stmt for stmt in statements)
 
 
 @pytest.mark.asyncio
-async def test_set_not_supported(pattern_memory):
-    """Test that set() is not supported."""
-    with pytest.raises(NotImplementedError):
-        await pattern_memory.set("key", "value")
+async def test_scope_label_restricts_queries():
+    """Test a scope label is added to pattern queries but not to indexes."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    memory = QueryPatternMemory(driver, scope_label="Test_abc123")
+    
+    await memory.clear()
+    await memory.create_indexes()
+    
+    statements = [c.args[0] for c in session.run.call_args_list]
+    assert statements[0] == "MATCH (p:QueryPattern:Test_abc123) DELETE p"
+    assert not any("Test_abc123" in stmt for stmt in statements[1:])
+
+
+def test_invalid_scope_label_rejected():
+    """Test scope labels must be plain identifiers."""
+    with pytest.raises(ValidationError):
+        QueryPatternMemory(MagicMock(), scope_label="Test) DETACH DELETE (n")
+
+
+@pytest.mark.asyncio
+async def test_bump_pattern_single_write():
+    """Test bump_pattern adds delta observations in one query."""
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.return_value.single.return_value = {"pattern_id": "p1"}
+    memory = QueryPatternMemory(driver)
+    
+    pattern_id = await memory.bump_pattern(
+        QueryType.LIST, [EntityType.VENDOR], {"tier": "Critical"}, delta=5
+    )
+    
+    assert pattern_id == "p1"
+    assert session.run.call_count == 1
+    assert session.run.call_args.kwargs["delta"] == 5
+
+
+@pytest.mark.asyncio
+async def test_bump_pattern_rejects_non_positive_delta(pattern_memory):
+    """Test bump_pattern requires a positive delta."""
+    with pytest.raises(ValidationError):
+        await pattern_memory.bump_pattern(QueryType.LIST, [EntityType.VENDOR], delta=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_serialize_on_shared_session():
+    """Test concurrent operations never overlap on the one session."""
+    active = []
+    overlaps = []
+    
+    class _SlowResult:
+        async def single(self):
+            await asyncio.sleep(0)
+            active.pop()
+            return {"pattern_id": "p1"}
+    
+    async def run(query, **params):
+        if active:
+            overlaps.append(query)
+        active.append(query)
+        await asyncio.sleep(0)
+        return _SlowResult()
+    
+    driver = FakeAsyncDriver()
+    driver._session.run = run
+    memory = QueryPatternMemory(driver)
+    
+    await asyncio.gather(*(
+        memory.record_pattern(QueryType.LIST, [EntityType.VENDOR])
+        for _ in range(5)
+    ))
+    
+    assert overlaps == []
+    driver.session.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_session(make_session, pattern_memory):
+    """Test aclose exits the shared session and a later call reopens it."""
+    session = make_session({"deleted": 1})
+    session.__aexit__ = AsyncMock(return_value=None)
+    
+    await pattern_memory.delete("p1")
+    await pattern_memory.aclose()
+    await pattern_memory.aclose()
+    
+    session.__aexit__.assert_awaited_once()
+    assert pattern_memory._session is None
+
+
+def test_close_sync_session():
+    """Test close() releases a sync driver's session."""
+    driver = MagicMock()
+    memory = QueryPatternMemory(driver)
+    asyncio.run(memory.clear())
+    
+    memory.close()
+    
+    driver.session.return_value.close.assert_called_once()
+
+
+def test_session_owned_by_one_event_loop():
+    """Test another loop is rejected while the session is open, then may take over."""
+    driver = FakeAsyncDriver()
+    driver._result.single = _acoro({"deleted": 1})
+    memory = QueryPatternMemory(driver)
+    owner = asyncio.new_event_loop()
+    try:
+        owner.run_until_complete(memory.delete("p1"))
+        
+        with pytest.raises(MemoryError, match="another event loop"):
+            asyncio.run(memory.delete("p1"))
+        
+        owner.run_until_complete(memory.aclose())
+    finally:
+        owner.close()
+    
+    assert asyncio.run(memory.delete("p1")) is True
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for orchestration unit tests
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock
+
+from neo4j_orchestration.planning.intent import QueryIntent, QueryType, EntityType
+from neo4j_orchestration.execution.result import QueryResult, ExecutionMetadata
+
+
+@pytest.fixture(scope="session")
+def history_timestamp():
+    """Fixed conversation-history timestamp; no test inspects its value."""
+    return datetime(2024, 1, 1, 12, 0, 0).isoformat()
+
+
+@pytest.fixture
+def mock_working_memory():
+    """Create mock WorkingMemory."""
+    memory = Mock()
+    memory.get = AsyncMock(return_value=None)
+    memory.set = AsyncMock()
+    memory.delete = AsyncMock()
+    return memory
+
+
+@pytest.fixture(scope="module")
+def sample_intent():
+    """Create sample QueryIntent (read-only, shared per module)."""
+    # Known-valid enum values, so skip __post_init__ coercion/validation
+    return QueryIntent._fast(
+        query_type=QueryType.LIST,
+        entities=[EntityType.VENDOR],
+        filters=[],
+        aggregations=[],
+        sort_by=None,
+        sort_order="ASC",  # Changed to uppercase
+        limit=None,
+        include_relationships=False,
+        confidence=0.9
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_result():
+    """Create sample QueryResult (read-only, shared per module)."""
+    return QueryResult(
+        records=[{"name": "Vendor A"}, {"name": "Vendor B"}],
+        summary="Query completed successfully",
+        metadata=ExecutionMetadata(
+            query="MATCH (v:Vendor) RETURN v",
+            parameters={},
+            result_available_after=10,
+            result_consumed_after=20
+        )
+    )
@@ -1,21 +1,26 @@
 """Unit tests for orchestrator configuration."""
 
 import pytest
+from pydantic import ValidationError
 from neo4j_orchestration.orchestration.config import OrchestratorConfig
 
 
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration, validated once (frozen, so safe to share)."""
+    return OrchestratorConfig()
+
+
 class TestOrchestratorConfig:
     """Test suite for OrchestratorConfig."""
     
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default configuration values."""
-        config = OrchestratorConfig()
-        
-        assert config.enable_history is True
-        assert config.enable_caching is True
-        assert config.enable_context is True
-        assert config.cache_ttl_seconds == 300
-        assert config.max_history_size == 100
+        assert default_config.enable_history is True
+        assert default_config.enable_caching is True
+        assert default_config.enable_context is True
+        assert default_config.cache_ttl_seconds == 300
+        assert default_config.max_history_size == 100
     
     def test_custom_config(self):
         """Test custom configuration."""
@@ -35,15 +40,15 @@ class TestOrchestratorConfig:
         """Test that config is immutable."""
         config = OrchestratorConfig()
         
-        with pytest.raises(Exception):  # Pydantic raises ValidationError
+        with pytest.raises(ValidationError):
             config.enable_history = False
     
     def test_cache_ttl_validation(self):
         """Test cache TTL must be non-negative."""
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             OrchestratorConfig(cache_ttl_seconds=-1)
     
     def test_max_history_validation(self):
         """Test max history must be positive."""
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             OrchestratorConfig(max_history_size=0)
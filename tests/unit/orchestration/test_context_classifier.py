@@ -1,9 +1,15 @@
 """
 Unit tests for ContextAwareClassifier
 """
+import asyncio
+import gc
+import re
+import threading
+
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock
 
+from neo4j_orchestration.orchestration import context_classifier as cc
 from neo4j_orchestration.orchestration.context_classifier import (
     ContextAwareClassifier,
     classify_with_context
@@ -69,6 +75,16 @@ class TestContextAwareClassifier:
         
         assert classifier.base_classifier == mock_base_classifier
     
+    def test_default_base_classifier_is_shared(self):
+        """Test classifiers without a base share the default instance."""
+        from neo4j_orchestration.planning.classifier import get_default_classifier
+        
+        first = ContextAwareClassifier()
+        second = ContextAwareClassifier()
+        
+        assert first.base_classifier is get_default_classifier()
+        assert second.base_classifier is first.base_classifier
+    
     def test_classify_without_context(self, mock_base_classifier, vendor_intent):
         """Test classification without context falls back to base."""
         mock_base_classifier.classify.return_value = vendor_intent
@@ -82,6 +98,45 @@ class TestContextAwareClassifier:
         assert result == vendor_intent
         mock_base_classifier.classify.assert_called_once_with("Show all vendors")
     
+    def test_classify_without_context_is_memoized(
+        self,
+        mock_base_classifier,
+        vendor_intent
+    ):
+        """Test repeated queries reuse the cached base classification."""
+        mock_base_classifier.classify.return_value = vendor_intent
+        classifier = ContextAwareClassifier(mock_base_classifier)
+        
+        first = classifier.classify_with_context("Show all vendors", None)
+        second = classifier.classify_with_context("Show all vendors", None)
+        
+        assert mock_base_classifier.classify.call_count == 1
+        assert classifier.cache_info().hits == 1
+        assert first == second
+        assert first is not second
+        assert first.entities is not second.entities
+    
+    def test_followup_cache_keyed_on_context(
+        self,
+        mock_base_classifier,
+        mock_context,
+        unknown_intent
+    ):
+        """Test follow-ups are cached per context fingerprint."""
+        mock_base_classifier.classify.side_effect = lambda q: unknown_intent._copy()
+        classifier = ContextAwareClassifier(mock_base_classifier)
+        
+        mock_context.get_last_entities.return_value = [EntityType.VENDOR]
+        vendors = classifier.classify_with_context("which ones", mock_context)
+        classifier.classify_with_context("which ones", mock_context)
+        
+        mock_context.get_last_entities.return_value = [EntityType.CONTROL]
+        controls = classifier.classify_with_context("which ones", mock_context)
+        
+        assert vendors.entities == [EntityType.VENDOR]
+        assert controls.entities == [EntityType.CONTROL]
+        assert mock_base_classifier.classify.call_count == 2
+    
     def test_is_followup_query_with_pronouns(self, mock_base_classifier):
         """Test follow-up detection with pronouns."""
         classifier = ContextAwareClassifier(mock_base_classifier)
@@ -127,6 +182,28 @@ class TestContextAwareClassifier:
         assert classifier._is_simple_followup("List all controls") is False
         assert classifier._is_simple_followup("Get me the report") is False
     
+    @pytest.mark.parametrize("query", [
+        "show them",
+        "which ones have risks?",
+        "how many controls",
+        "show me the ones in technology",
+        "narrow it down",
+        "and controls too",
+        "list all vendors",
+        "what about finance",
+        "by region",
+        "get me the report",
+    ])
+    def test_followup_patterns_precompiled(self, query):
+        """Test combined regexes agree with their individual patterns."""
+        assert isinstance(cc._FOLLOWUP_RE, re.Pattern)
+        assert (cc._FOLLOWUP_RE.search(query) is not None) == any(
+            re.search(p, query) for p in cc._FOLLOWUP_PATTERNS
+        )
+        assert (cc._SIMPLE_FOLLOWUP_RE.match(query) is not None) == any(
+            re.match(p, query) for p in cc._SIMPLE_FOLLOWUP_PATTERNS
+        )
+    
     def test_enhance_with_context_inherits_entities(
         self,
         mock_base_classifier,
@@ -139,19 +216,13 @@ class TestContextAwareClassifier:
         
         classifier = ContextAwareClassifier(mock_base_classifier)
         
-        # Sync call to async method - need to patch event loop
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.is_running.return_value = False
-            mock_loop.return_value.run_until_complete.side_effect = [
-                [EntityType.VENDOR, EntityType.CONTROL],  # get_last_entities
-                QueryType.LIST  # get_last_query_type
-            ]
-            
-            enhanced = classifier._enhance_with_context(
-                intent=unknown_intent,
-                query="which ones",
-                context=mock_context
-            )
+        mock_context.get_last_query_type.return_value = QueryType.LIST
+        
+        enhanced = classifier._enhance_with_context(
+            intent=unknown_intent,
+            query="which ones",
+            context=mock_context
+        )
         
         # Should inherit entities
         assert EntityType.VENDOR in enhanced.entities
@@ -166,18 +237,14 @@ class TestContextAwareClassifier:
         """Test that existing entities are preserved."""
         classifier = ContextAwareClassifier(mock_base_classifier)
         
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.is_running.return_value = False
-            mock_loop.return_value.run_until_complete.side_effect = [
-                [EntityType.CONTROL],  # get_last_entities
-                QueryType.FILTER  # get_last_query_type
-            ]
-            
-            enhanced = classifier._enhance_with_context(
-                intent=vendor_intent,  # Already has VENDOR entity
-                query="show controls",
-                context=mock_context
-            )
+        mock_context.get_last_entities.return_value = [EntityType.CONTROL]
+        mock_context.get_last_query_type.return_value = QueryType.FILTER
+        
+        enhanced = classifier._enhance_with_context(
+            intent=vendor_intent,  # Already has VENDOR entity
+            query="show controls",
+            context=mock_context
+        )
         
         # Should keep original entities
         assert enhanced.entities == [EntityType.VENDOR]
@@ -191,22 +258,76 @@ class TestContextAwareClassifier:
         """Test inferring query type from context."""
         classifier = ContextAwareClassifier(mock_base_classifier)
         
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.is_running.return_value = False
-            mock_loop.return_value.run_until_complete.side_effect = [
-                [EntityType.VENDOR],  # get_last_entities
-                QueryType.ANALYZE  # get_last_query_type
-            ]
-            
-            enhanced = classifier._enhance_with_context(
-                intent=unknown_intent,
-                query="only critical",  # Simple follow-up
-                context=mock_context
-            )
+        mock_context.get_last_entities.return_value = [EntityType.VENDOR]
+        mock_context.get_last_query_type.return_value = QueryType.ANALYZE
+        
+        enhanced = classifier._enhance_with_context(
+            intent=unknown_intent,
+            query="only critical",  # Simple follow-up
+            context=mock_context
+        )
         
         # Should inherit query type
         assert enhanced.query_type == QueryType.ANALYZE
     
+    def test_enhance_with_context_reuses_thread_loop(
+        self,
+        mock_base_classifier,
+        mock_context,
+        unknown_intent
+    ):
+        """Test sync context reads share one cached event loop per thread."""
+        classifier = ContextAwareClassifier(mock_base_classifier)
+        
+        loop = cc._get_sync_loop()
+        classifier._enhance_with_context(unknown_intent, "which ones", mock_context)
+        
+        assert cc._get_sync_loop() is loop
+        mock_context.get_last_entities.assert_awaited_once_with(n=2)
+        mock_context.get_last_query_type.assert_awaited_once_with()
+    
+    def test_close_releases_thread_loop(self, mock_base_classifier):
+        """Test close() clears the cache and closes this thread's loop."""
+        classifier = ContextAwareClassifier(mock_base_classifier)
+        loop = cc._get_sync_loop()
+        classifier.classify_with_context("Show vendors")
+        
+        classifier.close()
+        
+        assert loop.is_closed()
+        assert classifier.cache_info().currsize == 0
+        assert cc._get_sync_loop() is not loop
+    
+    def test_thread_loop_closed_on_thread_exit(self):
+        """Test a worker thread's cached loop is closed when the thread ends."""
+        loops = []
+        worker = threading.Thread(target=lambda: loops.append(cc._get_sync_loop()))
+        worker.start()
+        worker.join()
+        gc.collect()
+        
+        assert loops[0].is_closed()
+    
+    def test_enhance_with_context_inside_running_loop(
+        self,
+        mock_base_classifier,
+        mock_context,
+        unknown_intent
+    ):
+        """Test context reads are skipped when called from a running loop."""
+        classifier = ContextAwareClassifier(mock_base_classifier)
+        mock_context.get_last_entities.return_value = [EntityType.VENDOR]
+        
+        async def enhance():
+            return classifier._enhance_with_context(
+                unknown_intent, "which ones", mock_context
+            )
+        
+        enhanced = asyncio.run(enhance())
+        
+        assert enhanced.entities == []
+        mock_context.get_last_entities.assert_not_called()
+    
     def test_convenience_function(self, mock_base_classifier, vendor_intent):
         """Test convenience function."""
         mock_base_classifier.classify.return_value = vendor_intent
@@ -225,24 +346,19 @@ class TestContextAwareClassifierIntegration:
     
     def test_pronoun_resolution_flow(self, mock_context):
         """Test end-to-end pronoun resolution."""
-        from neo4j_orchestration.planning.classifier import QueryIntentClassifier
+        from neo4j_orchestration.planning.classifier import get_default_classifier
         
-        base_classifier = QueryIntentClassifier()
-        context_classifier = ContextAwareClassifier(base_classifier)
+        context_classifier = ContextAwareClassifier(get_default_classifier())
         
         # Mock context to return vendor entities
-        with patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.is_running.return_value = False
-            mock_loop.return_value.run_until_complete.side_effect = [
-                [EntityType.VENDOR],  # get_last_entities
-                QueryType.ANALYZE  # get_last_query_type (changed to VENDOR_RISK)
-            ]
-            
-            # Follow-up query with pronoun
-            result = context_classifier.classify_with_context(
-                query="which ones have critical risks",
-                context=mock_context
-            )
+        mock_context.get_last_entities.return_value = [EntityType.VENDOR]
+        mock_context.get_last_query_type.return_value = QueryType.ANALYZE
+        
+        # Follow-up query with pronoun
+        result = context_classifier.classify_with_context(
+            query="which ones have critical risks",
+            context=mock_context
+        )
         
         # Should have vendor entity (either from base classifier or context)
         # The base classifier detects "critical" and creates VENDOR_RISK with RISK entity
@@ -0,0 +1,189 @@
+"""
+Unit tests for ConversationContext history reads and serialization
+"""
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from neo4j_orchestration.orchestration.context import ConversationContext
+from neo4j_orchestration.planning.intent import QueryType, EntityType
+from neo4j_orchestration.core.types import MemoryEntry, MemoryType
+
+
+@pytest.fixture(scope="module")
+def shared_mock_wm():
+    """Module-wide mock WorkingMemory for tests that only read."""
+    return Mock(
+        get=AsyncMock(return_value=None),
+        set=AsyncMock(),
+        delete=AsyncMock()
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_ctx(shared_mock_wm):
+    """Module-wide context over an empty history (read-only tests)."""
+    return ConversationContext(shared_mock_wm, "session1")
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared(shared_mock_wm):
+    """Clear recorded calls on the shared mock after each test."""
+    yield
+    shared_mock_wm.reset_mock()
+    shared_mock_wm.get.return_value = None
+
+
+class TestContextHistory:
+    """Test ConversationContext history accessors."""
+    
+    pytestmark = pytest.mark.asyncio
+    
+    async def test_get_last_entities_empty_history(self, shared_ctx):
+        """Test getting entities from empty history."""
+        entities = await shared_ctx.get_last_entities()
+        
+        assert entities == []
+    
+    async def test_get_last_entities_single_query(self, history_timestamp, mock_working_memory):
+        """Test getting entities from single query."""
+        history = [{
+            "query": "Show vendors",
+            "intent": {
+                "query_type": "VENDOR_LIST",
+                "entities": ["VENDOR", "CONTROL"]
+            },
+            "timestamp": history_timestamp
+        }]
+        
+        mock_working_memory.get.return_value = MemoryEntry(
+            key="test",
+            value=history,
+            memory_type=MemoryType.WORKING
+        )
+        
+        context = ConversationContext(mock_working_memory, "session1")
+        entities = await context.get_last_entities()
+        
+        assert entities == [EntityType.VENDOR, EntityType.CONTROL]
+    
+    async def test_get_last_entities_multiple_queries(self, history_timestamp, mock_working_memory):
+        """Test getting entities from multiple queries."""
+        history = [
+            {
+                "query": "Show vendors",
+                "intent": {"entities": ["VENDOR"]},
+                "timestamp": history_timestamp
+            },
+            {
+                "query": "Show controls",
+                "intent": {"entities": ["CONTROL"]},
+                "timestamp": history_timestamp
+            }
+        ]
+        
+        mock_working_memory.get.return_value = MemoryEntry(
+            key="test",
+            value=history,
+            memory_type=MemoryType.WORKING
+        )
+        
+        context = ConversationContext(mock_working_memory, "session1")
+        entities = await context.get_last_entities(n=2)
+        
+        # Should return most recent first
+        assert EntityType.CONTROL in entities
+        assert EntityType.VENDOR in entities
+    
+    async def test_get_last_query_type(self, history_timestamp, mock_working_memory):
+        """Test getting last query type."""
+        history = [{
+            "query": "Show vendors",
+            "intent": {"query_type": "ANALYZE"},
+            "timestamp": history_timestamp
+        }]
+        
+        mock_working_memory.get.return_value = MemoryEntry(
+            key="test",
+            value=history,
+            memory_type=MemoryType.WORKING
+        )
+        
+        context = ConversationContext(mock_working_memory, "session1")
+        query_type = await context.get_last_query_type()
+        
+        assert query_type == QueryType.ANALYZE
+    
+    async def test_unknown_stored_names_skipped(self, history_timestamp, mock_working_memory):
+        """Test unrecognized enum names in stored history are ignored."""
+        history = [{
+            "query": "Show vendors",
+            "intent": {"query_type": "NOT_A_TYPE", "entities": ["VENDOR", "BOGUS"]},
+            "timestamp": history_timestamp
+        }]
+        
+        mock_working_memory.get.return_value = MemoryEntry(
+            key="test",
+            value=history,
+            memory_type=MemoryType.WORKING
+        )
+        
+        context = ConversationContext(mock_working_memory, "session1")
+        
+        assert await context.get_last_query_type() is None
+        assert await context.get_last_entities() == [EntityType.VENDOR]
+    
+    async def test_get_last_query_type_empty(self, shared_ctx):
+        """Test getting query type from empty history."""
+        query_type = await shared_ctx.get_last_query_type()
+        
+        assert query_type is None
+    
+    async def test_get_last_query(self, history_timestamp, mock_working_memory):
+        """Test getting last query string."""
+        history = [{
+            "query": "Show all vendors with critical risks",
+            "intent": {"query_type": "ANALYZE"},
+            "timestamp": history_timestamp
+        }]
+        
+        mock_working_memory.get.return_value = MemoryEntry(
+            key="test",
+            value=history,
+            memory_type=MemoryType.WORKING
+        )
+        
+        context = ConversationContext(mock_working_memory, "session1")
+        query = await context.get_last_query()
+        
+        assert query == "Show all vendors with critical risks"
+    
+    async def test_clear(self, mock_working_memory):
+        """Test clearing conversation history."""
+        context = ConversationContext(mock_working_memory, "session1")
+        
+        await context.clear()
+        
+        mock_working_memory.delete.assert_called_once_with(
+            "conversation:session1:history"
+        )
+
+
+class TestContextSerialization:
+    """Test ConversationContext's synchronous serialization helpers."""
+    
+    def test_serialize_intent(self, shared_ctx, sample_intent):
+        """Test intent serialization."""
+        serialized = shared_ctx._serialize_intent(sample_intent)
+        
+        assert serialized["query_type"] == "LIST"
+        assert serialized["entities"] == ["VENDOR"]
+        assert serialized["confidence"] == 0.9
+        assert serialized["has_filters"] is False
+        assert serialized["has_aggregations"] is False
+    
+    def test_summarize_result(self, shared_ctx, sample_result):
+        """Test result summarization."""
+        summary = shared_ctx._summarize_result(sample_result)
+        
+        assert summary["record_count"] == 2
+        assert summary["has_data"] is True
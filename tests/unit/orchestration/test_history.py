@@ -1,9 +1,12 @@
 """Unit tests for query history tracking."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timedelta
 from neo4j_orchestration.orchestration.history import QueryHistory, QueryRecord
 from neo4j_orchestration.memory.episodic import SimpleEpisodicMemory, Event
+from neo4j_orchestration.planning.intent import EntityType
 
 
 class TestQueryRecord:
@@ -41,6 +44,30 @@ class TestQueryRecord:
         assert record.error_message == "Invalid syntax"
         assert record.result_count == 0
     
+    def test_query_record_is_frozen_and_slotted(self):
+        """Test records are immutable and carry no per-instance __dict__."""
+        record = QueryRecord(
+            query_id="test-789",
+            natural_language="Show vendors",
+            intent={},
+            cypher_query="MATCH (v:Vendor) RETURN v",
+        )
+        
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.success = False
+    
+    def test_query_record_rejects_negative_counts(self):
+        """Test negative result counts and timings are rejected."""
+        with pytest.raises(ValueError, match="result_count"):
+            QueryRecord(
+                query_id="bad",
+                natural_language="Show vendors",
+                intent={},
+                cypher_query="",
+                result_count=-1,
+            )
+    
     def test_record_to_event_conversion(self):
         """Test converting QueryRecord to Event."""
         record = QueryRecord(
@@ -130,6 +157,21 @@ class TestQueryHistory:
         assert records[1].query_id == "q1"
         assert records[2].query_id == "q0"
     
+    def test_get_history_small_limit_on_large_history(self):
+        """Test a small limit returns only the newest records, newest first."""
+        history = QueryHistory(SimpleEpisodicMemory(), max_size=1000)
+        for i in range(1000):
+            history.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={},
+                cypher_query="MATCH (n) RETURN n",
+            ))
+        
+        records = history.get_history(limit=5)
+        
+        assert [r.query_id for r in records] == [f"q{i}" for i in range(999, 994, -1)]
+    
     def test_get_successful_queries(self, history):
         """Test filtering successful queries."""
         # Add successful query
@@ -198,6 +240,58 @@ class TestQueryHistory:
         assert len(vendor_queries) == 2
         assert all(r.intent.get("entity_type") == "Vendor" for r in vendor_queries)
     
+    def test_search_by_entity_type_uses_index(self):
+        """Test entity search finds older matches past unrelated records."""
+        history = QueryHistory(SimpleEpisodicMemory(), max_size=300)
+        history.add_query(QueryRecord(
+            query_id="v1",
+            natural_language="Find vendors",
+            intent={"entities": [EntityType.VENDOR]},
+            cypher_query="MATCH (v:Vendor) RETURN v",
+        ))
+        for i in range(200):
+            history.add_query(QueryRecord(
+                query_id=f"c{i}",
+                natural_language="Find controls",
+                intent={"entity_type": "Control"},
+                cypher_query="MATCH (c:Control) RETURN c",
+            ))
+        
+        vendor_queries = history.search_by_entity_type("Vendor", limit=5)
+        
+        assert [r.query_id for r in vendor_queries] == ["v1"]
+        assert len(history.search_by_entity_type("Control", limit=3)) == 3
+    
+    def test_evicted_records_leave_entity_index(self):
+        """Test pruned records no longer match entity searches."""
+        history = QueryHistory(SimpleEpisodicMemory(), max_size=2)
+        for query_id, entity in [("v1", "Vendor"), ("c1", "Control"), ("c2", "Control")]:
+            history.add_query(QueryRecord(
+                query_id=query_id,
+                natural_language="Query",
+                intent={"entity_type": entity},
+                cypher_query="MATCH (n) RETURN n",
+            ))
+        
+        assert history.search_by_entity_type("Vendor") == []
+        assert [r.query_id for r in history.search_by_entity_type("Control")] == [
+            "c2", "c1"
+        ]
+    
+    def test_evicted_records_leave_successful_queries(self):
+        """Test pruned records are no longer returned as successful."""
+        history = QueryHistory(SimpleEpisodicMemory(), max_size=2)
+        for query_id, success in [("ok1", True), ("bad", False), ("ok2", True)]:
+            history.add_query(QueryRecord(
+                query_id=query_id,
+                natural_language="Query",
+                intent={},
+                cypher_query="MATCH (n) RETURN n",
+                success=success,
+            ))
+        
+        assert [r.query_id for r in history.get_successful_queries()] == ["ok2"]
+    
     def test_empty_history(self, history):
         """Test behavior with empty history."""
         assert history.get_last_query() is None
@@ -230,3 +324,119 @@ class TestQueryHistory:
         assert "q2" in query_ids
         assert "q0" not in query_ids
         assert "q1" not in query_ids
+    
+    def test_pruning_evicts_episodic_events(self):
+        """Test evicted records are also removed from episodic memory."""
+        memory = SimpleEpisodicMemory()
+        history = QueryHistory(memory, max_size=2)
+        
+        for i in range(4):
+            history.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={},
+                cypher_query="MATCH (n) RETURN n",
+            ))
+        
+        history.flush()
+        
+        assert set(memory.memory_store) == {"q2", "q3"}
+        assert history.get_last_query().query_id == "q3"
+    
+    def test_episodic_writes_are_batched(self):
+        """Test events reach episodic memory once the buffer fills."""
+        memory = SimpleEpisodicMemory()
+        history = QueryHistory(memory, max_size=100)
+        
+        def add(i):
+            history.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={},
+                cypher_query="MATCH (n) RETURN n",
+            ))
+        
+        for i in range(QueryHistory.FLUSH_THRESHOLD - 1):
+            add(i)
+        
+        assert memory.memory_store == {}
+        assert history.get_last_query().query_id == f"q{QueryHistory.FLUSH_THRESHOLD - 2}"
+        
+        add(QueryHistory.FLUSH_THRESHOLD - 1)
+        
+        assert len(memory.memory_store) == QueryHistory.FLUSH_THRESHOLD
+    
+    def test_reopened_history_loads_existing_events(self):
+        """Test a history opened over a populated store sees its records."""
+        memory = SimpleEpisodicMemory()
+        history = QueryHistory(memory, max_size=10)
+        base = datetime(2026, 1, 1)
+        for i, success in enumerate([True, False, True]):
+            history.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={"entity_type": "Vendor"},
+                cypher_query="MATCH (v:Vendor) RETURN v",
+                timestamp=base + timedelta(seconds=i),
+                success=success,
+            ))
+        history.flush()
+        
+        reopened = QueryHistory(memory, max_size=10)
+        
+        assert [r.query_id for r in reopened.get_history()] == ["q2", "q1", "q0"]
+        assert [r.query_id for r in reopened.get_successful_queries()] == ["q2", "q0"]
+        assert [r.query_id for r in reopened.search_by_entity_type("Vendor")] == [
+            "q2", "q1", "q0"
+        ]
+    
+    def test_flush_prunes_surplus_store_events(self):
+        """Test flush trims events left by a history with a larger max_size."""
+        memory = SimpleEpisodicMemory()
+        base = datetime(2026, 1, 1)
+        larger = QueryHistory(memory, max_size=10)
+        for i in range(6):
+            larger.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={},
+                cypher_query="MATCH (n) RETURN n",
+                timestamp=base + timedelta(seconds=i),
+            ))
+        larger.flush()
+        
+        history = QueryHistory(memory, max_size=3)
+        history.add_query(QueryRecord(
+            query_id="q6",
+            natural_language="Query 6",
+            intent={},
+            cypher_query="MATCH (n) RETURN n",
+            timestamp=base + timedelta(seconds=6),
+        ))
+        history.flush()
+        
+        assert set(memory.memory_store) == {"q4", "q5", "q6"}
+        assert [r.query_id for r in history.get_history()] == ["q6", "q5", "q4"]
+    
+    def test_histories_sharing_a_store_converge_on_flush(self):
+        """Test a flush resyncs with events written by another history."""
+        memory = SimpleEpisodicMemory()
+        base = datetime(2026, 1, 1)
+        first = QueryHistory(memory, max_size=3)
+        second = QueryHistory(memory, max_size=3)
+        
+        for i, history in enumerate([first, second, first, second]):
+            history.add_query(QueryRecord(
+                query_id=f"q{i}",
+                natural_language=f"Query {i}",
+                intent={"entity_type": "Vendor"},
+                cypher_query="MATCH (v:Vendor) RETURN v",
+                timestamp=base + timedelta(seconds=i),
+            ))
+            history.flush()
+        
+        assert set(memory.memory_store) == {"q1", "q2", "q3"}
+        assert [r.query_id for r in second.get_history()] == ["q3", "q2", "q1"]
+        assert [r.query_id for r in second.search_by_entity_type("Vendor")] == [
+            "q3", "q2", "q1"
+        ]
@@ -1,44 +1,124 @@
 """Unit tests for query orchestrator."""
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
 import pytest
-from unittest.mock import Mock, patch
 from neo4j_orchestration.orchestration import QueryOrchestrator, OrchestratorConfig
-from neo4j_orchestration.execution import QueryExecutor, QueryResult, ExecutionMetadata
+from neo4j_orchestration.execution import QueryResult, ExecutionMetadata
+from neo4j_orchestration.planning import get_default_classifier, get_default_generator
 from neo4j_orchestration.planning.intent import QueryIntent, QueryType, EntityType
 from neo4j_orchestration.memory.episodic import SimpleEpisodicMemory
 
 
+_CYPHER = "MATCH (v:Vendor) RETURN v"
+
+_RESULT = QueryResult(
+    records=[{"name": "Vendor1"}, {"name": "Vendor2"}],
+    metadata=ExecutionMetadata(
+        query=_CYPHER,
+        parameters={},
+        result_available_after=10,
+        result_consumed_after=20,
+    ),
+    summary="Query completed successfully",
+)
+
+
+class _StubExecutor:
+    """Executor stand-in returning a fixed result and counting calls."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.closed = False
+    
+    def execute(self, query, parameters=None):
+        self.calls += 1
+        return _RESULT
+    
+    async def aexecute(self, query, parameters=None):
+        self.calls += 1
+        return _RESULT
+    
+    async def aclose(self):
+        self.closed = True
+
+
+class _StubClassifier:
+    """Classifier stand-in that always returns the same intent."""
+    
+    def __init__(self, intent):
+        self.intent = intent
+        self.calls = 0
+    
+    def classify(self, query):
+        self.calls += 1
+        return self.intent
+
+
+class _StubGenerator:
+    """Generator stand-in recording intents; raises ``error`` when set."""
+    
+    def __init__(self, error=None):
+        self.error = error
+        self.intents = []
+    
+    def generate(self, intent):
+        self.intents.append(intent)
+        if self.error is not None:
+            raise self.error
+        return _CYPHER, {}
+
+
+@pytest.fixture(scope="module")
+def mock_executor():
+    """Create a stub executor shared by the module."""
+    return _StubExecutor()
+
+
+@pytest.fixture(scope="module")
+def mock_executor_with_driver():
+    """Create a mock executor with driver, built once for the module."""
+    executor = Mock()
+    executor.driver = Mock()  # Add driver for QueryPatternMemory
+    
+    # Mock successful query execution
+    executor.execute.return_value = _RESULT
+    
+    return executor
+
+
+@pytest.fixture(scope="module")
+def mock_intent():
+    """Create a mock QueryIntent."""
+    return QueryIntent(
+        query_type=QueryType.VENDOR_LIST,
+        entities=[EntityType.VENDOR],
+        filters=[],
+    )
+
+
 class TestQueryOrchestrator:
     """Tests for QueryOrchestrator."""
     
-    @pytest.fixture
-    def mock_executor(self):
-        """Create a mock executor."""
-        executor = Mock(spec=QueryExecutor)
-        
-        # Mock successful query execution
-        result = QueryResult(
-            records=[{"name": "Vendor1"}, {"name": "Vendor2"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Query completed successfully",
-        )
-        executor.execute.return_value = result
-        
-        return executor
+    @pytest.fixture(autouse=True)
+    def reset_executor(self, mock_executor):
+        """Reset the shared executor's call count for each test."""
+        mock_executor.calls = 0
+        mock_executor.closed = False
     
     @pytest.fixture
-    def mock_intent(self):
-        """Create a mock QueryIntent."""
-        return QueryIntent(
-            query_type=QueryType.VENDOR_LIST,
-            entities=[EntityType.VENDOR],
-            filters=[],
-        )
+    def make_orchestrator(self, mock_executor, mock_intent):
+        """Build an orchestrator wired to stub classifier and generator."""
+        def make(config=None, generator=None):
+            return QueryOrchestrator(
+                mock_executor,
+                config=config,
+                classifier=_StubClassifier(mock_intent),
+                generator=generator or _StubGenerator(),
+            )
+        return make
     
     def test_initialization(self, mock_executor):
         """Test orchestrator initialization."""
@@ -50,6 +130,76 @@ class TestQueryOrchestrator:
         assert orchestrator.generator is not None
         assert orchestrator.history is not None
     
+    def test_default_components_shared(self, mock_executor):
+        """Test orchestrators share one default classifier and generator."""
+        first = QueryOrchestrator(mock_executor)
+        second = QueryOrchestrator(mock_executor)
+        
+        assert first.classifier is second.classifier
+        assert first.generator is second.generator
+        assert first.classifier is get_default_classifier()
+        assert first.generator is get_default_generator()
+    
+    def test_injected_components_used(self, mock_executor, mock_intent):
+        """Test classifier and generator can be passed in."""
+        classifier = _StubClassifier(mock_intent)
+        generator = _StubGenerator()
+        
+        orchestrator = QueryOrchestrator(
+            mock_executor, classifier=classifier, generator=generator
+        )
+        
+        assert orchestrator.classifier is classifier
+        assert orchestrator.generator is generator
+    
+    def test_intent_classified_once_and_reused(self, mock_executor, mock_intent):
+        """Test the generator receives the classifier's intent object."""
+        classifier = _StubClassifier(mock_intent)
+        generator = _StubGenerator()
+        orchestrator = QueryOrchestrator(
+            mock_executor, classifier=classifier, generator=generator
+        )
+        
+        orchestrator.query("Show vendors")
+        
+        assert classifier.calls == 1
+        assert len(generator.intents) == 1
+        assert generator.intents[0] is mock_intent
+    
+    @pytest.mark.asyncio
+    async def test_aquery(self, make_orchestrator, mock_executor):
+        """Test async query execution through executor.aexecute."""
+        orchestrator = make_orchestrator()
+        
+        result = await orchestrator.aquery("Show vendors")
+        
+        assert result is _RESULT
+        assert mock_executor.calls == 1
+        assert orchestrator.get_history(limit=1)[0].success is True
+    
+    @pytest.mark.asyncio
+    async def test_aclose_releases_executor(self, make_orchestrator, mock_executor):
+        """Test aclose flushes history and awaits executor.aclose."""
+        orchestrator = make_orchestrator()
+        await orchestrator.aquery("Show vendors")
+        
+        await orchestrator.aclose()
+        
+        assert mock_executor.closed is True
+        assert orchestrator.episodic_memory.memory_store
+    
+    @pytest.mark.asyncio
+    async def test_aquery_failure_recorded(self, make_orchestrator):
+        """Test async query failures are logged to history and re-raised."""
+        orchestrator = make_orchestrator(generator=_StubGenerator(Exception("Error")))
+        
+        with pytest.raises(Exception, match="^Error$"):
+            await orchestrator.aquery("Bad query")
+        
+        last = orchestrator.get_history(limit=1)[0]
+        assert last.success is False
+        assert last.error_message == "Error"
+    
     def test_custom_config(self, mock_executor):
         """Test orchestrator with custom config."""
         config = OrchestratorConfig(
@@ -62,40 +212,18 @@ class TestQueryOrchestrator:
         assert orchestrator.config.enable_history is False
         assert orchestrator.config.max_history_size == 50
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_successful_query(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_successful_query(self, make_orchestrator, mock_executor):
         """Test executing a successful query."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         result = orchestrator.query("Show all vendors")
         
         assert result is not None
         assert len(result.records) == 2
-        assert mock_executor.execute.called
+        assert mock_executor.calls == 1
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_query_stores_history(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_query_stores_history(self, make_orchestrator):
         """Test that queries are stored in history."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         orchestrator.query("Show all vendors")
         
         last = orchestrator.get_last_query()
@@ -103,20 +231,9 @@ class TestQueryOrchestrator:
         assert last.natural_language == "Show all vendors"
         assert last.success is True
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_multiple_queries_in_history(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_multiple_queries_in_history(self, make_orchestrator):
         """Test multiple queries are tracked."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         
         orchestrator.query("Query 1")
         orchestrator.query("Query 2")
@@ -136,20 +253,11 @@ class TestQueryOrchestrator:
         # No queries yet
         assert orchestrator.get_last_query() is None
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_failed_query_recorded(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_failed_query_recorded(self, make_orchestrator):
         """Test that failed queries are recorded."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.side_effect = Exception("Query generation failed")
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator(
+            generator=_StubGenerator(Exception("Query generation failed"))
+        )
         
         # Execute and catch error
         with pytest.raises(Exception, match="Query generation failed"):
@@ -161,34 +269,21 @@ class TestQueryOrchestrator:
         assert last.success is False
         assert "Query generation failed" in last.error_message
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_get_successful_queries_filter(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_get_successful_queries_filter(self, make_orchestrator):
         """Test filtering for successful queries."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        generator = _StubGenerator()
+        orchestrator = make_orchestrator(generator=generator)
         
         # Add successful query
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
         orchestrator.query("Good query 1")
         
         # Add failed query
-        mock_generator.generate.side_effect = Exception("Error")
-        with pytest.raises(Exception):
+        generator.error = Exception("Error")
+        with pytest.raises(Exception, match="^Error$"):
             orchestrator.query("Bad query")
         
-        # Reset mock
-        mock_generator.generate.side_effect = None
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        
         # Add another successful query
+        generator.error = None
         orchestrator.query("Good query 2")
         
         successful = orchestrator.get_successful_queries(limit=5)
@@ -196,20 +291,9 @@ class TestQueryOrchestrator:
         assert len(successful) == 2
         assert all(r.success for r in successful)
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_search_history_by_entity(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_search_history_by_entity(self, make_orchestrator):
         """Test searching history by entity type."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         
         # Add queries
         orchestrator.query("Find vendors")
@@ -221,21 +305,10 @@ class TestQueryOrchestrator:
         # May or may not find matches depending on how intent is stored
         assert isinstance(vendor_queries, list)
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_history_disabled(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_history_disabled(self, make_orchestrator):
         """Test that history can be disabled."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
         config = OrchestratorConfig(enable_history=False)
-        orchestrator = QueryOrchestrator(mock_executor, config=config)
+        orchestrator = make_orchestrator(config=config)
         
         orchestrator.query("Test query")
         
@@ -243,40 +316,18 @@ class TestQueryOrchestrator:
         assert orchestrator.get_last_query() is None
         assert len(orchestrator.get_history()) == 0
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_execution_time_recorded(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_execution_time_recorded(self, make_orchestrator):
         """Test that execution time is recorded."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         orchestrator.query("Test query")
         
         last = orchestrator.get_last_query()
         assert last is not None
         assert last.execution_time_ms > 0
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
-    def test_query_id_generated(self, mock_gen_class, mock_clf_class, mock_executor, mock_intent):
+    def test_query_id_generated(self, make_orchestrator):
         """Test that unique query IDs are generated."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
-        orchestrator = QueryOrchestrator(mock_executor)
+        orchestrator = make_orchestrator()
         
         orchestrator.query("Query 1")
         orchestrator.query("Query 2")
@@ -285,40 +336,46 @@ class TestQueryOrchestrator:
         
         assert len(history) == 2
         assert history[0].query_id != history[1].query_id
+        assert all(len(record.query_id) < 24 for record in history)
 
 
 class TestPatternLearning:
     """Tests for pattern learning integration in QueryOrchestrator."""
     
-    @pytest.fixture
-    def mock_executor_with_driver(self):
-        """Create a mock executor with driver."""
-        executor = Mock(spec=QueryExecutor)
-        executor.driver = Mock()  # Add driver for QueryPatternMemory
-        
-        # Mock successful query execution
-        result = QueryResult(
-            records=[{"name": "Vendor1"}, {"name": "Vendor2"}],
-            metadata=ExecutionMetadata(
-                query="MATCH (v:Vendor) RETURN v",
-                parameters={},
-                result_available_after=10,
-                result_consumed_after=20,
-            ),
-            summary="Query completed successfully",
-        )
-        executor.execute.return_value = result
-        
-        return executor
+    @pytest.fixture(autouse=True)
+    def reset_executor(self, mock_executor_with_driver):
+        """Clear calls and side effects on the shared executor after each test."""
+        yield
+        mock_executor_with_driver.reset_mock(side_effect=True)
     
     @pytest.fixture
-    def mock_intent(self):
-        """Create a mock QueryIntent."""
-        return QueryIntent(
-            query_type=QueryType.VENDOR_LIST,
-            entities=[EntityType.VENDOR],
-            filters=[],
-        )
+    def patched_deps(self, monkeypatch, mock_intent):
+        """Replace the orchestrator's component classes for one test.
+        
+        A single monkeypatch teardown restores them all. Each class (or
+        shared-instance factory) mock returns a ready instance: the tracker's async methods are
+        AsyncMocks, the base classifier returns ``mock_intent`` and the
+        generator returns ``_CYPHER``.
+        """
+        module = "neo4j_orchestration.orchestration.orchestrator"
+        deps = SimpleNamespace()
+        for attr, name in (
+            ("memory_class", "QueryPatternMemory"),
+            ("tracker_class", "UserPreferenceTracker"),
+            ("classifier_class", "get_default_classifier"),
+            ("generator_class", "get_default_generator"),
+        ):
+            component_class = Mock()
+            monkeypatch.setattr(f"{module}.{name}", component_class)
+            setattr(deps, attr, component_class)
+        
+        deps.tracker = deps.tracker_class.return_value
+        deps.tracker.record_query_preference = AsyncMock(return_value=None)
+        deps.tracker.suggest_enhancements = AsyncMock(return_value=[])
+        deps.classifier_class.return_value.classify.return_value = mock_intent
+        deps.generator = deps.generator_class.return_value
+        deps.generator.generate.return_value = (_CYPHER, {})
+        return deps
     
     def test_initialization_without_pattern_learning(self, mock_executor_with_driver):
         """Test default initialization without pattern learning."""
@@ -329,22 +386,12 @@ class TestPatternLearning:
         assert orchestrator.preference_tracker is None
         assert orchestrator.classifier.__class__.__name__ == 'QueryIntentClassifier'
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
     def test_initialization_with_pattern_learning(
-        self, 
-        mock_tracker_class, 
-        mock_memory_class,
+        self,
+        patched_deps,
         mock_executor_with_driver
     ):
         """Test initialization with pattern learning enabled."""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory_class.return_value = mock_memory
-        
-        mock_tracker = Mock()
-        mock_tracker_class.return_value = mock_tracker
-        
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
             enable_pattern_learning=True
@@ -356,15 +403,37 @@ class TestPatternLearning:
         assert orchestrator.classifier.__class__.__name__ == 'PatternEnhancedClassifier'
         
         # Verify QueryPatternMemory was initialized with driver
-        mock_memory_class.assert_called_once()
-        assert mock_memory_class.call_args[1]['driver'] == mock_executor_with_driver.driver
+        patched_deps.memory_class.assert_called_once()
+        memory_kwargs = patched_deps.memory_class.call_args[1]
+        assert memory_kwargs['driver'] == mock_executor_with_driver.driver
+        assert patched_deps.tracker_class.call_args[1]['batch_size'] == 1
+    
+    def test_pattern_writes_are_batched(self, mock_executor_with_driver):
+        """Test pattern recordings reach Neo4j in batches, flushed on close."""
+        pattern_memory = Mock()
+        pattern_memory.record_pattern = AsyncMock()
+        pattern_memory.record_patterns_batch = AsyncMock()
+        pattern_memory.get_common_filters = AsyncMock(return_value={})
+        pattern_memory.aclose = AsyncMock()
+        
+        with QueryOrchestrator(
+            mock_executor_with_driver,
+            config=OrchestratorConfig(pattern_batch_size=64),
+            enable_pattern_learning=True,
+            pattern_memory=pattern_memory
+        ) as orchestrator:
+            for _ in range(100):
+                orchestrator.query("Show all vendors")
+        
+        # One full batch of 64, then the 36 still buffered at close()
+        batches = pattern_memory.record_patterns_batch.await_args_list
+        assert [len(call.args[0]) for call in batches] == [64, 36]
+        pattern_memory.record_pattern.assert_not_awaited()
+        pattern_memory.aclose.assert_awaited_once()
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
     def test_initialization_with_custom_pattern_components(
         self,
-        mock_tracker_class,
-        mock_memory_class,
+        patched_deps,
         mock_executor_with_driver
     ):
         """Test initialization with custom pattern learning components."""
@@ -382,41 +451,15 @@ class TestPatternLearning:
         assert orchestrator.preference_tracker == custom_tracker
         
         # Should not create new instances
-        mock_memory_class.assert_not_called()
-        mock_tracker_class.assert_not_called()
+        patched_deps.memory_class.assert_not_called()
+        patched_deps.tracker_class.assert_not_called()
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
-    @patch('neo4j_orchestration.orchestration.orchestrator.PatternEnhancedClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
     def test_query_with_pattern_learning_enabled(
         self,
-        mock_gen_class,
-        mock_enhanced_clf_class,
-        mock_tracker_class,
-        mock_memory_class,
-        mock_executor_with_driver,
-        mock_intent
+        patched_deps,
+        mock_executor_with_driver
     ):
         """Test query execution with pattern learning enabled."""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory_class.return_value = mock_memory
-        
-        from unittest.mock import AsyncMock
-        
-        mock_tracker = Mock()
-        mock_tracker.record_query_preference = AsyncMock(return_value=None)
-        mock_tracker_class.return_value = mock_tracker
-        
-        mock_classifier = Mock()
-        mock_classifier.classify = AsyncMock(return_value=mock_intent)
-        mock_enhanced_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
             enable_pattern_learning=True
@@ -428,29 +471,53 @@ class TestPatternLearning:
         assert result is not None
         assert len(result.records) == 2
         
-        # Verify preference recording was called
-        # Note: asyncio.run will have executed it
-        assert mock_tracker.record_query_preference.called
+        # Verify preference recording ran on the background loop
+        assert patched_deps.tracker.record_query_preference.called
+    
+    def test_preferences_current_when_query_returns(self, mock_executor_with_driver):
+        """Test tracker stats reflect a query as soon as query() returns."""
+        pattern_memory = Mock()
+        pattern_memory.record_pattern = AsyncMock()
+        pattern_memory.get_common_filters = AsyncMock(return_value={})
+        
+        orchestrator = QueryOrchestrator(
+            mock_executor_with_driver,
+            enable_pattern_learning=True,
+            pattern_memory=pattern_memory
+        )
+        orchestrator.query("Show all vendors")
+        
+        assert orchestrator.get_preferred_entities() == [EntityType.VENDOR]
+        pattern_memory.record_pattern.assert_awaited_once()
+    
+    def test_query_from_running_event_loop(self, mock_executor_with_driver):
+        """Test pattern learning works when query() runs inside a loop."""
+        pattern_memory = Mock()
+        pattern_memory.record_pattern = AsyncMock()
+        pattern_memory.get_common_filters = AsyncMock(return_value={})
+        pattern_memory.aclose = AsyncMock()
+        
+        orchestrator = QueryOrchestrator(
+            mock_executor_with_driver,
+            enable_pattern_learning=True,
+            pattern_memory=pattern_memory
+        )
+        
+        async def run_query():
+            return orchestrator.query("Show all vendors")
+        
+        result = asyncio.run(run_query())
+        orchestrator.close()
+        
+        assert len(result.records) == 2
+        pattern_memory.record_pattern.assert_awaited_once()
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
     def test_query_without_pattern_learning(
         self,
-        mock_gen_class,
-        mock_clf_class,
-        mock_executor_with_driver,
-        mock_intent
+        patched_deps,
+        mock_executor_with_driver
     ):
         """Test query execution without pattern learning."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
             enable_pattern_learning=False
@@ -473,26 +540,17 @@ class TestPatternLearning:
         
         assert stats == {"enabled": False}
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
     def test_get_pattern_stats_enabled(
         self,
-        mock_tracker_class,
-        mock_memory_class,
+        patched_deps,
         mock_executor_with_driver
     ):
         """Test get_pattern_stats when pattern learning is enabled."""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory_class.return_value = mock_memory
-        
-        mock_tracker = Mock()
-        mock_tracker.get_session_stats.return_value = {
+        patched_deps.tracker.get_session_stats.return_value = {
             "queries_recorded": 5,
             "unique_entities": 2,
             "unique_filter_patterns": 3
         }
-        mock_tracker_class.return_value = mock_tracker
         
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
@@ -517,26 +575,17 @@ class TestPatternLearning:
         
         assert entities == []
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
     def test_get_preferred_entities_enabled(
         self,
-        mock_tracker_class,
-        mock_memory_class,
+        patched_deps,
         mock_executor_with_driver
     ):
         """Test get_preferred_entities when pattern learning is enabled."""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory_class.return_value = mock_memory
-        
-        mock_tracker = Mock()
-        mock_tracker.get_preferred_entities.return_value = [
+        patched_deps.tracker.get_preferred_entities.return_value = [
             EntityType.VENDOR,
             EntityType.CONTROL,
             EntityType.RISK
         ]
-        mock_tracker_class.return_value = mock_tracker
         
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
@@ -551,38 +600,15 @@ class TestPatternLearning:
         assert EntityType.RISK in entities
         
         # Verify tracker was called with correct limit
-        mock_tracker.get_preferred_entities.assert_called_once_with(limit=3)
+        patched_deps.tracker.get_preferred_entities.assert_called_once_with(limit=3)
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryPatternMemory')
-    @patch('neo4j_orchestration.orchestration.orchestrator.UserPreferenceTracker')
-    @patch('neo4j_orchestration.orchestration.orchestrator.PatternEnhancedClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
     def test_pattern_learning_with_failed_query(
         self,
-        mock_gen_class,
-        mock_enhanced_clf_class,
-        mock_tracker_class,
-        mock_memory_class,
-        mock_executor_with_driver,
-        mock_intent
+        patched_deps,
+        mock_executor_with_driver
     ):
         """Test that pattern learning handles failed queries gracefully."""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory_class.return_value = mock_memory
-        
-        mock_tracker = Mock()
-        mock_tracker.record_query_preference = Mock()
-        mock_tracker_class.return_value = mock_tracker
-        
-        mock_classifier = Mock()
-        mock_classifier.classify = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_enhanced_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.side_effect = Exception("Generation failed")
-        mock_gen_class.return_value = mock_generator
+        patched_deps.generator.generate.side_effect = Exception("Generation failed")
         
         orchestrator = QueryOrchestrator(
             mock_executor_with_driver,
@@ -594,27 +620,14 @@ class TestPatternLearning:
             orchestrator.query("Bad query")
         
         # Preference recording should NOT be called for failed queries
-        mock_tracker.record_query_preference.assert_not_called()
+        patched_deps.tracker.record_query_preference.assert_not_called()
     
-    @patch('neo4j_orchestration.orchestration.orchestrator.QueryIntentClassifier')
-    @patch('neo4j_orchestration.orchestration.orchestrator.CypherQueryGenerator')
     def test_backward_compatibility(
         self,
-        mock_gen_class,
-        mock_clf_class,
-        mock_executor_with_driver,
-        mock_intent
+        patched_deps,
+        mock_executor_with_driver
     ):
         """Test that existing code without pattern learning still works."""
-        # Setup mocks
-        mock_classifier = Mock()
-        mock_classifier.classify.return_value = mock_intent
-        mock_clf_class.return_value = mock_classifier
-        
-        mock_generator = Mock()
-        mock_generator.generate.return_value = ("MATCH (v:Vendor) RETURN v", {})
-        mock_gen_class.return_value = mock_generator
-        
         # Old-style initialization (no pattern learning parameters)
         orchestrator = QueryOrchestrator(mock_executor_with_driver)
         
@@ -227,3 +227,51 @@ def test_get_session_stats_with_data(preference_tracker):
     assert stats["unique_entities"] == 2
     assert stats["most_used_entity"] == "Vendor"  # EntityType.VENDOR.value is "Vendor"
     assert QueryType.VENDOR_LIST in stats["query_types_tracked"]
+
+
+@pytest.mark.asyncio
+async def test_batched_preferences_flush_at_batch_size(
+    mock_pattern_memory,
+    sample_intent,
+    sample_result
+):
+    """Test buffered recordings are written as one batch."""
+    tracker = UserPreferenceTracker(
+        pattern_memory=mock_pattern_memory,
+        session_id="test-session-123",
+        batch_size=3
+    )
+    
+    for _ in range(2):
+        await tracker.record_query_preference(sample_intent, sample_result)
+    assert not mock_pattern_memory.record_patterns_batch.called
+    
+    await tracker.record_query_preference(sample_intent, sample_result)
+    
+    mock_pattern_memory.record_patterns_batch.assert_awaited_once()
+    batch = mock_pattern_memory.record_patterns_batch.call_args.args[0]
+    assert len(batch) == 3
+    assert batch[0]["filters"] == {"tier": "Critical"}
+    assert not mock_pattern_memory.record_pattern.called
+    assert tracker._pending == []
+
+
+@pytest.mark.asyncio
+async def test_get_preferred_filters_keeps_pending_buffered(
+    mock_pattern_memory,
+    sample_intent,
+    sample_result
+):
+    """Test reads do not force a write of buffered recordings."""
+    tracker = UserPreferenceTracker(
+        pattern_memory=mock_pattern_memory,
+        session_id="test-session-123",
+        batch_size=10
+    )
+    await tracker.record_query_preference(sample_intent, sample_result)
+    
+    await tracker.get_preferred_filters(QueryType.VENDOR_LIST)
+    
+    assert not mock_pattern_memory.record_patterns_batch.called
+    assert len(tracker._pending) == 1
+    mock_pattern_memory.get_common_filters.assert_awaited_once()
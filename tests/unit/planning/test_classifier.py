@@ -375,6 +375,25 @@ class TestQueryIntentClassifier:
         )
         assert risk_filter is not None
         assert risk_filter.value == "Low"
+    
+    def test_compiled_patterns_shared_between_instances(self, classifier):
+        """Test pattern tables are compiled once and reused."""
+        other = QueryIntentClassifier()
+        
+        assert other._query_patterns is classifier._query_patterns
+        assert other._entity_patterns is classifier._entity_patterns
+    
+    def test_classify_cached_on_normalized_text(self, classifier):
+        """Test repeated queries hit the cache but return independent intents."""
+        first = classifier.classify("Show me all vendors")
+        second = classifier.classify("  show me ALL vendors ")
+        
+        assert classifier._classify_cached.cache_info().hits == 1
+        assert second.query_type == first.query_type
+        assert second.metadata["original_query"] == "  show me ALL vendors "
+        
+        first.add_filter("status", FilterOperator.EQUALS, "active")
+        assert not classifier.classify("show me all vendors").has_filters()
 
 
 class TestGenericOperationPatterns:
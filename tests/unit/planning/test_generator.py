@@ -6,6 +6,7 @@ import pytest
 from neo4j_orchestration.planning import (
     CypherQueryGenerator,
     generate_cypher,
+    get_default_generator,
     QueryIntent,
     QueryType,
     EntityType,
@@ -51,8 +52,8 @@ class TestCypherQueryGenerator:
         
         query, params = generator.generate(intent)
         
-        assert "MATCH (v:Vendor)" in query
-        assert "WHERE v.riskLevel = $riskLevel" in query
+        assert "MATCH (v:Vendor {riskLevel: $riskLevel})" in query
+        assert "WHERE" not in query
         assert "RETURN v" in query
         assert params == {"riskLevel": "Critical"}
     
@@ -68,7 +69,7 @@ class TestCypherQueryGenerator:
         
         query, params = generator.generate(intent)
         
-        assert "WHERE v.status = $status" in query
+        assert "MATCH (v:Vendor {status: $status})" in query
         assert params == {"status": "Active"}
     
     # Filter operator tests
@@ -142,11 +143,72 @@ class TestCypherQueryGenerator:
         
         query, params = generator.generate(intent)
         
-        assert "v.riskLevel = $riskLevel" in query
-        assert "v.status = $status" in query
-        assert "AND" in query
+        assert "MATCH (v:Vendor {riskLevel: $riskLevel, status: $status})" in query
+        assert "WHERE" not in query
         assert params == {"riskLevel": "High", "status": "Active"}
-    
+
+    def test_repeated_filter_field_keeps_both_values(self, generator):
+        """Test range filters on the same field get distinct parameters."""
+        intent = QueryIntent(
+            query_type=QueryType.VENDOR_LIST,
+            entities=[EntityType.VENDOR],
+            filters=[
+                FilterCondition("riskScore", FilterOperator.GREATER_THAN, 50),
+                FilterCondition("riskScore", FilterOperator.LESS_THAN, 90),
+            ]
+        )
+
+        query, params = generator.generate(intent)
+
+        assert "v.riskScore > $riskScore" in query
+        assert "v.riskScore < $riskScore_2" in query
+        assert params == {"riskScore": 50, "riskScore_2": 90}
+
+    def test_cheap_predicates_emitted_first(self, generator):
+        """Test cheap predicates precede string-match filters."""
+        intent = QueryIntent(
+            query_type=QueryType.VENDOR_LIST,
+            entities=[EntityType.VENDOR],
+            filters=[
+                FilterCondition("name", FilterOperator.CONTAINS, "Tech"),
+                FilterCondition("status", FilterOperator.EQUALS, "Active"),
+            ]
+        )
+
+        query, _ = generator.generate(intent)
+
+        assert "MATCH (v:Vendor {status: $status})" in query
+        assert "WHERE v.name CONTAINS $name" in query
+
+    def test_repeated_equality_field_inlined_once(self, generator):
+        """Test only the first equality per field goes into the node pattern."""
+        intent = QueryIntent(
+            query_type=QueryType.VENDOR_LIST,
+            entities=[EntityType.VENDOR],
+            filters=[
+                FilterCondition("status", FilterOperator.EQUALS, "Active"),
+                FilterCondition("status", FilterOperator.EQUALS, "Pending"),
+            ]
+        )
+
+        query, params = generator.generate(intent)
+
+        assert "MATCH (v:Vendor {status: $status})" in query
+        assert "WHERE v.status = $status_2" in query
+        assert params == {"status": "Active", "status_2": "Pending"}
+
+    def test_projection_returns_selected_properties(self, generator):
+        """Test projection emits property columns instead of whole nodes."""
+        intent = QueryIntent(
+            query_type=QueryType.VENDOR_LIST,
+            entities=[EntityType.VENDOR],
+            projection=["id", "name"]
+        )
+
+        query, _ = generator.generate(intent)
+
+        assert "RETURN v.id, v.name" in query
+
     # Aggregation tests
     
     def test_count_aggregation(self, generator):
@@ -250,8 +312,7 @@ class TestCypherQueryGenerator:
         
         query, params = generator.generate(intent)
         
-        assert "MATCH (v:Vendor)" in query
-        assert "WHERE v.riskLevel = $riskLevel AND v.status = $status" in query
+        assert "MATCH (v:Vendor {riskLevel: $riskLevel, status: $status})" in query
         assert "RETURN v" in query
         assert "ORDER BY v.name ASC" in query
         assert "LIMIT 5" in query
@@ -301,6 +362,52 @@ class TestCypherQueryGenerator:
         with pytest.raises(ValueError, match="must have at least one entity"):
             generator.generate(intent)
     
+    def test_generate_many_preserves_order(self, generator):
+        """Test batch generation matches per-intent generation."""
+        intents = [
+            QueryIntent(query_type=QueryType.VENDOR_LIST, entities=[EntityType.VENDOR]),
+            QueryIntent(
+                query_type=QueryType.VENDOR_RISK,
+                entities=[EntityType.VENDOR],
+                filters=[FilterCondition("riskLevel", FilterOperator.EQUALS, "High")]
+            ),
+            QueryIntent(query_type=QueryType.VENDOR_LIST, entities=[EntityType.VENDOR]),
+        ]
+        
+        results = generator.generate_many(intents)
+        
+        assert [q for q, _ in results] == [generator.generate(i)[0] for i in intents]
+        assert results[1][1] == {"riskLevel": "High"}
+        assert results[0][1] == {}
+        
+        # Parameter dicts are independent and writable, as from generate()
+        results[0][1]["extra"] = 1
+        assert results[2][1] == {}
+    
+    def test_same_shape_reuses_cached_query(self, generator):
+        """Test intents differing only in filter values share one rendering."""
+        def risk_intent(level):
+            return QueryIntent(
+                query_type=QueryType.VENDOR_RISK,
+                entities=[EntityType.VENDOR],
+                filters=[
+                    FilterCondition("name", FilterOperator.CONTAINS, "Tech"),
+                    FilterCondition("riskLevel", FilterOperator.EQUALS, level),
+                ]
+            )
+        
+        query_high, params_high = generator.generate(risk_intent("High"))
+        query_low, params_low = generator.generate(risk_intent("Low"))
+        
+        assert query_high is query_low
+        assert params_high == {"riskLevel": "High", "name": "Tech"}
+        assert params_low == {"riskLevel": "Low", "name": "Tech"}
+        assert len(generator._query_cache) == 1
+    
+    def test_default_generator_is_shared(self):
+        """Test get_default_generator returns one process-wide instance."""
+        assert get_default_generator() is get_default_generator()
+    
     # Convenience function test
     
     def test_generate_cypher_convenience_function(self):
@@ -347,8 +454,7 @@ class TestGenericOperationGeneration:
         
         query, params = generator.generate(intent)
         
-        assert "MATCH" in query and "Risk" in query
-        assert "WHERE" in query
+        assert "MATCH (r:Risk {severity: $severity})" in query
         assert "RETURN" in query
     
     def test_generic_details_query(self, generator):
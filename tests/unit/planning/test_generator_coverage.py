@@ -189,7 +189,7 @@ class TestGeneratorCoverage:
         # This would normally be caught by enum validation
         # Just verify the error handling exists
         filter_cond = FilterCondition("field", FilterOperator.EQUALS, "value")
-        filter_cond.operator = "INVALID_OPERATOR"  # Force invalid
+        object.__setattr__(filter_cond, "operator", "INVALID_OPERATOR")  # Force invalid
         
         with pytest.raises((ValueError, AttributeError)):
             generator._build_filter_condition("v", filter_cond)
@@ -244,5 +244,5 @@ class TestIntegrationScenarios:
         
         query, params = generator.generate(intent)
         
-        assert "WHERE v.status = $status AND v.riskLevel = $riskLevel" in query
+        assert "MATCH (v:Vendor {status: $status, riskLevel: $riskLevel})" in query
         assert params == {"status": "Active", "riskLevel": "High"}
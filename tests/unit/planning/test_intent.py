@@ -2,6 +2,8 @@
 Tests for Query Intent Data Structures
 """
 
+import dataclasses
+
 import pytest
 from neo4j_orchestration.planning.intent import (
     QueryType,
@@ -51,6 +53,28 @@ class TestFilterCondition:
         
         assert filter_cond.operator == FilterOperator.EQUALS
     
+    def test_fast_constructor_matches_validated(self):
+        """Test _fast builds an equal filter without __post_init__."""
+        fast = FilterCondition._fast("status", FilterOperator.EQUALS, "Active")
+
+        assert fast == FilterCondition("status", FilterOperator.EQUALS, "Active")
+
+    def test_filter_condition_uses_slots(self):
+        """Test filter conditions carry no per-instance __dict__."""
+        filter_cond = FilterCondition("status", FilterOperator.EQUALS, "Active")
+
+        assert not hasattr(filter_cond, "__dict__")
+
+    def test_filter_condition_is_frozen_and_hashable(self):
+        """Test filter conditions are immutable value objects."""
+        a = FilterCondition("status", FilterOperator.EQUALS, "Active")
+        b = FilterCondition("status", "=", "Active")
+
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            a.value = "Inactive"
+
     def test_filter_condition_empty_field(self):
         """Test filter condition with empty field."""
         with pytest.raises(ValueError, match="field cannot be empty"):
@@ -290,7 +314,24 @@ class TestQueryIntent:
         assert result["filters"][0]["field"] == "riskLevel"
         assert len(result["aggregations"]) == 1
         assert result["confidence"] == 0.95
-    
+
+    def test_to_dict_reflects_field_assignment(self):
+        """Test to_dict picks up fields assigned after an earlier call."""
+        intent = QueryIntent(
+            query_type=QueryType.UNKNOWN,
+            entities=[EntityType.VENDOR]
+        )
+        intent.to_dict()
+
+        intent.query_type = QueryType.LIST
+        intent.entities = [EntityType.CONTROL]
+        intent.add_filter("status", FilterOperator.EQUALS, "Active")
+        result = intent.to_dict()
+
+        assert result["query_type"] == "list"
+        assert result["entities"] == ["Control"]
+        assert result["filters"][0]["operator"] == "="
+
     def test_intent_with_metadata(self):
         """Test intent with metadata."""
         intent = QueryIntent(
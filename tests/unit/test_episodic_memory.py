@@ -363,3 +363,27 @@ async def test_get_session_chain(episodic_memory, mock_driver, mock_session):
     assert chain[0].key == "sess_001"
     assert chain[1].key == "sess_002"
     assert chain[2].key == "sess_003"
+
+
+def test_simple_memory_retrieve_recent_order():
+    """Test SimpleEpisodicMemory returns newest events first, filtered."""
+    from neo4j_orchestration.memory.episodic import Event, SimpleEpisodicMemory
+    
+    base = datetime(2024, 1, 1)
+    memory = SimpleEpisodicMemory()
+    memory.store_many(
+        Event(
+            event_id=f"e{i}",
+            event_type="query_executed" if i % 2 else "other",
+            content={},
+            timestamp=base + timedelta(minutes=i),
+        )
+        for i in (3, 0, 5, 1, 4, 2)
+    )
+    
+    recent = memory.retrieve_recent(event_type="query_executed", limit=2)
+    
+    assert [e.event_id for e in recent] == ["e5", "e3"]
+    assert [e.event_id for e in memory.retrieve_recent(limit=10)] == [
+        "e5", "e4", "e3", "e2", "e1", "e0"
+    ]
@@ -0,0 +1,59 @@
+"""
+Unit tests for Cypher utilities.
+"""
+
+import pytest
+
+from neo4j_orchestration.planning.intent import EntityType
+from neo4j_orchestration.utils import cypher
+from neo4j_orchestration.utils.cypher import TEMPLATES, get_template
+
+
+def test_entity_labels_match_entity_types():
+    """Test the prebuilt label list covers exactly the EntityType values."""
+    assert set(cypher._ENTITY_LABELS) == {e.value for e in EntityType}
+
+
+@pytest.mark.parametrize("template_name", sorted(TEMPLATES))
+@pytest.mark.parametrize("label", [e.value for e in EntityType] + ["Custom"])
+def test_get_template_matches_str_format(template_name, label):
+    """Test prebuilt, cached and rendered output all equal str.format."""
+    kwargs = {"label": label, "property": "status"}
+    expected = TEMPLATES[template_name].format(**kwargs)
+
+    assert get_template(template_name, **kwargs) == expected
+    # Second call is served from the cache
+    assert get_template(template_name, **kwargs) == expected
+
+
+@pytest.mark.parametrize("label", [e.value for e in EntityType])
+def test_get_template_label_only_uses_prebuilt(label):
+    """Test label-only templates come from the prebuilt table."""
+    result = get_template("get_entity_by_id", label=label)
+
+    assert result is cypher._PREBUILT[("get_entity_by_id", label)]
+    assert result == TEMPLATES["get_entity_by_id"].format(label=label)
+
+
+def test_get_template_unknown_template():
+    """Test unknown template names raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown template: missing"):
+        get_template("missing", label="Vendor")
+
+
+def test_get_template_missing_param():
+    """Test missing template variables raise KeyError like str.format."""
+    with pytest.raises(KeyError, match="property"):
+        get_template("count_by_property", label="Vendor")
+
+    with pytest.raises(KeyError, match="label"):
+        get_template("get_entity_by_id")
+
+
+def test_get_template_unhashable_param():
+    """Test unhashable template variables bypass the cache."""
+    label = ["Vendor"]
+
+    result = get_template("get_entity_by_id", label=label)
+
+    assert result == TEMPLATES["get_entity_by_id"].format(label=label)
@@ -0,0 +1,33 @@
+"""
+Unit tests for the slotted dataclass helper.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from neo4j_orchestration.execution.result import QueryResult
+from neo4j_orchestration.orchestration.history import QueryRecord
+from neo4j_orchestration.planning.intent import (
+    FilterCondition,
+    FilterOperator,
+    QueryIntent,
+)
+
+
+@pytest.mark.parametrize("cls", [FilterCondition, QueryIntent, QueryRecord, QueryResult])
+def test_hot_dataclasses_are_slotted(cls):
+    """Test instances carry no per-instance __dict__."""
+    assert "__dict__" not in cls.__dict__
+    assert cls.__qualname__ == cls.__name__
+
+
+def test_frozen_slotted_dataclass_copies_and_pickles():
+    """Test frozen slotted instances survive copy and pickle round trips."""
+    condition = FilterCondition(field="status", operator=FilterOperator.EQUALS, value="active")
+
+    assert copy.deepcopy(condition) == condition
+    assert pickle.loads(pickle.dumps(condition)) == condition
+    with pytest.raises(AttributeError):
+        condition.value = "inactive"